@@ -29,8 +29,8 @@ from media_manager.torrent.models import Torrent  # noqa: E402
 from media_manager.tv.models import Show, Season, Episode, SeasonFile, SeasonRequest  # noqa: E402
 from media_manager.movies.models import Movie, MovieFile, MovieRequest  # noqa: E402
 from media_manager.notification.models import Notification  # noqa: E402
-from media_manager.database import Base  # noqa: E402
-from media_manager.config import AllEncompassingConfig  # noqa: E402
+from media_manager.jobs.models import JobRun  # noqa: E402
+from media_manager.database import Base, db_url, get_connect_args  # noqa: E402
 
 target_metadata = Base.metadata
 
@@ -50,6 +50,7 @@ target_metadata = Base.metadata
     MovieFile,
     MovieRequest,
     Notification,
+    JobRun,
 )
 
 
@@ -59,21 +60,6 @@ target_metadata = Base.metadata
 # ... etc.
 
 
-db_config = AllEncompassingConfig().database
-db_url = (
-    "postgresql+psycopg"
-    + "://"
-    + db_config.user
-    + ":"
-    + db_config.password
-    + "@"
-    + db_config.host
-    + ":"
-    + str(db_config.port)
-    + "/"
-    + db_config.dbname
-)
-
 config.set_main_option("sqlalchemy.url", db_url)
 
 
@@ -118,6 +104,7 @@ def run_migrations_online() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=get_connect_args(),
     )
 
     with connectable.connect() as connection:
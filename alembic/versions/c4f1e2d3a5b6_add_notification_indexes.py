@@ -0,0 +1,42 @@
+"""add indexes for notification pagination and unread count
+
+Revision ID: c4f1e2d3a5b6
+Revises: 5299dfed220b
+Create Date: 2026-10-19 10:12:41.204518
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f1e2d3a5b6"
+down_revision: Union[str, None] = "5299dfed220b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_notification_timestamp_id",
+        "notification",
+        ["timestamp", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_notification_unread_timestamp_id",
+        "notification",
+        ["timestamp", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT read"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_notification_unread_timestamp_id", table_name="notification")
+    op.drop_index("ix_notification_timestamp_id", table_name="notification")
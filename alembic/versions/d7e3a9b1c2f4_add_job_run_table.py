@@ -0,0 +1,51 @@
+"""add job_run table for the run history of scheduled jobs
+
+Revision ID: d7e3a9b1c2f4
+Revises: c4f1e2d3a5b6
+Create Date: 2026-10-19 14:37:02.511093
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e3a9b1c2f4"
+down_revision: Union[str, None] = "c4f1e2d3a5b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "job_run",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("duration", sa.Float(), nullable=True),
+        sa.Column(
+            "outcome",
+            sa.Enum("running", "success", "failed", "skipped", name="jobrunoutcome"),
+            nullable=False,
+        ),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_job_run_job_id_started_at",
+        "job_run",
+        ["job_id", "started_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_job_run_job_id_started_at", table_name="job_run")
+    op.drop_table("job_run")
+    sa.Enum(name="jobrunoutcome").drop(op.get_bind(), checkfirst=True)
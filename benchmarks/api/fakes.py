@@ -0,0 +1,116 @@
+"""
+Local stand-ins for the services MediaManager talks to, so the load test measures MediaManager and not the network:
+the metadata relay (TMDB), Prowlarr and SABnzbd.
+"""
+
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.indexer.payloads import make_prowlarr_payload
+
+# a route gets the query parameters and returns the JSON body of the response
+Route = Callable[[dict[str, str]], object]
+
+
+class FakeServiceHandler(BaseHTTPRequestHandler):
+    server: "FakeService"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        route = self.server.routes.get(url.path)
+        if route is None:
+            self.send_error(404)
+            return
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        body = route(params)
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class FakeService(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, routes: dict[str, Route]):
+        super().__init__(("127.0.0.1", 0), FakeServiceHandler)
+        self.routes = routes
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "FakeService":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def tmdb_search_page(params: dict[str, str]) -> dict:
+    # only the first page has results, so a search costs MediaManager two requests to the relay
+    if params.get("page", "1") != "1":
+        return {"page": int(params["page"]), "results": []}
+    rng = random.Random(params.get("query"))
+    return {
+        "page": 1,
+        "results": [
+            {
+                "id": rng.randint(1, 10_000_000),
+                "name": f"{params.get('query', '')} {i}",
+                "overview": "A show returned by the fake metadata relay. " * 4,
+                "first_air_date": f"{rng.randint(1990, 2025)}-01-01",
+                "poster_path": None,
+                "vote_average": rng.random() * 10,
+            }
+            for i in range(20)
+        ],
+    }
+
+
+def create_metadata_relay() -> FakeService:
+    return FakeService(
+        routes={
+            "/tmdb/tv/search": tmdb_search_page,
+            "/tmdb/tv/trending": lambda params: tmdb_search_page({"query": "trending"}),
+        }
+    )
+
+
+def create_prowlarr(results: int) -> FakeService:
+    payload = make_prowlarr_payload(results)
+    return FakeService(routes={"/api/v1/search": lambda params: payload})
+
+
+def sabnzbd_api(params: dict[str, str]) -> dict:
+    match params.get("mode"):
+        case "version":
+            return {"version": "4.5.0"}
+        case "addurl":
+            return {
+                "status": True,
+                "nzo_ids": [f"SABnzbd_nzo_{random.getrandbits(32):x}"],
+            }
+        case "queue":
+            return {"queue": {"status": "Downloading", "slots": []}}
+        case _:
+            return {"status": True}
+
+
+def create_sabnzbd() -> FakeService:
+    return FakeService(routes={"/api": sabnzbd_api})
@@ -0,0 +1,337 @@
+"""
+Drives the main API endpoints with concurrent requests and reports their latency and throughput.
+
+Seed the database first (python -m benchmarks.api.seed), then run from the repository root:
+
+    python -m benchmarks.api.load --concurrency 16 --duration 30 --output report.json
+
+MediaManager is started with uvicorn against the configured database, with Prowlarr, SABnzbd and the metadata relay
+replaced by local fakes. Pass --base-url to load test an instance that is already running instead.
+Pass a previous report as --baseline to fail if an endpoint got slower.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Callable, Iterator
+
+import httpx
+
+from benchmarks.api.fakes import create_metadata_relay, create_prowlarr, create_sabnzbd
+
+API_PREFIX = "/api/v1"
+ADMIN_EMAIL = "admin@mediamanager.local"
+ADMIN_PASSWORD = "admin"
+SEARCH_QUERIES = ("breaking", "office", "dragon", "house", "wire", "crown", "lost")
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def run_media_manager(indexer_results: int) -> Iterator[str]:
+    """
+    Starts the fakes and MediaManager, and returns MediaManager's base URL.
+    """
+    relay = create_metadata_relay().start()
+    prowlarr = create_prowlarr(results=indexer_results).start()
+    sabnzbd = create_sabnzbd().start()
+    port = get_free_port()
+
+    with tempfile.TemporaryDirectory(prefix="mediamanager-load-") as directory:
+        env = os.environ | {
+            "INDEXERS__PROWLARR__ENABLED": "true",
+            "INDEXERS__PROWLARR__URL": prowlarr.url,
+            "INDEXERS__PROWLARR__API_KEY": "load-test",
+            "INDEXERS__JACKETT__ENABLED": "false",
+            "METADATA__TMDB__TMDB_RELAY_URL": f"{relay.url}/tmdb",
+            "TORRENTS__SABNZBD__ENABLED": "true",
+            "TORRENTS__SABNZBD__HOST": "http://127.0.0.1",
+            "TORRENTS__SABNZBD__PORT": str(sabnzbd.server_address[1]),
+            "TORRENTS__SABNZBD__API_KEY": "load-test",
+            "TORRENTS__QBITTORRENT__ENABLED": "false",
+            "TORRENTS__TRANSMISSION__ENABLED": "false",
+            "MISC__TV_DIRECTORY": f"{directory}/tv",
+            "MISC__MOVIE_DIRECTORY": f"{directory}/movies",
+            "MISC__TORRENT_DIRECTORY": f"{directory}/torrents",
+            "MISC__IMAGE_DIRECTORY": f"{directory}/images",
+            "MISC__LOG_LEVEL": "WARNING",
+            "FRONTEND_FILES_DIR": os.environ.get("FRONTEND_FILES_DIR", directory),
+        }
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "media_manager.main:app",
+                "--host",
+                "127.0.0.1",
+                "--port",
+                str(port),
+                "--no-access-log",
+            ],
+            env=env,
+        )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            wait_until_healthy(base_url, server)
+            yield base_url
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+            for fake in (relay, prowlarr, sabnzbd):
+                fake.stop()
+
+
+def wait_until_healthy(
+    base_url: str, server: subprocess.Popen, timeout: float = 120
+) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"MediaManager exited with code {server.returncode}")
+        try:
+            if httpx.get(f"{base_url}{API_PREFIX}/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.5)
+    raise TimeoutError(f"MediaManager did not become healthy within {timeout} s")
+
+
+def log_in(base_url: str, email: str, password: str) -> dict[str, str]:
+    response = httpx.post(
+        f"{base_url}{API_PREFIX}/auth/jwt/login",
+        data={"username": email, "password": password},
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def get_show_ids(base_url: str, headers: dict[str, str], pages: int = 10) -> list[str]:
+    show_ids = []
+    for page in range(pages):
+        response = httpx.get(
+            f"{base_url}{API_PREFIX}/tv/shows",
+            params={"limit": 500, "offset": page * 500},
+            headers=headers,
+            timeout=60,
+        )
+        response.raise_for_status()
+        items = response.json()["items"]
+        show_ids.extend(item["id"] for item in items)
+        if len(items) < 500:
+            break
+    if not show_ids:
+        raise RuntimeError("There are no shows, seed the database first")
+    return show_ids
+
+
+def get_scenarios(show_ids: list[str], shows: int) -> dict[str, Callable[[], str]]:
+    """
+    Returns the name of every scenario and a function that returns the path of its next request.
+    """
+    return {
+        "GET /tv/shows": lambda: (
+            f"/tv/shows?limit=100&offset={random.randrange(0, max(shows, 1), 100)}"
+        ),
+        "GET /tv/shows/{show_id}": lambda: f"/tv/shows/{random.choice(show_ids)}",
+        "GET /tv/shows/torrents": lambda: "/tv/shows/torrents",
+        "GET /torrent": lambda: "/torrent",
+        "GET /notification": lambda: "/notification?limit=50",
+        "GET /notification/unread": lambda: "/notification/unread?limit=50",
+        "GET /tv/search": lambda: f"/tv/search?query={random.choice(SEARCH_QUERIES)}",
+        "GET /tv/torrents": lambda: (
+            f"/tv/torrents?show_id={random.choice(show_ids)}&season_number=1"
+        ),
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    next_path: Callable[[], str],
+    concurrency: int,
+    duration: float,
+) -> tuple[list[float], int, float]:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                response = await client.get(f"{API_PREFIX}{next_path()}")
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            if failed:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict[str, float]:
+    # quantiles needs at least two samples
+    samples = latencies if len(latencies) >= 2 else (latencies or [float("nan")]) * 2
+    percentiles = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / elapsed,
+        "p50": percentiles[49],
+        "p90": percentiles[89],
+        "p99": percentiles[98],
+        "max": max(samples),
+    }
+
+
+async def run_load_test(
+    base_url: str,
+    headers: dict[str, str],
+    scenarios: dict[str, Callable[[], str]],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+) -> dict[str, dict[str, float]]:
+    report = {}
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=120,
+        limits=httpx.Limits(max_connections=concurrency),
+    ) as client:
+        for name, next_path in scenarios.items():
+            if warmup:
+                await run_scenario(client, next_path, concurrency, warmup)
+            report[name] = summarize(
+                *await run_scenario(client, next_path, concurrency, duration)
+            )
+            print_result(name, report[name])
+    return report
+
+
+def print_result(name: str, result: dict[str, float]) -> None:
+    print(
+        f"{name:<26} {result['requests']:>7} req {result['errors']:>5} err "
+        f"{result['throughput']:>8.1f} req/s   p50 {result['p50'] * 1000:>8.1f} ms   "
+        f"p90 {result['p90'] * 1000:>8.1f} ms   p99 {result['p99'] * 1000:>8.1f} ms   "
+        f"max {result['max'] * 1000:>8.1f} ms"
+    )
+
+
+def compare(
+    report: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """
+    Returns a description of every scenario whose p99 latency or throughput is worse than the baseline's by more
+    than the tolerance.
+    """
+    regressions = []
+    for name, result in report.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if result["p99"] > before["p99"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 {before['p99'] * 1000:.1f} ms -> {result['p99'] * 1000:.1f} ms"
+            )
+        if result["throughput"] < before["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {before['throughput']:.1f} -> {result['throughput']:.1f} req/s"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--base-url", help="load test this instance instead of starting one"
+    )
+    parser.add_argument("--email", default=ADMIN_EMAIL)
+    parser.add_argument("--password", default=ADMIN_PASSWORD)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--duration", type=float, default=30, help="seconds per endpoint"
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=3, help="seconds per endpoint before measuring"
+    )
+    parser.add_argument(
+        "--indexer-results",
+        type=int,
+        default=500,
+        help="results the fake Prowlarr returns per search",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="only run these scenarios, e.g. 'GET /torrent', can be repeated",
+    )
+    parser.add_argument("--output", type=Path, help="write the report to this file")
+    parser.add_argument(
+        "--baseline", type=Path, help="compare with the report of a previous run"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="fraction by which an endpoint may be worse than the baseline",
+    )
+    args = parser.parse_args()
+
+    with (
+        run_media_manager(indexer_results=args.indexer_results)
+        if args.base_url is None
+        else nullcontext(args.base_url.rstrip("/"))
+    ) as base_url:
+        headers = log_in(base_url, email=args.email, password=args.password)
+        show_ids = get_show_ids(base_url, headers)
+        scenarios = get_scenarios(show_ids, shows=len(show_ids))
+        if args.scenario:
+            scenarios = {name: scenarios[name] for name in args.scenario}
+        report = asyncio.run(
+            run_load_test(
+                base_url,
+                headers=headers,
+                scenarios=scenarios,
+                concurrency=args.concurrency,
+                duration=args.duration,
+                warmup=args.warmup,
+            )
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.baseline:
+        regressions = compare(
+            report, json.loads(args.baseline.read_text()), tolerance=args.tolerance
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Seeds the configured database with a large synthetic library for the API load test.
+
+Run from the repository root against an empty database, or pass --reset to delete the existing library first:
+
+    python -m benchmarks.api.seed --reset
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator
+
+from sqlalchemy import delete, insert
+
+from media_manager.database import SessionLocal, init_db
+from media_manager.indexer.models import IndexerQueryResult
+from media_manager.movies import models as movie_models  # noqa: F401, registers the movie tables for init_db
+from media_manager.notification.models import Notification
+from media_manager.torrent.models import Torrent
+from media_manager.torrent.schemas import Quality, QualityStrings, TorrentStatus
+from media_manager.tv.models import Episode, Season, SeasonFile, Show
+
+BATCH_SIZE = 10_000
+
+
+def batched(rows: Iterable[dict], size: int = BATCH_SIZE) -> Iterator[list[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def insert_rows(model, rows: Iterable[dict]) -> int:
+    count = 0
+    with SessionLocal() as session:
+        for batch in batched(rows):
+            session.execute(insert(model), batch)
+            count += len(batch)
+        session.commit()
+    return count
+
+
+def reset() -> None:
+    with SessionLocal() as session:
+        for model in (
+            SeasonFile,
+            Episode,
+            Season,
+            Show,
+            Torrent,
+            IndexerQueryResult,
+            Notification,
+        ):
+            session.execute(delete(model))
+        session.commit()
+
+
+def seed(
+    shows: int,
+    episodes: int,
+    torrents: int,
+    indexer_results: int,
+    notifications: int,
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    seasons_per_show = 4
+    episodes_per_season = max(1, episodes // (shows * seasons_per_show))
+    qualities = list(Quality)
+
+    show_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(shows)]
+    season_ids = [
+        [uuid.UUID(int=rng.getrandbits(128)) for _ in range(seasons_per_show)]
+        for _ in range(shows)
+    ]
+    torrent_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(torrents)]
+
+    def show_rows():
+        for i, show_id in enumerate(show_ids):
+            yield {
+                "id": show_id,
+                "external_id": i,
+                "metadata_provider": "tmdb",
+                "name": f"Load Test Show {i:05d}",
+                "overview": "A show seeded for the load test. " * 8,
+                "year": 1990 + i % 35,
+                "ended": i % 3 == 0,
+                "continuous_download": i % 5 == 0,
+                "library": "",
+            }
+
+    def season_rows():
+        for i, ids in enumerate(season_ids):
+            for number, season_id in enumerate(ids, start=1):
+                yield {
+                    "id": season_id,
+                    "show_id": show_ids[i],
+                    "number": number,
+                    "external_id": i * 100 + number,
+                    "name": f"Season {number}",
+                    "overview": "A season seeded for the load test.",
+                }
+
+    def episode_rows():
+        for i, ids in enumerate(season_ids):
+            for season_number, season_id in enumerate(ids, start=1):
+                for number in range(1, episodes_per_season + 1):
+                    yield {
+                        "id": uuid.UUID(int=rng.getrandbits(128)),
+                        "season_id": season_id,
+                        "number": number,
+                        "external_id": (i * 100 + season_number) * 1000 + number,
+                        "title": f"Episode {number}",
+                    }
+
+    def torrent_rows():
+        for i, torrent_id in enumerate(torrent_ids):
+            yield {
+                "id": torrent_id,
+                "status": rng.choice(list(TorrentStatus)),
+                "title": f"Load Test Show {i % shows:05d} S01 1080p WEB-DL",
+                "quality": rng.choice(qualities),
+                "imported": rng.random() < 0.8,
+                "hash": f"{i:040x}",
+                "usenet": i % 4 == 0,
+            }
+
+    def season_file_rows():
+        # every torrent belongs to a season, the suffix keeps (season_id, file_path_suffix) unique
+        for i, torrent_id in enumerate(torrent_ids):
+            quality = rng.choice(qualities)
+            yield {
+                "season_id": season_ids[i % shows][i // shows % seasons_per_show],
+                "torrent_id": torrent_id,
+                "file_path_suffix": f"{QualityStrings[quality.name].value.upper()} {i}",
+                "quality": quality,
+            }
+
+    def indexer_result_rows():
+        for i in range(indexer_results):
+            quality = rng.choice(qualities)
+            yield {
+                "id": uuid.UUID(int=rng.getrandbits(128)),
+                "title": f"Load Test Show {i % shows:05d} S{rng.randint(1, seasons_per_show):02d} "
+                f"{QualityStrings[quality.name].value}",
+                "download_url": f"magnet:?xt=urn:btih:{i:040x}",
+                "seeders": rng.randint(0, 2000),
+                "flags": rng.sample(
+                    ["freeleech", "internal", "scene"], k=rng.randint(0, 2)
+                ),
+                "quality": quality,
+                "season": [rng.randint(1, seasons_per_show)],
+                "size": rng.randint(100_000_000, 50_000_000_000),
+                "usenet": i % 4 == 0,
+                "age": rng.randint(0, 1_000_000),
+                "score": rng.randint(-50, 50),
+            }
+
+    def notification_rows():
+        now = datetime.now()
+        for i in range(notifications):
+            yield {
+                "id": uuid.UUID(int=rng.getrandbits(128)),
+                "message": f"Load test notification {i}",
+                "read": rng.random() < 0.7,
+                "timestamp": now - timedelta(minutes=i),
+            }
+
+    for model, rows in (
+        (Show, show_rows()),
+        (Season, season_rows()),
+        (Episode, episode_rows()),
+        (Torrent, torrent_rows()),
+        (SeasonFile, season_file_rows()),
+        (IndexerQueryResult, indexer_result_rows()),
+        (Notification, notification_rows()),
+    ):
+        start = time.perf_counter()
+        count = insert_rows(model, rows)
+        print(
+            f"{model.__tablename__:<22} {count:>8} rows in {time.perf_counter() - start:6.1f} s"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shows", type=int, default=5_000)
+    parser.add_argument("--episodes", type=int, default=200_000)
+    parser.add_argument("--torrents", type=int, default=20_000)
+    parser.add_argument("--indexer-results", type=int, default=100_000)
+    parser.add_argument("--notifications", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--reset", action="store_true", help="delete the existing library first"
+    )
+    args = parser.parse_args()
+
+    init_db()
+    if args.reset:
+        reset()
+    seed(
+        shows=args.shows,
+        episodes=args.episodes,
+        torrents=args.torrents,
+        indexer_results=args.indexer_results,
+        notifications=args.notifications,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from benchmarks.indexer.payloads import (
+    FLAGS,
+    GROUPS,
+    SOURCES,
+    get_payload_ids,
+    load_payload,
+    make_prowlarr_results,
+)
+from media_manager.indexer.indexers.prowlarr import Prowlarr
+from media_manager.indexer.schemas import IndexerQueryResult
+
+PROWLARR_SEARCH_PATH = "/api/v1/search"
+JACKETT_SEARCH_PATH = "/api/v2.0/indexers/all/results/torznab/api"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Answers every request for a known path with the body that is currently registered for it.
+    """
+
+    server: "IndexerStandIn"
+
+    def do_GET(self) -> None:
+        response = self.server.responses.get(urlsplit(self.path).path)
+        if response is None:
+            self.send_error(404)
+            return
+        content_type, body = response
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class IndexerStandIn(ThreadingHTTPServer):
+    """
+    A local HTTP server in place of Prowlarr and Jackett, so searches are measured without the network.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.responses: dict[str, tuple[str, bytes]] = {}
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture(scope="session")
+def indexer_stand_in():
+    server = IndexerStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="session", params=get_payload_ids(".json"))
+def prowlarr_payload(request) -> bytes:
+    return load_payload(request.param, ".json")
+
+
+@pytest.fixture(scope="session", params=get_payload_ids(".xml"))
+def torznab_payload(request) -> bytes:
+    return load_payload(request.param, ".xml")
+
+
+@pytest.fixture(scope="session", params=(100, 1000, 10000))
+def query_results(request) -> list[IndexerQueryResult]:
+    return [
+        Prowlarr.parse_result(result=result)
+        for result in make_prowlarr_results(request.param)
+    ]
+
+
+@pytest.fixture
+def scoring_rules(monkeypatch) -> None:
+    """
+    Configures 100 title rules and 20 indexer flag rules, each of the three rule sets uses all of them.
+    The config is passed through environment variables, because the scoring functions load it on every call.
+    """
+    title_rules = [
+        {
+            "name": f"title-{i}",
+            "keywords": [
+                SOURCES[i % len(SOURCES)],
+                GROUPS[i % len(GROUPS)],
+                f"keyword-{i}",
+            ],
+            "score_modifier": i % 7 - 2,
+            "negate": i % 5 == 0,
+        }
+        for i in range(100)
+    ]
+    flag_rules = [
+        {
+            "name": f"flag-{i}",
+            "flags": [FLAGS[i % len(FLAGS)]],
+            "score_modifier": i % 5 - 1,
+            "negate": i % 4 == 0,
+        }
+        for i in range(20)
+    ]
+    rule_names = [rule["name"] for rule in title_rules + flag_rules]
+    rule_sets = [
+        {"name": f"ruleset-{i}", "libraries": ["ALL_TV"], "rule_names": rule_names}
+        for i in range(3)
+    ]
+    monkeypatch.setenv("INDEXERS__TITLE_SCORING_RULES", json.dumps(title_rules))
+    monkeypatch.setenv("INDEXERS__INDEXER_FLAG_SCORING_RULES", json.dumps(flag_rules))
+    monkeypatch.setenv("INDEXERS__SCORING_RULE_SETS", json.dumps(rule_sets))
@@ -0,0 +1,133 @@
+"""
+Synthetic Prowlarr and Jackett responses for the indexer benchmarks.
+
+Recorded responses can be benchmarked as well: save the body of a Prowlarr search as payloads/<name>.json or
+the body of a Jackett (Torznab) search as payloads/<name>.xml, they are picked up next to the synthetic sizes.
+"""
+
+import json
+import random
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+SIZES = (100, 1000, 10000)
+RECORDED_PAYLOAD_DIR = Path(__file__).parent / "payloads"
+
+QUALITIES = ("2160p 4K", "1080p", "720p", "480p", "")
+SOURCES = ("WEB-DL", "BluRay", "HDTV", "WEBRip")
+CODECS = ("x264", "x265", "HEVC", "AV1")
+GROUPS = ("NTb", "FLUX", "EDITH", "GalaxyTV", "SuccessfulCrab")
+FLAGS = ("freeleech", "halfleech", "doubleupload", "internal", "scene")
+
+
+def make_title(rng: random.Random, i: int) -> str:
+    season = rng.randint(1, 12)
+    match rng.randint(0, 3):
+        case 0:
+            episode_part = f"S{season:02d}"
+        case 1:
+            episode_part = f"S{season:02d} S{season + rng.randint(1, 3):02d}"
+        case 2:
+            episode_part = f"S{season:02d}E{rng.randint(1, 24):02d}"
+        case _:
+            episode_part = f"Season {season} Complete"
+    return " ".join(
+        part
+        for part in (
+            f"Benchmark Show {i % 50}",
+            episode_part,
+            rng.choice(QUALITIES),
+            rng.choice(SOURCES),
+            f"{rng.choice(CODECS)}-{rng.choice(GROUPS)}",
+        )
+        if part
+    )
+
+
+def make_prowlarr_results(count: int, seed: int = 0) -> list[dict]:
+    """
+    Results in the format of Prowlarr's /api/v1/search, half torrents and half usenet.
+    Torrents only have a magnet URL, so parsing them does not follow download URL redirects.
+    """
+    rng = random.Random(seed)
+    results = []
+    for i in range(count):
+        result = {
+            "guid": f"https://indexer.example/details/{i}",
+            "sortTitle": make_title(rng, i),
+            "size": rng.randint(100_000_000, 80_000_000_000),
+            "indexerFlags": rng.sample(FLAGS, k=rng.randint(0, 2)),
+            "categories": [{"id": 5000 + rng.choice((0, 30, 40, 45)), "name": "TV"}],
+            "indexer": "Benchmark Indexer",
+        }
+        if i % 2:
+            result |= {
+                "protocol": "usenet",
+                "downloadUrl": f"https://indexer.example/nzb/{i}",
+                "ageMinutes": rng.randint(1, 500_000),
+            }
+        else:
+            result |= {
+                "protocol": "torrent",
+                "magnetUrl": f"magnet:?xt=urn:btih:{i:040x}",
+                "seeders": rng.randint(0, 5000),
+                "leechers": rng.randint(0, 500),
+            }
+        results.append(result)
+    return results
+
+
+def make_prowlarr_payload(count: int) -> bytes:
+    return json.dumps(make_prowlarr_results(count)).encode()
+
+
+def make_torznab_payload(count: int, seed: int = 0) -> bytes:
+    """
+    A Torznab feed like the ones Jackett returns.
+    """
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        size = rng.randint(100_000_000, 80_000_000_000)
+        items.append(
+            f"""    <item>
+      <title>{escape(make_title(rng, i))}</title>
+      <guid>https://indexer.example/details/{i}</guid>
+      <jackettindexer id="benchmark">Benchmark Indexer</jackettindexer>
+      <size>{size}</size>
+      <category>5040</category>
+      <enclosure url="https://indexer.example/dl/{i}.torrent" length="{size}" type="application/x-bittorrent" />
+      <torznab:attr name="category" value="5040" />
+      <torznab:attr name="seeders" value="{rng.randint(0, 5000)}" />
+      <torznab:attr name="peers" value="{rng.randint(0, 5500)}" />
+      <torznab:attr name="downloadvolumefactor" value="{rng.choice(("0", "0.5", "1", "1"))}" />
+      <torznab:attr name="uploadvolumefactor" value="{rng.choice(("1", "1", "2"))}" />
+    </item>"""
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" '
+        'xmlns:torznab="http://torznab.com/schemas/2015/feed">\n'
+        "  <channel>\n    <title>Jackett</title>\n"
+        + "\n".join(items)
+        + "\n  </channel>\n</rss>\n"
+    ).encode()
+
+
+def get_payload_ids(suffix: str) -> list[str]:
+    """
+    Returns the synthetic sizes and the names of the recorded payloads with the suffix (.json or .xml).
+    """
+    recorded = sorted(path.stem for path in RECORDED_PAYLOAD_DIR.glob(f"*{suffix}"))
+    return [str(size) for size in SIZES] + recorded
+
+
+def load_payload(payload_id: str, suffix: str) -> bytes:
+    if payload_id.isdigit():
+        count = int(payload_id)
+        return (
+            make_prowlarr_payload(count)
+            if suffix == ".json"
+            else make_torznab_payload(count)
+        )
+    return (RECORDED_PAYLOAD_DIR / f"{payload_id}{suffix}").read_bytes()
@@ -0,0 +1,66 @@
+"""
+Benchmarks of reading indexer responses: decoding, constructing IndexerQueryResults and deriving quality and season.
+"""
+
+import io
+
+from benchmarks.indexer.conftest import JACKETT_SEARCH_PATH, PROWLARR_SEARCH_PATH
+from media_manager.indexer.indexers.jackett import Jackett
+from media_manager.indexer.indexers.prowlarr import CHUNK_SIZE, Prowlarr
+from media_manager.indexer.indexers.torznab import parse_torznab
+from media_manager.indexer.utils import iter_json_array
+
+
+def iter_chunks(payload: bytes):
+    for start in range(0, len(payload), CHUNK_SIZE):
+        yield payload[start : start + CHUNK_SIZE]
+
+
+def test_decode_prowlarr_response(benchmark, prowlarr_payload):
+    results = benchmark(lambda: list(iter_json_array(iter_chunks(prowlarr_payload))))
+    assert results
+
+
+def test_parse_prowlarr_results(benchmark, prowlarr_payload):
+    def parse():
+        return [
+            Prowlarr.parse_result(result=result)
+            for result in iter_json_array(iter_chunks(prowlarr_payload))
+        ]
+
+    assert benchmark(parse)
+
+
+def test_parse_torznab_feed(benchmark, torznab_payload):
+    assert benchmark(lambda: list(parse_torznab(io.BytesIO(torznab_payload))))
+
+
+def test_derive_quality_and_season(benchmark, query_results):
+    def derive():
+        return [(result.quality, result.season) for result in query_results]
+
+    assert benchmark(derive)
+
+
+def test_prowlarr_search(benchmark, indexer_stand_in, prowlarr_payload):
+    indexer_stand_in.responses[PROWLARR_SEARCH_PATH] = (
+        "application/json",
+        prowlarr_payload,
+    )
+    prowlarr = Prowlarr()
+    prowlarr.url = indexer_stand_in.url
+    prowlarr.max_results = 1_000_000
+
+    assert benchmark(prowlarr.search, "Benchmark Show", is_tv=True)
+
+
+def test_jackett_search(benchmark, indexer_stand_in, torznab_payload):
+    indexer_stand_in.responses[JACKETT_SEARCH_PATH] = (
+        "application/rss+xml",
+        torznab_payload,
+    )
+    jackett = Jackett()
+    jackett.url = indexer_stand_in.url
+    jackett.indexers = ["all"]
+
+    assert benchmark(jackett.search, "Benchmark Show", is_tv=True)
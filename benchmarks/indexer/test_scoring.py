@@ -0,0 +1,79 @@
+"""
+Benchmarks of ranking search results: scoring them with the configured rules, sorting them and selecting the
+torrent for an approved season request.
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from media_manager.indexer.utils import evaluate_indexer_query_results
+from media_manager.torrent.models import Quality
+from media_manager.tv.schemas import Season, SeasonRequest, Show
+from media_manager.tv.service import TvService
+
+SHOW = Show(
+    name="Benchmark Show 1",
+    overview="",
+    year=2020,
+    external_id=1,
+    metadata_provider="tmdb",
+    seasons=[],
+)
+
+
+def copy_results(query_results):
+    return ([result.model_copy() for result in query_results],), {}
+
+
+# a rule set looks up each of its rule names in all rules for every result, with 120 rules 10k results take
+# about a minute per round, so they are left out
+@pytest.mark.parametrize("query_results", (100, 1000), indirect=True)
+def test_evaluate_indexer_query_results(benchmark, scoring_rules, query_results):
+    results = benchmark.pedantic(
+        lambda results: evaluate_indexer_query_results(
+            query_results=results, media=SHOW, is_tv=True
+        ),
+        setup=lambda: copy_results(query_results),
+        rounds=3,
+    )
+    assert results
+
+
+def test_sort_indexer_query_results(benchmark, query_results):
+    benchmark.pedantic(
+        lambda results: results.sort(reverse=True),
+        setup=lambda: copy_results(query_results),
+        rounds=5,
+    )
+
+
+def test_select_season_request_torrent(benchmark, query_results):
+    season = Season(number=1, name="Season 1", overview="", external_id=1, episodes=[])
+    torrent_service = MagicMock()
+    torrent_service.download.return_value = SimpleNamespace(
+        id=uuid.uuid4(), quality=Quality.fullhd
+    )
+    tv_service = TvService(
+        tv_repository=MagicMock(),
+        torrent_service=torrent_service,
+        indexer_service=MagicMock(),
+    )
+    tv_service.get_season = lambda season_id: season
+    tv_service.get_all_available_torrents_for_a_season = lambda season_number, show_id: (
+        query_results
+    )
+    season_request = SeasonRequest(
+        season_id=season.id,
+        min_quality=Quality.sd,
+        wanted_quality=Quality.uhd,
+        authorized=True,
+    )
+
+    assert benchmark(
+        tv_service.download_approved_season_request,
+        season_request=season_request,
+        show=SHOW,
+    )
@@ -0,0 +1,102 @@
+"""
+Compares FastAPI's default response serialization with ModelResponse on a large list of shows.
+
+Run from the repository root:
+
+    python -m benchmarks.serialization --shows 5000
+"""
+
+import argparse
+import statistics
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from media_manager.responses import ModelResponse
+from media_manager.tv.schemas import Episode, Season, Show
+
+
+def make_shows(shows: int, seasons: int, episodes: int) -> list[Show]:
+    return [
+        Show(
+            name=f"Show {i}",
+            overview="An overview of the show. " * 10,
+            year=2000 + i % 25,
+            external_id=i,
+            metadata_provider="tmdb",
+            seasons=[
+                Season(
+                    number=season_number,
+                    name=f"Season {season_number}",
+                    overview="An overview of the season.",
+                    external_id=i * 100 + season_number,
+                    episodes=[
+                        Episode(
+                            number=episode_number,
+                            external_id=i * 10000
+                            + season_number * 100
+                            + episode_number,
+                            title=f"Episode {episode_number}",
+                        )
+                        for episode_number in range(1, episodes + 1)
+                    ],
+                )
+                for season_number in range(1, seasons + 1)
+            ],
+        )
+        for i in range(shows)
+    ]
+
+
+def create_app(shows: list[Show]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=list[Show])
+    def default():
+        return shows
+
+    @app.get("/model-response", response_model=list[Show])
+    def model_response():
+        return ModelResponse(shows, response_model=list[Show])
+
+    return app
+
+
+def measure(client: TestClient, path: str, rounds: int) -> tuple[list[float], int]:
+    timings = []
+    size = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        response = client.get(path)
+        timings.append(time.perf_counter() - start)
+        response.raise_for_status()
+        size = len(response.content)
+    return timings, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shows", type=int, default=5000)
+    parser.add_argument("--seasons", type=int, default=3)
+    parser.add_argument("--episodes", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    shows = make_shows(args.shows, args.seasons, args.episodes)
+    client = TestClient(create_app(shows))
+
+    results = {}
+    for path in ("/default", "/model-response"):
+        measure(client, path, rounds=1)  # warm up
+        timings, size = measure(client, path, rounds=args.rounds)
+        results[path] = statistics.median(timings)
+        print(
+            f"{path:<16} median {results[path] * 1000:8.1f} ms  "
+            f"min {min(timings) * 1000:8.1f} ms  body {size / 1024 / 1024:.1f} MiB"
+        )
+    print(f"speedup {results['/default'] / results['/model-response']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Measures importing synthetic season packs: scanning, extracting archives, matching episodes and hardlinking or copying.
+
+Run from the repository root:
+
+    python -m benchmarks.torrent_import --episodes 24 --languages 12 --directory /dev/shm --directory /var/tmp
+
+Every --directory is benchmarked separately, pass one on a tmpfs and one on a real disk to tell the file system
+apart from the import code. Multi-part archives are created with rar if it is installed, otherwise as single zip
+archives. Video files are sparse, so they take no space until they are copied.
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from typing import Callable
+from unittest.mock import MagicMock, patch
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.torrent.schemas import Quality, Torrent, TorrentStatus
+from media_manager.torrent.utils import (
+    extract_archives,
+    import_torrent,
+    list_files_recursively,
+)
+from media_manager.tv.schemas import Episode, Season, SeasonFile, Show
+from media_manager.tv.service import TvService
+
+SHOW_NAME = "Benchmark Show"
+LANGUAGES = ("en", "de", "fr", "es", "it", "nl", "pt", "sv", "da", "fi", "no", "pl")
+LANGUAGE_NAMES = {"en": "English", "de": "German", "fr": "French", "es": "Spanish"}
+MIB = 1024 * 1024
+
+
+def make_season_pack(
+    torrent_directory: Path,
+    title: str,
+    season: int,
+    episodes: int,
+    languages: int,
+    video_size: int,
+    archived_episodes: int,
+    archive_size: int,
+) -> None:
+    """
+    Creates a season pack like the ones from scene and P2P groups: one directory per episode, subtitles in a
+    nested Subs directory, extras, and the first episodes packed into (multi-part) archives.
+    """
+    root = torrent_directory / title
+    for episode in range(1, episodes + 1):
+        name = f"{SHOW_NAME.replace(' ', '.')}.S{season:02d}E{episode:02d}.1080p.WEB.H264-GROUP"
+        episode_directory = root / name
+        subtitle_directory = root / "Subs" / name
+        episode_directory.mkdir(parents=True)
+        subtitle_directory.mkdir(parents=True)
+
+        for language in LANGUAGES[:languages]:
+            (subtitle_directory / f"{name}.{language}.srt").write_text(
+                "1\n00:00:01,000 --> 00:00:02,000\nBenchmark\n" * 500
+            )
+            if language in LANGUAGE_NAMES:
+                # named like many packs do it, these are not matched by the importer
+                (subtitle_directory / f"2_{LANGUAGE_NAMES[language]}.srt").write_text(
+                    "1\n00:00:01,000 --> 00:00:02,000\nBenchmark\n"
+                )
+        (episode_directory / f"{name}.nfo").write_text(f"{name}\n" * 20)
+        (episode_directory / "Screens").mkdir()
+        for screen in range(3):
+            (episode_directory / "Screens" / f"screen{screen}.jpg").write_bytes(
+                b"\xff\xd8" + b"\0" * 2048
+            )
+
+        video_file = episode_directory / f"{name}.mkv"
+        if episode <= archived_episodes:
+            with video_file.open("wb") as file:
+                file.write(os.urandom(archive_size))
+            create_archive(video_file, volume_size=max(archive_size // 4, MIB))
+            video_file.unlink()
+        else:
+            with video_file.open("wb") as file:
+                file.truncate(video_size)
+        (episode_directory / f"{name}.sample.mkv").write_bytes(b"\0" * MIB)
+
+
+def create_archive(file: Path, volume_size: int) -> None:
+    if shutil.which("rar"):
+        subprocess.run(
+            [
+                "rar",
+                "a",
+                "-m0",
+                "-ep",
+                f"-v{volume_size}b",
+                "-idq",
+                str(file.with_suffix(".rar")),
+                str(file),
+            ],
+            check=True,
+        )
+    else:
+        with zipfile.ZipFile(file.with_suffix(".zip"), "w") as archive:
+            archive.write(file, arcname=file.name)
+
+
+def make_tv_service(season: Season) -> TvService:
+    torrent_service = MagicMock()
+    torrent_service.get_season_files_of_torrent.return_value = [
+        SeasonFile(
+            season_id=season.id,
+            quality=Quality.fullhd,
+            torrent_id=None,
+            file_path_suffix="1080P",
+        )
+    ]
+    tv_service = TvService(
+        tv_repository=MagicMock(),
+        torrent_service=torrent_service,
+        indexer_service=MagicMock(),
+    )
+    tv_service.get_season = lambda season_id: season
+    return tv_service
+
+
+def measure(
+    directory: Path,
+    args: argparse.Namespace,
+    phase: Callable[[Path, Torrent], int],
+) -> tuple[list[float], int]:
+    """
+    Runs the phase on a fresh season pack in every round and returns the durations and the number of files.
+    """
+    timings = []
+    files = 0
+    for _ in range(args.rounds):
+        with tempfile.TemporaryDirectory(dir=directory) as work_directory:
+            work_directory = Path(work_directory)
+            torrent = Torrent(
+                status=TorrentStatus.finished,
+                title=f"{SHOW_NAME}.S01.1080p.WEB.H264-GROUP",
+                quality=Quality.fullhd,
+                imported=False,
+                hash="0" * 40,
+            )
+            make_season_pack(
+                torrent_directory=work_directory / "torrents",
+                title=torrent.title,
+                season=1,
+                episodes=args.episodes,
+                languages=args.languages,
+                video_size=args.video_size * MIB,
+                archived_episodes=args.archived_episodes,
+                archive_size=args.archive_size * MIB,
+            )
+            with patch.dict(
+                os.environ,
+                {
+                    "MISC__TORRENT_DIRECTORY": str(work_directory / "torrents"),
+                    "MISC__TV_DIRECTORY": str(work_directory / "tv"),
+                },
+            ):
+                start = time.perf_counter()
+                files = phase(work_directory, torrent)
+                timings.append(time.perf_counter() - start)
+    return timings, files
+
+
+def scan(work_directory: Path, torrent: Torrent) -> int:
+    return len(list_files_recursively(path=work_directory / "torrents" / torrent.title))
+
+
+def extract(work_directory: Path, torrent: Torrent) -> int:
+    files = list_files_recursively(path=work_directory / "torrents" / torrent.title)
+    extract_archives(files)
+    return len(files)
+
+
+def import_torrent_phase(work_directory: Path, torrent: Torrent) -> int:
+    video_files, subtitle_files, all_files = import_torrent(torrent=torrent)
+    return len(all_files)
+
+
+def import_files(
+    work_directory: Path, torrent: Torrent, copy: bool, episodes: int
+) -> int:
+    season = Season(
+        number=1,
+        name="Season 1",
+        overview="",
+        external_id=1,
+        episodes=[
+            Episode(number=number, external_id=number, title=f"Episode {number}")
+            for number in range(1, episodes + 1)
+        ],
+    )
+    show = Show(
+        name=SHOW_NAME,
+        overview="",
+        year=2020,
+        external_id=1,
+        metadata_provider="tmdb",
+        seasons=[season],
+    )
+    tv_service = make_tv_service(season)
+    if copy:
+        # a failing hardlink makes import_file fall back to copying, like across file systems
+        with patch.object(Path, "hardlink_to", side_effect=OSError("benchmark")):
+            tv_service.import_torrent_files(torrent=torrent, show=show)
+    else:
+        tv_service.import_torrent_files(torrent=torrent, show=show)
+    return len(list_files_recursively(path=work_directory / "tv"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--directory",
+        type=Path,
+        action="append",
+        help="directory to run the benchmark in, can be repeated (default: /dev/shm and the temp directory)",
+    )
+    parser.add_argument("--episodes", type=int, default=24)
+    parser.add_argument("--languages", type=int, default=12, help="at most 12")
+    parser.add_argument(
+        "--video-size", type=int, default=2048, help="MiB, sparse video files"
+    )
+    parser.add_argument("--archived-episodes", type=int, default=4)
+    parser.add_argument(
+        "--archive-size", type=int, default=16, help="MiB of every archived video"
+    )
+    parser.add_argument(
+        "--copy-size",
+        type=int,
+        default=64,
+        help="MiB of the sparse video files when copying, so copying a pack stays feasible",
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    # the import logs an error for every file it can't hardlink, that would drown the results
+    logging.disable(logging.ERROR)
+
+    directories = args.directory or [
+        directory
+        for directory in (Path("/dev/shm"), Path(tempfile.gettempdir()))
+        if directory.is_dir()
+    ]
+    print(
+        f"{args.episodes} episodes, {args.languages} subtitle languages, {args.archived_episodes} archived episodes "
+        f"({'rar' if shutil.which('rar') else 'zip'})"
+    )
+    phases: dict[str, Callable[[Path, Torrent], int]] = {
+        "scan": scan,
+        "extract archives": extract,
+        "import_torrent": import_torrent_phase,
+        "import_torrent_files (hardlink)": lambda work_directory, torrent: import_files(
+            work_directory, torrent, copy=False, episodes=args.episodes
+        ),
+    }
+    for directory in directories:
+        print(f"\n{directory}")
+        for name, phase in phases.items():
+            timings, files = measure(directory, args, phase)
+            print_result(name, timings, files)
+
+        copy_args = argparse.Namespace(**vars(args) | {"video_size": args.copy_size})
+        timings, files = measure(
+            directory,
+            copy_args,
+            lambda work_directory, torrent: import_files(
+                work_directory, torrent, copy=True, episodes=args.episodes
+            ),
+        )
+        print_result(
+            f"import_torrent_files (copy, {args.copy_size} MiB)", timings, files
+        )
+
+
+def print_result(name: str, timings: list[float], files: int) -> None:
+    print(
+        f"  {name:<36} median {statistics.median(timings) * 1000:9.1f} ms  "
+        f"min {min(timings) * 1000:9.1f} ms  {files:>6} files"
+    )
+
+
+if __name__ == "__main__":
+    main()
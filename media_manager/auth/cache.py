@@ -0,0 +1,86 @@
+import logging
+import threading
+import uuid
+
+from cachetools import TTLCache
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from media_manager.auth.db import User
+from media_manager.config import AllEncompassingConfig
+from media_manager.database.broadcast import broadcast
+
+log = logging.getLogger(__name__)
+
+
+def _copy_detached(instance):
+    """
+    Copies the loaded attributes of an ORM instance into a new, detached instance.
+    The copy can be added to any session and will be updated, not inserted.
+    """
+    mapper = inspect(instance).mapper
+    copy = mapper.class_manager.new_instance()
+    for attribute in mapper.column_attrs:
+        set_committed_value(copy, attribute.key, getattr(instance, attribute.key))
+    make_transient_to_detached(copy)
+    return copy
+
+
+class UserCache:
+    """
+    Short-lived cache of authenticated users keyed by their ID, i.e. the subject of their token.
+
+    Authenticated requests can then skip loading the user and its OAuth accounts from the database. Every
+    caller gets its own detached copy, so a request that updates the user does not change the cached one.
+    Entries are invalidated when a user is updated, verified, or deleted through the UserManager, in the other
+    processes too.
+    """
+
+    def __init__(self, ttl: int, max_entries: int = 1024):
+        self.enabled = ttl > 0
+        self._cache: TTLCache = TTLCache(maxsize=max_entries, ttl=max(ttl, 1))
+        self._lock = threading.Lock()
+
+    def get(self, user_id: uuid.UUID) -> User | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            user = self._cache.get(user_id)
+        return self.__copy(user) if user is not None else None
+
+    def set(self, user: User) -> None:
+        if not self.enabled:
+            return
+        user = self.__copy(user)
+        with self._lock:
+            self._cache[user.id] = user
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        self.receive_broadcast(str(user_id))
+        broadcast.send("user_cache", str(user_id))
+
+    def receive_broadcast(self, user_id: str) -> None:
+        with self._lock:
+            self._cache.pop(uuid.UUID(user_id), None)
+        log.debug(f"Invalidated cached user {user_id}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def __copy(user: User) -> User:
+        copy = _copy_detached(user)
+        set_committed_value(
+            copy,
+            "oauth_accounts",
+            [_copy_detached(oauth_account) for oauth_account in user.oauth_accounts],
+        )
+        return copy
+
+
+user_cache = UserCache(ttl=AllEncompassingConfig().auth.user_cache_ttl)
+broadcast.subscribe(
+    "user_cache", user_cache.receive_broadcast, on_connect=user_cache.clear
+)
@@ -18,6 +18,9 @@ class AuthConfig(BaseSettings):
     session_lifetime: int = 60 * 60 * 24
     admin_emails: list[str] = []
     email_password_resets: bool = False
+    user_cache_ttl: int = (
+        30  # seconds an authenticated user is cached, 0 disables the cache
+    )
     openid_connect: OpenIdConfig = OpenIdConfig()
 
     @property
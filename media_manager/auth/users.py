@@ -4,7 +4,14 @@ import uuid
 from typing import Optional, Any
 
 from fastapi import Depends, Request
-from fastapi_users import BaseUserManager, FastAPIUsers, UUIDIDMixin, models
+import jwt
+from fastapi_users import (
+    BaseUserManager,
+    FastAPIUsers,
+    UUIDIDMixin,
+    exceptions,
+    models,
+)
 from fastapi_users.authentication import (
     AuthenticationBackend,
     BearerTransport,
@@ -12,12 +19,14 @@ from fastapi_users.authentication import (
     JWTStrategy,
 )
 from fastapi_users.db import SQLAlchemyUserDatabase
+from fastapi_users.jwt import decode_jwt
 from httpx_oauth.clients.openid import OpenID
 from fastapi.responses import RedirectResponse, Response
 from starlette import status
 from sqlalchemy import select, func
 
 import media_manager.notification.utils
+from media_manager.auth.cache import user_cache
 from media_manager.auth.db import User, get_user_db, get_async_session
 from media_manager.auth.schemas import UserUpdate, UserCreate
 from media_manager.config import AllEncompassingConfig
@@ -53,6 +62,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         request: Optional[Request] = None,
     ) -> None:
         log.info(f"User {user.id} has been updated. Changes: {update_dict}")
+        user_cache.invalidate(user.id)
         if "is_superuser" in update_dict and update_dict["is_superuser"]:
             log.info(f"User {user.id} has been granted superuser privileges.")
         if "email" in update_dict:
@@ -99,6 +109,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         self, user: User, request: Optional[Request] = None
     ):
         log.info(f"User {user.id} has reset their password.")
+        user_cache.invalidate(user.id)
 
     async def on_after_request_verify(
         self, user: User, token: str, request: Optional[Request] = None
@@ -109,6 +120,11 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
 
     async def on_after_verify(self, user: User, request: Optional[Request] = None):
         log.info(f"User {user.id} has been verified")
+        user_cache.invalidate(user.id)
+
+    async def on_after_delete(self, user: User, request: Optional[Request] = None):
+        log.info(f"User {user.id} has been deleted.")
+        user_cache.invalidate(user.id)
 
 
 async def get_user_manager(user_db: SQLAlchemyUserDatabase = Depends(get_user_db)):
@@ -177,8 +193,42 @@ async def get_user_manager(user_db: SQLAlchemyUserDatabase = Depends(get_user_db
     yield UserManager(user_db)
 
 
+class CachingJWTStrategy(JWTStrategy[models.UP, models.ID]):
+    """
+    JWTStrategy that looks up the user of a valid token in the user cache before querying the database.
+    """
+
+    async def read_token(
+        self, token: str | None, user_manager: BaseUserManager[models.UP, models.ID]
+    ) -> models.UP | None:
+        if token is None:
+            return None
+
+        try:
+            data = decode_jwt(
+                token, self.decode_key, self.token_audience, algorithms=[self.algorithm]
+            )
+            user_id = data.get("sub")
+            if user_id is None:
+                return None
+            user_id = user_manager.parse_id(user_id)
+        except (jwt.PyJWTError, exceptions.InvalidID):
+            return None
+
+        user = user_cache.get(user_id)
+        if user is not None:
+            return user
+
+        try:
+            user = await user_manager.get(user_id)
+        except exceptions.UserNotExists:
+            return None
+        user_cache.set(user)
+        return user
+
+
 def get_jwt_strategy() -> JWTStrategy[models.UP, models.ID]:
-    return JWTStrategy(secret=SECRET, lifetime_seconds=LIFETIME)
+    return CachingJWTStrategy(secret=SECRET, lifetime_seconds=LIFETIME)
 
 
 # needed because the default CookieTransport does not redirect after login,
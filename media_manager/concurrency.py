@@ -0,0 +1,45 @@
+"""
+Thread budgets for sync route handlers.
+
+FastAPI runs sync route handlers in anyio's default thread pool, which is shared by all requests.
+Handlers that wait on indexers, metadata providers or download clients are decorated with blocking_io,
+which runs them under a separate limit, so slow searches can't occupy the threads every other request needs.
+"""
+
+import functools
+from typing import Callable, ParamSpec, TypeVar
+
+import anyio.to_thread
+from anyio import CapacityLimiter
+
+from media_manager.config import AllEncompassingConfig
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+config = AllEncompassingConfig().misc
+blocking_io_limiter = CapacityLimiter(config.blocking_io_threads)
+
+
+def configure_default_thread_limiter() -> None:
+    """
+    Sets the size of anyio's default thread pool, must be called from within the event loop.
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        config.worker_threads
+    )
+
+
+def blocking_io(func: Callable[P, R]) -> Callable[P, R]:
+    """
+    Turns a sync route handler into an async one that runs the handler in a thread
+    limited by blocking_io_limiter instead of the default thread pool.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return await anyio.to_thread.run_sync(
+            functools.partial(func, *args, **kwargs), limiter=blocking_io_limiter
+        )
+
+    return wrapper
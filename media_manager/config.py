@@ -1,8 +1,8 @@
 import os
 from pathlib import Path
-from typing import Type, Tuple
+from typing import Literal, Type, Tuple
 
-from pydantic import AnyHttpUrl
+from pydantic import AnyHttpUrl, field_validator
 from pydantic_settings import (
     BaseSettings,
     SettingsConfigDict,
@@ -12,6 +12,10 @@ from pydantic_settings import (
 
 from media_manager.auth.config import AuthConfig
 from media_manager.database.config import DbConfig
+from media_manager.http.config import HttpConfig
+from media_manager.images.config import ImageConfig
+from media_manager.jobs.config import JobsConfig
+from media_manager.metrics.config import MetricsConfig
 from media_manager.indexer.config import IndexerConfig
 from media_manager.metadataProvider.config import MetadataProviderConfig
 from media_manager.notification.config import NotificationConfig
@@ -41,10 +45,24 @@ class BasicConfig(BaseSettings):
     frontend_url: AnyHttpUrl = "http://localhost:3000/web/"
     cors_urls: list[str] = []
     development: bool = False
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
+    worker_threads: int = 40  # threads for regular API requests
+    blocking_io_threads: int = 20  # threads for requests that wait on indexers, metadata providers and download clients
+    response_cache_size: int = (
+        256  # number of library responses that are kept in memory
+    )
 
     tv_libraries: list[LibraryItem] = []
     movie_libraries: list[LibraryItem] = []
 
+    @field_validator("log_level", mode="before")
+    @classmethod
+    def normalize_log_level(cls, log_level):
+        # the level names are case-insensitive, like they were before they were validated
+        if isinstance(log_level, str):
+            return log_level.upper()
+        return log_level
+
 
 class AllEncompassingConfig(BaseSettings):
     model_config = SettingsConfigDict(
@@ -61,6 +79,10 @@ class AllEncompassingConfig(BaseSettings):
     indexers: IndexerConfig = IndexerConfig()
     database: DbConfig = DbConfig()
     auth: AuthConfig = AuthConfig()
+    http: HttpConfig = HttpConfig()
+    images: ImageConfig = ImageConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    jobs: JobsConfig = JobsConfig()
 
     @classmethod
     def settings_customise_sources(
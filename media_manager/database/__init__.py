@@ -4,9 +4,16 @@ from typing import Annotated, Any, Generator
 
 from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from media_manager.config import AllEncompassingConfig
+from media_manager.database.pool import (
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    get_pool_metrics,
+)
+from media_manager.database.schemas import PoolMetrics
 
 log = logging.getLogger(__name__)
 config = AllEncompassingConfig().database
@@ -25,13 +32,36 @@ db_url = (
     + config.dbname
 )
 
+
+def get_connect_args() -> dict[str, Any]:
+    # psycopg prepares statements that are executed repeatedly, pgbouncer in transaction mode can hand
+    # the next transaction a different server connection that doesn't know the prepared statement
+    return {"prepare_threshold": None} if config.pgbouncer else {}
+
+
 engine = create_engine(
     db_url,
     echo=False,
-    pool_size=10,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,
+    poolclass=TimedQueuePool,
+    pool_logging_name="sync",
+    pool_size=config.pool_size,
+    max_overflow=config.max_overflow,
+    pool_timeout=config.pool_timeout,
+    pool_recycle=config.pool_recycle,
+    pool_pre_ping=True,
+    connect_args=get_connect_args(),
+)
+async_engine = create_async_engine(
+    db_url,
+    echo=False,
+    poolclass=TimedAsyncAdaptedQueuePool,
+    pool_logging_name="async",
+    pool_size=config.async_pool_size,
+    max_overflow=config.async_max_overflow,
+    pool_timeout=config.pool_timeout,
+    pool_recycle=config.pool_recycle,
+    pool_pre_ping=True,
+    connect_args=get_connect_args(),
 )
 log.debug("initializing sqlalchemy declarative base")
 Base = declarative_base()
@@ -45,6 +75,10 @@ def init_db() -> None:
     Base.metadata.create_all(engine)
 
 
+def get_database_pool_metrics() -> list[PoolMetrics]:
+    return get_pool_metrics(engine.pool, async_engine.sync_engine.pool)
+
+
 def get_session() -> Generator[Session, Any, None]:
     db = SessionLocal()
     try:
@@ -0,0 +1,156 @@
+"""
+Relays messages between the MediaManager processes that share a database, e.g. API replicas and workers, via
+Postgres LISTEN/NOTIFY.
+
+Caches and the event bus live in the memory of each process. They send a message whenever they change, so the other
+processes can invalidate their copies or forward the event to their clients.
+"""
+
+import json
+import logging
+import queue
+import threading
+import uuid
+from typing import Any, Callable
+
+import psycopg
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from media_manager.database import engine, get_connect_args
+
+log = logging.getLogger(__name__)
+
+CHANNEL = "media_manager"
+# Postgres rejects notifications whose payload is 8000 bytes or larger
+MAX_PAYLOAD_SIZE = 7999
+
+
+class Broadcast:
+    """
+    Messages are only sent and received after start() was called, a single process does not need them. Every
+    process ignores the messages it sent itself.
+    Sending only queues the message, a background thread sends it, so it is safe to call from the event loop.
+    """
+
+    def __init__(self, reconnect_interval: float = 5):
+        self.reconnect_interval = reconnect_interval
+        self._origin = uuid.uuid4().hex
+        self._handlers: dict[str, Callable[[Any], None]] = {}
+        self._connect_handlers: list[Callable[[], None]] = []
+        self._thread: threading.Thread | None = None
+        self._sender: threading.Thread | None = None
+        self._queue: queue.Queue[tuple[str, str] | None] = queue.Queue()
+        self._stop = threading.Event()
+
+    def subscribe(
+        self,
+        topic: str,
+        handler: Callable[[Any], None],
+        on_connect: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        :param topic: The topic of the messages the handler receives.
+        :param handler: Is called with the data of every message of another process.
+        :param on_connect: Is called whenever the listener (re)connected, messages may have been missed before.
+        """
+        self._handlers[topic] = handler
+        if on_connect is not None:
+            self._connect_handlers.append(on_connect)
+
+    def send(self, topic: str, data: Any) -> None:
+        if self._thread is None:
+            return
+        payload = json.dumps({"origin": self._origin, "topic": topic, "data": data})
+        if len(payload.encode()) > MAX_PAYLOAD_SIZE:
+            log.warning(f"Not broadcasting {topic} message of {len(payload)} bytes")
+            return
+        self._queue.put((topic, payload))
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._sender = threading.Thread(
+            target=self._send_queued, name="broadcast-sender", daemon=True
+        )
+        self._sender.start()
+        self._thread = threading.Thread(
+            target=self._listen, name="broadcast-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        # the messages that are still queued are sent first
+        self._queue.put(None)
+        self._sender.join(timeout=5)
+        self._sender = None
+
+    def _send_queued(self) -> None:
+        stopping = False
+        while not stopping:
+            message = self._queue.get()
+            if message is None:
+                break
+            messages = [message]
+            # everything that queued up meanwhile is sent in the same transaction
+            while True:
+                try:
+                    message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if message is None:
+                    stopping = True
+                    break
+                messages.append(message)
+            try:
+                with engine.begin() as connection:
+                    for _, payload in messages:
+                        connection.execute(
+                            text("SELECT pg_notify(:channel, :payload)"),
+                            {"channel": CHANNEL, "payload": payload},
+                        )
+            except SQLAlchemyError as e:
+                topics = ", ".join(sorted({topic for topic, _ in messages}))
+                log.error(f"Could not broadcast {topics} messages: {e}")
+
+    def _listen(self) -> None:
+        # LISTEN needs a session of its own, so the connection does not come from the pool
+        conninfo = engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(
+                    conninfo, autocommit=True, **get_connect_args()
+                ) as connection:
+                    connection.execute(f"LISTEN {CHANNEL}")
+                    log.info(f"Listening for broadcasts on channel {CHANNEL}")
+                    for on_connect in self._connect_handlers:
+                        on_connect()
+                    while not self._stop.is_set():
+                        for notify in connection.notifies(timeout=1):
+                            self._dispatch(notify.payload)
+            except Exception as e:
+                # messages may be missed until the listener reconnected, the on_connect handlers catch up then
+                log.error(f"Broadcast listener failed, reconnecting: {e}")
+                self._stop.wait(self.reconnect_interval)
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            if message["origin"] == self._origin:
+                return
+            handler = self._handlers.get(message["topic"])
+            if handler is not None:
+                handler(message["data"])
+        except Exception as e:
+            log.error(f"Error handling broadcast {payload[:200]}: {e}")
+
+
+broadcast = Broadcast()
@@ -7,3 +7,13 @@ class DbConfig(BaseSettings):
     user: str = "MediaManager"
     password: str = "MediaManager"
     dbname: str = "MediaManager"
+
+    # the API, the scheduler and migrations share the sync pool, user authentication uses the async one,
+    # so up to pool_size + max_overflow + async_pool_size + async_max_overflow connections are opened
+    pool_size: int = 10
+    max_overflow: int = 10
+    async_pool_size: int = 5
+    async_max_overflow: int = 5
+    pool_timeout: float = 30.0  # seconds to wait for a free connection before giving up
+    pool_recycle: int = 1800  # seconds after which a connection is replaced
+    pgbouncer: bool = False  # disables server-side prepared statements, needed behind pgbouncer's transaction pooling
@@ -0,0 +1,69 @@
+"""
+Connection pools that record how long callers wait for a connection.
+"""
+
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from media_manager.database.schemas import PoolMetrics
+
+_metrics: dict[str, PoolMetrics] = {}
+_lock = threading.Lock()
+
+
+def _record(pool: str, wait: float, timed_out: bool) -> None:
+    with _lock:
+        metrics = _metrics.setdefault(pool, PoolMetrics(pool=pool))
+        if timed_out:
+            metrics.timeouts += 1
+        else:
+            metrics.checkouts += 1
+            metrics.total_wait += wait
+            metrics.max_wait = max(metrics.max_wait, wait)
+
+
+class _TimedPoolMixin:
+    """
+    Times every checkout of a connection. The metrics are keyed by the pool's logging name,
+    because that survives the pool being recreated by Engine.dispose().
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            _record(self.logging_name, time.perf_counter() - start, timed_out=True)
+            raise
+        _record(self.logging_name, time.perf_counter() - start, timed_out=False)
+        return connection
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def get_pool_metrics(*pools: QueuePool) -> list[PoolMetrics]:
+    """
+    Returns a snapshot of the given pools' current usage together with their recorded wait times.
+    """
+    with _lock:
+        return [
+            _metrics.get(
+                pool.logging_name, PoolMetrics(pool=pool.logging_name)
+            ).model_copy(
+                update={
+                    "size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": max(pool.overflow(), 0),
+                }
+            )
+            for pool in pools
+        ]
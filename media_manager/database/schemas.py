@@ -0,0 +1,17 @@
+from pydantic import BaseModel, computed_field
+
+
+class PoolMetrics(BaseModel):
+    pool: str
+    size: int = 0
+    checked_out: int = 0
+    overflow: int = 0
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0  # seconds
+    max_wait: float = 0.0  # seconds
+
+    @computed_field(return_type=float)
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.checkouts if self.checkouts else 0.0
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from media_manager.database.broadcast import broadcast
+from media_manager.events import log
+from media_manager.events.schemas import Event, EventType
+
+
+class EventBus:
+    """
+    Delivers events to all connected clients.
+
+    Events can be published from any thread, e.g. from scheduler jobs or sync request handlers. Every
+    subscriber gets its own bounded queue on its event loop; if a client does not keep up, its oldest
+    events are dropped instead of blocking the publisher. Events are broadcast to the other processes
+    too, so clients of an API process get the events of the worker.
+    """
+
+    def __init__(self, max_queued_events: int = 100):
+        self.max_queued_events = max_queued_events
+        self._subscribers: set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = set()
+        self._lock = threading.Lock()
+
+    def publish(self, type: EventType, data: dict[str, Any]) -> None:
+        event = Event(type=type, data=data)
+        self.__publish_locally(event)
+        broadcast.send("event", event.model_dump(mode="json"))
+
+    def receive_broadcast(self, data: dict[str, Any]) -> None:
+        self.__publish_locally(Event.model_validate(data))
+
+    def __publish_locally(self, event: Event) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        log.debug(
+            f"Publishing {event.type.value} event to {len(subscribers)} subscribers"
+        )
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self.__deliver, queue, event)
+            except RuntimeError:
+                # the subscriber's event loop is already closed
+                pass
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=self.max_queued_events)
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        try:
+            yield queue
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+
+    @staticmethod
+    def __deliver(queue: asyncio.Queue, event: Event) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+
+event_bus = EventBus()
+broadcast.subscribe("event", event_bus.receive_broadcast)
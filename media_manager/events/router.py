@@ -0,0 +1,43 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from media_manager.auth.users import current_active_user
+from media_manager.events.bus import event_bus
+
+router = APIRouter()
+
+# seconds between keep-alive comments, so proxies do not close idle connections
+HEARTBEAT_INTERVAL = 15
+
+
+@router.get(
+    "",
+    dependencies=[Depends(current_active_user)],
+    response_class=StreamingResponse,
+)
+async def stream_events(request: Request):
+    """
+    Server-sent events stream of torrent status changes, finished imports and new notifications.
+    Every event has the type torrent_status, torrent_imported or notification and a JSON payload.
+    """
+
+    async def event_stream():
+        async with event_bus.subscribe() as queue:
+            yield ": connected\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=HEARTBEAT_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield f"event: {event.type.value}\ndata: {event.model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
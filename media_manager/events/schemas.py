@@ -0,0 +1,17 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class EventType(Enum):
+    torrent_status = "torrent_status"
+    torrent_imported = "torrent_imported"
+    notification = "notification"
+
+
+class Event(BaseModel):
+    type: EventType
+    data: dict[str, Any]
+    timestamp: datetime = Field(default_factory=datetime.now)
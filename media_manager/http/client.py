@@ -0,0 +1,162 @@
+"""
+Shared HTTP client for all outbound integrations (metadata relay, indexers, notification services, ...).
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from media_manager.config import AllEncompassingConfig
+from media_manager.http import log
+from media_manager.http.schemas import HostMetrics
+from media_manager.metrics.profiling import record_http_request
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised when a request is refused because the circuit breaker of its host is open."""
+
+
+class CircuitBreaker:
+    """
+    Cuts off a host after a number of consecutive failures.
+    After the reset timeout one trial request is let through, if it succeeds the circuit is closed again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._trial_in_progress:
+                return False
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                self._trial_in_progress = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_progress = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class HttpClient(requests.Session):
+    """
+    A requests session with per-host connection pools, default timeouts, retries with jittered
+    exponential backoff, a circuit breaker per host and per-host latency/error metrics.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.config = AllEncompassingConfig().http
+        self.timeout = (self.config.connect_timeout, self.config.read_timeout)
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._metrics: dict[str, HostMetrics] = {}
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=self.config.retries,
+            connect=self.config.retries,
+            read=self.config.retries,
+            status=self.config.retries,
+            status_forcelist=(429, 500, 502, 503, 504),
+            backoff_factor=self.config.backoff_factor,
+            backoff_jitter=self.config.backoff_jitter,
+            backoff_max=self.config.backoff_max,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_size,
+            pool_maxsize=self.config.pool_size,
+            max_retries=retry,
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def _get_breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(
+                    failure_threshold=self.config.circuit_breaker_failure_threshold,
+                    reset_timeout=self.config.circuit_breaker_reset_timeout,
+                )
+            return self._breakers[host]
+
+    def _record(self, host: str, latency: float, error: bool) -> None:
+        record_http_request(latency)
+        with self._lock:
+            metrics = self._metrics.setdefault(host, HostMetrics(host=host))
+            metrics.requests += 1
+            metrics.total_latency += latency
+            metrics.max_latency = max(metrics.max_latency, latency)
+            if error:
+                metrics.errors += 1
+
+    def request(self, method, url, *args, **kwargs) -> requests.Response:
+        host = urlsplit(str(url)).netloc
+        breaker = self._get_breaker(host)
+        if not breaker.allow_request():
+            raise CircuitOpenError(
+                f"Circuit breaker for {host} is open, not sending {method} request to {url}"
+            )
+
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except Exception:
+            # not only requests' exceptions, otherwise a failed trial request would keep the circuit open forever
+            self._record(host=host, latency=time.perf_counter() - start, error=True)
+            breaker.record_failure()
+            if breaker.is_open:
+                log.warning(f"Circuit breaker for {host} is open")
+            raise
+
+        failed = response.status_code >= 500
+        self._record(host=host, latency=time.perf_counter() - start, error=failed)
+        if failed:
+            breaker.record_failure()
+            if breaker.is_open:
+                log.warning(f"Circuit breaker for {host} is open")
+        else:
+            breaker.record_success()
+        return response
+
+    def get_host_metrics(self) -> list[HostMetrics]:
+        """
+        Returns a snapshot of the latency and error metrics of every host that was contacted.
+        """
+        with self._lock:
+            return [
+                metrics.model_copy(
+                    update={"circuit_open": self._breakers[host].is_open}
+                )
+                for host, metrics in self._metrics.items()
+            ]
+
+
+http_client = HttpClient()
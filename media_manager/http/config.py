@@ -0,0 +1,21 @@
+from pydantic_settings import BaseSettings
+
+
+class HttpConfig(BaseSettings):
+    connect_timeout: float = 5.0  # seconds to wait for a connection to be established
+    read_timeout: float = 60.0  # seconds to wait for the server to send data
+    pool_size: int = 10  # maximum number of keep-alive connections per host
+
+    retries: int = 3  # how often idempotent requests are retried on connection errors and 5xx responses
+    backoff_factor: float = 0.5  # the n-th retry waits backoff_factor * 2^(n-1) seconds
+    backoff_jitter: float = (
+        0.5  # up to this many seconds are randomly added to every backoff
+    )
+    backoff_max: float = 30.0
+
+    circuit_breaker_failure_threshold: int = (
+        5  # consecutive failures before a host is cut off
+    )
+    circuit_breaker_reset_timeout: float = (
+        60.0  # seconds until a cut off host is tried again
+    )
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, computed_field
+
+
+class HostMetrics(BaseModel):
+    host: str
+    requests: int = 0
+    errors: int = 0
+    total_latency: float = 0.0  # seconds
+    max_latency: float = 0.0  # seconds
+    circuit_open: bool = False
+
+    @computed_field(return_type=float)
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
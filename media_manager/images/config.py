@@ -0,0 +1,13 @@
+from pydantic_settings import BaseSettings
+
+
+class ImageConfig(BaseSettings):
+    transcode_workers: int = 2  # number of processes that encode poster variants
+    avif_quality: int = 50
+    webp_quality: int = 50
+    jpeg_quality: int = (
+        85  # only used for resized variants, the original is served as is
+    )
+    cache_max_age: int = (
+        604800  # seconds browsers may use a poster without asking again
+    )
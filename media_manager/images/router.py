@@ -0,0 +1,89 @@
+from typing import Literal
+from uuid import UUID
+
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import FileResponse
+
+from media_manager.exceptions import NotFoundError
+from media_manager.images.transcoder import MEDIA_TYPES, image_transcoder
+from media_manager.responses import etag_matches
+
+router = APIRouter()
+
+# formats in order of preference, used to break ties between equally acceptable formats
+NEGOTIABLE_FORMATS = ["avif", "webp", "jpg"]
+
+
+def negotiate_image_format(accept: str | None) -> str:
+    """
+    Picks the image format the client accepts with the highest quality value.
+
+    :param accept: The value of the Accept header.
+    :return: The file extension of the chosen format, JPEG if the client does not state a preference.
+    """
+    if not accept:
+        return "jpg"
+    quality_values: dict[str, float] = {}
+    for media_range in accept.split(","):
+        media_type, *parameters = [part.strip() for part in media_range.split(";")]
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        quality_values[media_type.lower()] = quality
+
+    def get_quality(extension: str) -> float:
+        media_type = MEDIA_TYPES[extension]
+        # wildcards only count for JPEG, AVIF and WebP are only sent to clients that explicitly accept them
+        candidates = (
+            (media_type, "image/*", "*/*") if extension == "jpg" else (media_type,)
+        )
+        for candidate in candidates:
+            if candidate in quality_values:
+                return quality_values[candidate]
+        return 0.0
+
+    best_format = max(NEGOTIABLE_FORMATS, key=get_quality)
+    return best_format if get_quality(best_format) > 0 else "jpg"
+
+
+@router.get("/{image_id}/{size}", response_class=FileResponse)
+def get_image_variant(
+    image_id: UUID,
+    size: Literal["w185", "w342", "w780", "original"],
+    request: Request,
+):
+    """
+    get a poster image in the given width, as AVIF, WebP or JPEG depending on the Accept header
+    variants are encoded on their first request and can be cached by the browser
+    """
+    extension = negotiate_image_format(request.headers.get("accept"))
+    path = image_transcoder.get_image(image_id=image_id, extension=extension, size=size)
+    etag = image_transcoder.get_etag(path)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={image_transcoder.config.images.cache_max_age}, immutable",
+        "Vary": "Accept",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=MEDIA_TYPES[extension], headers=headers)
+
+
+@router.get("/{file_name}", response_class=FileResponse)
+def get_image(file_name: str):
+    """
+    get a poster image by its file name, e.g. <show or movie id>.avif
+    the AVIF and WebP variants are encoded on their first request
+    """
+    image_id, _, extension = file_name.partition(".")
+    try:
+        image_id = UUID(image_id)
+    except ValueError:
+        raise NotFoundError(f"Image {file_name} not found.")
+    path = image_transcoder.get_image(image_id=image_id, extension=extension)
+    return FileResponse(path, media_type=MEDIA_TYPES[path.suffix.removeprefix(".")])
@@ -0,0 +1,38 @@
+"""
+Runs inside the transcode worker processes, so it must not import anything from media_manager
+that would load the configuration or open database connections.
+"""
+
+import os
+
+from PIL import Image
+import pillow_avif
+
+pillow_avif
+
+
+def transcode_image(
+    source: str, destination: str, format: str, quality: int, width: int | None = None
+) -> None:
+    """
+    Encodes the source image into the given format and atomically moves it into place.
+
+    :param source: Path of the original image.
+    :param destination: Path the encoded image is written to.
+    :param format: The Pillow format name, e.g. "AVIF", "WEBP" or "JPEG".
+    :param quality: The encoder quality.
+    :param width: If given, the image is scaled down to this width, keeping its aspect ratio.
+    """
+    temporary_destination = f"{destination}.{os.getpid()}.part"
+    try:
+        with Image.open(source) as image:
+            if width is not None and image.width > width:
+                height = round(image.height * width / image.width)
+                image = image.resize((width, height), Image.Resampling.LANCZOS)
+            if format == "JPEG" and image.mode != "RGB":
+                image = image.convert("RGB")
+            image.save(temporary_destination, format=format, quality=quality)
+        os.replace(temporary_destination, destination)
+    finally:
+        if os.path.exists(temporary_destination):
+            os.remove(temporary_destination)
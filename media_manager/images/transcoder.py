@@ -0,0 +1,146 @@
+import hashlib
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from uuid import UUID
+
+from media_manager.config import AllEncompassingConfig
+from media_manager.exceptions import NotFoundError
+from media_manager.images import log
+from media_manager.images.transcode import transcode_image
+
+ORIGINAL_EXTENSION = "jpg"
+
+MEDIA_TYPES = {
+    "jpg": "image/jpeg",
+    "avif": "image/avif",
+    "webp": "image/webp",
+}
+
+# width buckets posters can be requested in, named like TMDB's image sizes
+IMAGE_WIDTHS = {
+    "w185": 185,
+    "w342": 342,
+    "w780": 780,
+    "original": None,
+}
+
+
+@lru_cache(maxsize=4096)
+def _get_file_etag(path: Path, mtime_ns: int, size: int) -> str:
+    with open(path, "rb") as f:
+        return '"' + hashlib.file_digest(f, "sha256").hexdigest()[:32] + '"'
+
+
+class ImageTranscoder:
+    """
+    Serves poster images and lazily encodes their resized and AVIF/WebP variants.
+
+    Variants are encoded in a process pool the first time they are requested and are stored next to the
+    original. Concurrent requests for the same variant wait for a single encode. A variant that is older
+    than its original is encoded again.
+    """
+
+    def __init__(self, image_directory: Path | None = None):
+        self.config = AllEncompassingConfig()
+        self.image_directory = image_directory or self.config.misc.image_directory
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.RLock()
+        self._in_flight: dict[Path, Future] = {}
+
+    def get_image(self, image_id: UUID, extension: str, size: str = "original") -> Path:
+        """
+        Returns the path of an image, encoding the requested variant first if necessary.
+
+        :param image_id: The ID of the image, i.e. the ID of the show or movie.
+        :param extension: The requested file extension, e.g. "jpg", "avif" or "webp".
+        :param size: The requested width bucket, one of IMAGE_WIDTHS.
+        :return: The path of the image file.
+        :raises NotFoundError: If the image does not exist or the extension or size is not supported.
+        """
+        if extension == "jpeg":
+            extension = ORIGINAL_EXTENSION
+        if extension not in MEDIA_TYPES:
+            raise NotFoundError(f"Image format {extension} is not supported.")
+        if size not in IMAGE_WIDTHS:
+            raise NotFoundError(f"Image size {size} is not supported.")
+
+        original = self.image_directory / f"{image_id}.{ORIGINAL_EXTENSION}"
+        if not original.exists():
+            raise NotFoundError(f"Image {image_id} not found.")
+        if extension == ORIGINAL_EXTENSION and size == "original":
+            return original
+
+        if size == "original":
+            variant = self.image_directory / f"{image_id}.{extension}"
+        else:
+            variant = self.image_directory / f"{image_id}.{size}.{extension}"
+        if not self.__is_up_to_date(variant=variant, original=original):
+            self.__encode(
+                original=original,
+                variant=variant,
+                extension=extension,
+                width=IMAGE_WIDTHS[size],
+            ).result()
+        return variant
+
+    @staticmethod
+    def get_etag(path: Path) -> str:
+        """
+        Returns a strong ETag for an image file, derived from its content.
+        """
+        stat = path.stat()
+        return _get_file_etag(path, stat.st_mtime_ns, stat.st_size)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    @staticmethod
+    def __is_up_to_date(variant: Path, original: Path) -> bool:
+        try:
+            return variant.stat().st_mtime >= original.stat().st_mtime
+        except FileNotFoundError:
+            return False
+
+    def __encode(
+        self, original: Path, variant: Path, extension: str, width: int | None
+    ) -> Future:
+        with self._lock:
+            future = self._in_flight.get(variant)
+            if future is None:
+                log.debug(f"Encoding {variant.name} from {original.name}")
+                if extension == "avif":
+                    format, quality = "AVIF", self.config.images.avif_quality
+                elif extension == "webp":
+                    format, quality = "WEBP", self.config.images.webp_quality
+                else:
+                    format, quality = "JPEG", self.config.images.jpeg_quality
+                future = self.__get_executor().submit(
+                    transcode_image,
+                    str(original),
+                    str(variant),
+                    format,
+                    quality,
+                    width,
+                )
+                self._in_flight[variant] = future
+                future.add_done_callback(lambda _: self.__forget(variant))
+            return future
+
+    def __forget(self, variant: Path) -> None:
+        with self._lock:
+            self._in_flight.pop(variant, None)
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.config.images.transcode_workers
+            )
+        return self._executor
+
+
+image_transcoder = ImageTranscoder()
@@ -5,6 +5,9 @@ class ProwlarrConfig(BaseSettings):
     enabled: bool = False
     api_key: str = ""
     url: str = "http://localhost:9696"
+    max_results: int = (
+        10000  # results beyond this are not read from Prowlarr's response
+    )
 
 
 class JackettConfig(BaseSettings):
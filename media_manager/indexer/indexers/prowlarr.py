@@ -1,14 +1,35 @@
 import logging
 
-import requests
-
 from media_manager.indexer.indexers.generic import GenericIndexer
 from media_manager.config import AllEncompassingConfig
+from media_manager.http.client import http_client
 from media_manager.indexer.schemas import IndexerQueryResult
-from media_manager.indexer.utils import follow_redirects_to_final_torrent_url
+from media_manager.indexer.utils import (
+    follow_redirects_to_final_torrent_url,
+    iter_json_array,
+)
 
 log = logging.getLogger(__name__)
 
+TV_CATEGORY = 5000
+MOVIE_CATEGORY = 2000
+CHUNK_SIZE = 64 * 1024
+
+
+def is_in_category(result: dict, category: int) -> bool:
+    """
+    Checks whether a result belongs to a newznab main category (e.g. 5000 for TV) or one of its subcategories.
+    Results without categories are kept.
+    """
+    categories = result.get("categories")
+    if not categories:
+        return True
+    return any(
+        item.get("id", 0) // 1000 * 1000 == category
+        for item in categories
+        if isinstance(item, dict)
+    )
+
 
 class Prowlarr(GenericIndexer):
     def __init__(self, **kwargs):
@@ -22,80 +43,90 @@ class Prowlarr(GenericIndexer):
         config = AllEncompassingConfig().indexers.prowlarr
         self.api_key = config.api_key
         self.url = config.url
+        self.max_results = config.max_results
         log.debug("Registering Prowlarr as Indexer")
 
     def search(self, query: str, is_tv: bool) -> list[IndexerQueryResult]:
         log.debug("Searching for " + query)
         url = self.url + "/api/v1/search"
+        category = TV_CATEGORY if is_tv else MOVIE_CATEGORY
 
         params = {
             "query": query,
             "apikey": self.api_key,
-            "categories": "5000" if is_tv else "2000",  # TV: 5000, Movies: 2000
-            "limit": 10000,
+            "categories": str(category),
+            "limit": self.max_results,
         }
 
-        response = requests.get(url, params=params)
-        if response.status_code == 200:
-            result_list: list[IndexerQueryResult] = []
-            for result in response.json():
-                if result["protocol"] == "torrent":
-                    initial_url = None
-                    if "downloadUrl" in result:
-                        log.info(f"Using download URL: {result['downloadUrl']}")
-                        initial_url = result["downloadUrl"]
-                    elif "magnetUrl" in result:
-                        log.info(
-                            f"Using magnet URL as fallback for download URL: {result['magnetUrl']}"
-                        )
-                        initial_url = result["magnetUrl"]
-                    elif "guid" in result:
-                        log.warning(
-                            f"Using guid as fallback for download URL: {result['guid']}"
-                        )
-                        initial_url = result["guid"]
-                    else:
-                        log.error(f"No valid download URL found for result: {result}")
-                        continue
+        with http_client.get(url, params=params, stream=True) as response:
+            if response.status_code != 200:
+                log.error(f"Prowlarr Error: {response.status_code}")
+                return []
 
-                    if not initial_url.startswith("magnet:"):
-                        try:
-                            final_download_url = follow_redirects_to_final_torrent_url(
-                                initial_url=initial_url
-                            )
-                        except RuntimeError as e:
-                            log.error(
-                                f"Failed to follow redirects for {initial_url}, falling back to the initial url as download url, error: {e}"
-                            )
-                            final_download_url = initial_url
-                    else:
-                        final_download_url = initial_url
-                    result_list.append(
-                        IndexerQueryResult(
-                            download_url=final_download_url,
-                            title=result["sortTitle"],
-                            seeders=result["seeders"],
-                            flags=result["indexerFlags"],
-                            size=result["size"],
-                            usenet=False,
-                            age=0,  # Torrent results do not need age information
-                        )
+            result_list: list[IndexerQueryResult] = []
+            for result in iter_json_array(response.iter_content(chunk_size=CHUNK_SIZE)):
+                if not is_in_category(result=result, category=category):
+                    log.debug(
+                        "Skipping result outside of category %s: %s", category, result
                     )
-                else:
-                    result_list.append(
-                        IndexerQueryResult(
-                            download_url=result["downloadUrl"],
-                            title=result["sortTitle"],
-                            seeders=0,  # Usenet results do not have seeders
-                            flags=result["indexerFlags"],
-                            size=result["size"],
-                            usenet=True,
-                            age=int(result["ageMinutes"]) * 60,
-                        )
+                    continue
+                log.debug("%s result: %s", result.get("protocol"), result)
+                query_result = self.parse_result(result=result)
+                if query_result is not None:
+                    result_list.append(query_result)
+                if len(result_list) >= self.max_results:
+                    log.warning(
+                        f"Reached the limit of {self.max_results} Prowlarr results for {query}, ignoring any further results"
                     )
-                log.debug("torrent result: " + result.__str__())
-
+                    break
             return result_list
+
+    @staticmethod
+    def parse_result(result: dict) -> IndexerQueryResult | None:
+        if result["protocol"] != "torrent":
+            return IndexerQueryResult(
+                download_url=result["downloadUrl"],
+                title=result["sortTitle"],
+                seeders=0,  # Usenet results do not have seeders
+                flags=result["indexerFlags"],
+                size=result["size"],
+                usenet=True,
+                age=int(result["ageMinutes"]) * 60,
+            )
+
+        if "downloadUrl" in result:
+            log.info(f"Using download URL: {result['downloadUrl']}")
+            initial_url = result["downloadUrl"]
+        elif "magnetUrl" in result:
+            log.info(
+                f"Using magnet URL as fallback for download URL: {result['magnetUrl']}"
+            )
+            initial_url = result["magnetUrl"]
+        elif "guid" in result:
+            log.warning(f"Using guid as fallback for download URL: {result['guid']}")
+            initial_url = result["guid"]
+        else:
+            log.error("No valid download URL found for result: %s", result)
+            return None
+
+        if not initial_url.startswith("magnet:"):
+            try:
+                final_download_url = follow_redirects_to_final_torrent_url(
+                    initial_url=initial_url
+                )
+            except RuntimeError as e:
+                log.error(
+                    f"Failed to follow redirects for {initial_url}, falling back to the initial url as download url, error: {e}"
+                )
+                final_download_url = initial_url
         else:
-            log.error(f"Prowlarr Error: {response.status_code}")
-            return []
+            final_download_url = initial_url
+        return IndexerQueryResult(
+            download_url=final_download_url,
+            title=result["sortTitle"],
+            seeders=result["seeders"],
+            flags=result["indexerFlags"],
+            size=result["size"],
+            usenet=False,
+            age=0,  # Torrent results do not need age information
+        )
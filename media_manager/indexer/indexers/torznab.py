@@ -0,0 +1,89 @@
+"""
+Incremental parser for Torznab search results, as returned by Jackett.
+"""
+
+import logging
+import xml.etree.ElementTree as ET
+from typing import IO, Any, Callable, Iterator
+
+from media_manager.indexer.schemas import IndexerQueryResult
+
+log = logging.getLogger(__name__)
+
+TORZNAB_NAMESPACE = "{http://torznab.com/schemas/2015/feed}"
+
+# maps the name of a torznab:attr element to the field it is parsed into
+TORZNAB_ATTRIBUTES: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "seeders": ("seeders", int),
+    "downloadvolumefactor": ("download_volume_factor", float),
+    "uploadvolumefactor": ("upload_volume_factor", float),
+}
+
+DOWNLOAD_VOLUME_FACTOR_FLAGS = {
+    0: "freeleech",
+    0.25: "freeleech25",
+    0.5: "halfleech",
+    0.75: "freeleech75",
+}
+
+
+def get_flags(download_volume_factor: float, upload_volume_factor: float) -> list[str]:
+    flags = []
+    if download_volume_factor in DOWNLOAD_VOLUME_FACTOR_FLAGS:
+        flags.append(DOWNLOAD_VOLUME_FACTOR_FLAGS[download_volume_factor])
+    if upload_volume_factor == 2:
+        flags.append("doubleupload")
+    return flags
+
+
+def parse_item(item: ET.Element) -> IndexerQueryResult:
+    attributes = {
+        "seeders": 0,
+        "download_volume_factor": 1.0,
+        "upload_volume_factor": 1.0,
+    }
+    for attribute in item.iter(f"{TORZNAB_NAMESPACE}attr"):
+        if mapping := TORZNAB_ATTRIBUTES.get(attribute.get("name")):
+            field, parse = mapping
+            attributes[field] = parse(attribute.get("value"))
+
+    return IndexerQueryResult(
+        title=item.findtext("title"),
+        download_url=item.find("enclosure").attrib["url"],
+        seeders=attributes["seeders"],
+        flags=get_flags(
+            download_volume_factor=attributes["download_volume_factor"],
+            upload_volume_factor=attributes["upload_volume_factor"],
+        ),
+        size=int(item.findtext("size")),
+        usenet=False,  # always False, because Jackett doesn't support usenet
+        age=0,  # always 0 for torrents, as Jackett does not provide age information in a convenient format
+    )
+
+
+def parse_torznab(source: IO[bytes]) -> Iterator[IndexerQueryResult]:
+    """
+    Parses a Torznab feed item by item, without loading the whole document.
+    Processed items are removed from the tree, so memory usage doesn't grow with the size of the response.
+
+    :param source: A binary file-like object containing the feed, e.g. a streamed response body.
+    :return: A generator of the feed's results, items that can't be parsed are skipped.
+    :raises xml.etree.ElementTree.ParseError: If the feed is not well-formed XML.
+    """
+    channel = None
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if element.tag == "channel":
+                channel = element
+            continue
+        if element.tag != "item":
+            continue
+
+        try:
+            yield parse_item(element)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            log.warning(
+                f"Skipping malformed Torznab item {element.findtext('title')}: {e}"
+            )
+        if channel is not None:
+            channel.clear()
@@ -6,6 +6,11 @@ from media_manager.indexer.indexers.jackett import Jackett
 from media_manager.indexer.indexers.prowlarr import Prowlarr
 from media_manager.indexer.schemas import IndexerQueryResultId, IndexerQueryResult
 from media_manager.indexer.repository import IndexerRepository
+from media_manager.metrics.metrics import (
+    INDEXER_SEARCH_DURATION,
+    INDEXER_SEARCH_ERRORS,
+    INDEXER_SEARCH_RESULTS,
+)
 from media_manager.notification.manager import notification_manager
 
 log = logging.getLogger(__name__)
@@ -40,12 +45,17 @@ class IndexerService:
 
         for indexer in self.indexers:
             try:
-                indexer_results = indexer.search(query, is_tv=is_tv)
+                with INDEXER_SEARCH_DURATION.labels(indexer=indexer.name).time():
+                    indexer_results = indexer.search(query, is_tv=is_tv)
+                INDEXER_SEARCH_RESULTS.labels(indexer=indexer.name).observe(
+                    len(indexer_results)
+                )
                 results.extend(indexer_results)
                 log.debug(
                     f"Indexer {indexer.__class__.__name__} returned {len(indexer_results)} results for query: {query}"
                 )
             except Exception as e:
+                INDEXER_SEARCH_ERRORS.labels(indexer=indexer.name).inc()
                 failed_indexers.append(indexer.__class__.__name__)
                 log.error(
                     f"Indexer {indexer.__class__.__name__} failed for query '{query}': {e}"
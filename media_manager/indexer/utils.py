@@ -1,9 +1,17 @@
+import codecs
+import json
 import logging
+from typing import Any, Iterable, Iterator
 
 import requests
 
 from media_manager.config import AllEncompassingConfig
-from media_manager.indexer.config import ScoringRuleSet
+from media_manager.http.client import http_client
+from media_manager.indexer.config import (
+    IndexerFlagScoringRule,
+    ScoringRuleSet,
+    TitleScoringRule,
+)
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.movies.schemas import Movie
 from media_manager.tv.schemas import Show
@@ -12,14 +20,20 @@ log = logging.getLogger(__name__)
 
 
 def evaluate_indexer_query_result(
-    query_result: IndexerQueryResult, ruleset: ScoringRuleSet
+    query_result: IndexerQueryResult,
+    ruleset: ScoringRuleSet,
+    title_rules: list[TitleScoringRule] | None = None,
+    indexer_flag_rules: list[IndexerFlagScoringRule] | None = None,
 ) -> (IndexerQueryResult, bool):
-    title_rules = AllEncompassingConfig().indexers.title_scoring_rules
-    indexer_flag_rules = AllEncompassingConfig().indexers.indexer_flag_scoring_rules
+    # loading the config is expensive, callers that evaluate many results pass the rules in
+    if title_rules is None:
+        title_rules = AllEncompassingConfig().indexers.title_scoring_rules
+    if indexer_flag_rules is None:
+        indexer_flag_rules = AllEncompassingConfig().indexers.indexer_flag_scoring_rules
     for rule_name in ruleset.rule_names:
         for rule in title_rules:
             if rule.name == rule_name:
-                log.debug(f"Applying rule {rule.name} to {query_result.title}")
+                log.debug("Applying rule %s to %s", rule.name, query_result.title)
                 if (
                     any(
                         keyword.lower() in query_result.title.lower()
@@ -28,7 +42,10 @@ def evaluate_indexer_query_result(
                     and not rule.negate
                 ):
                     log.debug(
-                        f"Rule {rule.name} with keywords {rule.keywords} matched for {query_result.title}"
+                        "Rule %s with keywords %s matched for %s",
+                        rule.name,
+                        rule.keywords,
+                        query_result.title,
                     )
                     query_result.score += rule.score_modifier
                 elif (
@@ -39,22 +56,32 @@ def evaluate_indexer_query_result(
                     and rule.negate
                 ):
                     log.debug(
-                        f"Negated rule {rule.name} with keywords {rule.keywords} matched for {query_result.title}"
+                        "Negated rule %s with keywords %s matched for %s",
+                        rule.name,
+                        rule.keywords,
+                        query_result.title,
                     )
                     query_result.score += rule.score_modifier
                 else:
                     log.debug(
-                        f"Rule {rule.name} with keywords {rule.keywords} did not match for {query_result.title}"
+                        "Rule %s with keywords %s did not match for %s",
+                        rule.name,
+                        rule.keywords,
+                        query_result.title,
                     )
         for rule in indexer_flag_rules:
             if rule.name == rule_name:
-                log.debug(f"Applying rule {rule.name} to {query_result.title}")
+                log.debug("Applying rule %s to %s", rule.name, query_result.title)
                 if (
                     any(flag in query_result.flags for flag in rule.flags)
                     and not rule.negate
                 ):
                     log.debug(
-                        f"Rule {rule.name} with flags {rule.flags} matched for {query_result.title} with flags {query_result.flags}"
+                        "Rule %s with flags %s matched for %s with flags %s",
+                        rule.name,
+                        rule.flags,
+                        query_result.title,
+                        query_result.flags,
                     )
                     query_result.score += rule.score_modifier
                 elif (
@@ -62,12 +89,20 @@ def evaluate_indexer_query_result(
                     and rule.negate
                 ):
                     log.debug(
-                        f"Negated rule {rule.name} with flags {rule.flags} matched for {query_result.title} with flags {query_result.flags}"
+                        "Negated rule %s with flags %s matched for %s with flags %s",
+                        rule.name,
+                        rule.flags,
+                        query_result.title,
+                        query_result.flags,
                     )
                     query_result.score += rule.score_modifier
                 else:
                     log.debug(
-                        f"Rule {rule.name} with flags {rule.flags} did not match for {query_result.title} with flags {query_result.flags}"
+                        "Rule %s with flags %s did not match for %s with flags %s",
+                        rule.name,
+                        rule.flags,
+                        query_result.title,
+                        query_result.flags,
                     )
     if query_result.score <= 0:
         return query_result, False
@@ -78,9 +113,8 @@ def evaluate_indexer_query_result(
 def evaluate_indexer_query_results(
     query_results: list[IndexerQueryResult], media: Show | Movie, is_tv: bool
 ) -> list[IndexerQueryResult]:
-    scoring_rulesets: list[ScoringRuleSet] = (
-        AllEncompassingConfig().indexers.scoring_rule_sets
-    )
+    indexer_config = AllEncompassingConfig().indexers
+    scoring_rulesets: list[ScoringRuleSet] = indexer_config.scoring_rule_sets
     for ruleset in scoring_rulesets:
         if (
             (media.library in ruleset.libraries)
@@ -88,22 +122,38 @@ def evaluate_indexer_query_results(
             or ("ALL_MOVIES" in ruleset.libraries and not is_tv)
         ):
             log.debug(
-                f"Applying scoring ruleset {ruleset.name} for {media.name} ({media.year})"
+                "Applying scoring ruleset %s for %s (%s)",
+                ruleset.name,
+                media.name,
+                media.year,
             )
             for result in query_results:
                 log.debug(
-                    f"Applying scoring ruleset {ruleset.name} for IndexerQueryResult {result.title} for {media.name} ({media.year})"
+                    "Applying scoring ruleset %s for IndexerQueryResult %s for %s (%s)",
+                    ruleset.name,
+                    result.title,
+                    media.name,
+                    media.year,
                 )
                 result, passed = evaluate_indexer_query_result(
-                    query_result=result, ruleset=ruleset
+                    query_result=result,
+                    ruleset=ruleset,
+                    title_rules=indexer_config.title_scoring_rules,
+                    indexer_flag_rules=indexer_config.indexer_flag_scoring_rules,
                 )
                 if not passed:
                     log.debug(
-                        f"Indexer query result {result.title} did not pass scoring ruleset {ruleset.name} with score {result.score}, removing from results."
+                        "Indexer query result %s did not pass scoring ruleset %s with score %s, removing from results.",
+                        result.title,
+                        ruleset.name,
+                        result.score,
                     )
                 else:
                     log.debug(
-                        f"Indexer query result {result.title} passed scoring ruleset {ruleset.name} with score {result.score}."
+                        "Indexer query result %s passed scoring ruleset %s with score %s.",
+                        result.title,
+                        ruleset.name,
+                        result.score,
                     )
 
     query_results = [result for result in query_results if result.score >= 0]
@@ -121,7 +171,7 @@ def follow_redirects_to_final_torrent_url(initial_url: str) -> str | None:
     final_url = None
     try:
         while True:
-            response = requests.get(current_url, allow_redirects=False)
+            response = http_client.get(current_url, allow_redirects=False)
 
             if 300 <= response.status_code < 400:
                 redirect_url = response.headers.get("Location")
@@ -165,3 +215,46 @@ def follow_redirects_to_final_torrent_url(initial_url: str) -> str | None:
         )
 
     return final_url
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Decodes the elements of a UTF-8 encoded JSON array one by one while the chunks are read,
+    so only the current element has to be kept in memory instead of the whole document.
+
+    :param chunks: The JSON document in chunks of bytes, e.g. from requests' Response.iter_content().
+    :return: A generator of the array's decoded elements.
+    :raises ValueError: If the document is not a JSON array or ends prematurely.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    array_started = False
+
+    for chunk in chunks:
+        buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\n\r,":
+                position += 1
+            if position == len(buffer):
+                break
+            if not array_started:
+                if buffer[position] != "[":
+                    raise ValueError("Expected a JSON array")
+                array_started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+            try:
+                element, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                break  # the element is incomplete, read the next chunk
+            if end == len(buffer) and not isinstance(element, (dict, list)):
+                break  # a number or literal could continue in the next chunk
+            yield element
+            position = end
+
+    raise ValueError("Unexpected end of JSON array")
@@ -0,0 +1,6 @@
+from pydantic_settings import BaseSettings
+
+
+class JobsConfig(BaseSettings):
+    retention_days: int = 30  # runs of scheduled jobs older than this are deleted
+    run_in_api: bool = True  # run scheduled jobs in the API processes too, disable this if you run workers
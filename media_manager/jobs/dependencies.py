@@ -0,0 +1,22 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from media_manager.database import DbSessionDependency
+from media_manager.jobs.repository import JobRepository
+from media_manager.jobs.scheduler import scheduler
+from media_manager.jobs.service import JobService
+
+
+def get_job_repository(db_session: DbSessionDependency) -> JobRepository:
+    return JobRepository(db_session)
+
+
+job_repository_dep = Annotated[JobRepository, Depends(get_job_repository)]
+
+
+def get_job_service(job_repository: job_repository_dep) -> JobService:
+    return JobService(job_repository=job_repository, scheduler=scheduler)
+
+
+job_service_dep = Annotated[JobService, Depends(get_job_service)]
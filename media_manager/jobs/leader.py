@@ -0,0 +1,104 @@
+import threading
+from typing import Callable
+
+from apscheduler.schedulers.base import BaseScheduler
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from media_manager.database import engine
+from media_manager.database.broadcast import broadcast
+from media_manager.jobs import log
+from media_manager.jobs.service import get_lock_key
+
+LEADER_LOCK = "scheduler-leader"
+
+
+class SchedulerLeader:
+    """
+    Runs the scheduled jobs in only one process at a time, no matter how many processes share the database.
+
+    All processes start their scheduler paused and compete for a Postgres advisory lock, the one that holds it adds the
+    jobs and resumes its scheduler. The others check every interval seconds whether the lock became free, e.g.
+    because the leader stopped or lost its database connection, and take over.
+    Jobs triggered through the API of another process are picked up by the leader when it receives their broadcast,
+    or at its next check at the latest.
+    Like run_job's lock, the lock is bound to a transaction on a dedicated connection, so it works behind pgbouncer in
+    transaction mode too.
+    """
+
+    def __init__(
+        self,
+        scheduler: BaseScheduler,
+        add_jobs: Callable[[BaseScheduler], None],
+        interval: float = 5,
+    ):
+        self.scheduler = scheduler
+        self.add_jobs = add_jobs
+        self.interval = interval
+        self._connection: Connection | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="scheduler-leader", daemon=True
+        )
+
+    @property
+    def is_leader(self) -> bool:
+        return self._connection is not None
+
+    def start(self) -> None:
+        broadcast.subscribe("jobs", self._wake_up)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=self.interval + 5)
+
+    def _wake_up(self, job_id: str) -> None:
+        if self.is_leader:
+            log.debug(f"Job {job_id} was triggered by another process")
+            self.scheduler.wakeup()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self.is_leader:
+                    # fails if the connection, and with it the lock, was lost
+                    self._connection.execute(text("SELECT 1"))
+                    # in case the broadcast of a job triggered by another process was missed
+                    self.scheduler.wakeup()
+                else:
+                    self._try_to_lead()
+            except Exception as e:
+                log.error(f"Error while checking the scheduler leadership: {e}")
+                self._step_down()
+            self._stop.wait(self.interval)
+        self._step_down()
+
+    def _try_to_lead(self) -> None:
+        connection = engine.connect()
+        try:
+            acquired = connection.execute(
+                text("SELECT pg_try_advisory_xact_lock(:key)"),
+                {"key": get_lock_key(LEADER_LOCK)},
+            ).scalar_one()
+        except SQLAlchemyError:
+            connection.close()
+            raise
+        if not acquired:
+            connection.close()
+            return
+        self._connection = connection
+        self.add_jobs(self.scheduler)
+        self.scheduler.resume()
+        log.info("This process runs the scheduled jobs now")
+
+    def _step_down(self) -> None:
+        if self._connection is None:
+            return
+        self.scheduler.pause()
+        try:
+            self._connection.close()
+        except SQLAlchemyError as e:
+            log.warning(f"Error while releasing the scheduler leadership: {e}")
+        self._connection = None
+        log.info("This process stopped running the scheduled jobs")
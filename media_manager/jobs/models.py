@@ -0,0 +1,21 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from media_manager.database import Base
+from media_manager.jobs.schemas import JobRunOutcome
+
+
+class JobRun(Base):
+    __tablename__ = "job_run"
+    __table_args__ = (Index("ix_job_run_job_id_started_at", "job_id", "started_at"),)
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    job_id: Mapped[str]
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime)
+    duration: Mapped[float | None]
+    outcome: Mapped[JobRunOutcome]
+    error: Mapped[str | None]
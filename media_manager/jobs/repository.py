@@ -0,0 +1,81 @@
+import logging
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from media_manager.jobs.models import JobRun
+from media_manager.jobs.schemas import JobRun as JobRunSchema
+
+log = logging.getLogger(__name__)
+
+
+class JobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def save_job_run(self, job_run: JobRunSchema) -> None:
+        """
+        Inserts the run or updates it if it already exists.
+        """
+        self.db.merge(JobRun(**job_run.model_dump()))
+        self.db.commit()
+
+    def get_job_runs(self, job_id: str, limit: int) -> list[JobRunSchema]:
+        """
+        Retrieve the runs of a job, newest first.
+
+        :param job_id: The ID of the job.
+        :param limit: The maximum number of runs to return.
+        :return: A list of runs.
+        :raises SQLAlchemyError: If a database error occurs.
+        """
+        try:
+            stmt = (
+                select(JobRun)
+                .where(JobRun.job_id == job_id)
+                .order_by(JobRun.started_at.desc())
+                .limit(limit)
+            )
+            return [
+                JobRunSchema.model_validate(job_run)
+                for job_run in self.db.execute(stmt).scalars().all()
+            ]
+        except SQLAlchemyError as e:
+            log.error(f"Database error while retrieving runs of job {job_id}: {e}")
+            raise
+
+    def get_last_job_runs(self) -> dict[str, JobRunSchema]:
+        """
+        Retrieve the latest run of every job.
+
+        :return: The latest run of every job that ran at least once, by job ID.
+        :raises SQLAlchemyError: If a database error occurs.
+        """
+        try:
+            stmt = (
+                select(JobRun)
+                .distinct(JobRun.job_id)
+                .order_by(JobRun.job_id, JobRun.started_at.desc())
+            )
+            return {
+                job_run.job_id: JobRunSchema.model_validate(job_run)
+                for job_run in self.db.execute(stmt).scalars().all()
+            }
+        except SQLAlchemyError as e:
+            log.error(f"Database error while retrieving the last job runs: {e}")
+            raise
+
+    def delete_job_runs_older_than(self, timestamp: datetime) -> int:
+        """
+        Delete all runs that started before the given timestamp.
+
+        :param timestamp: The cutoff timestamp.
+        :return: The number of deleted runs.
+        """
+        stmt = delete(JobRun).where(JobRun.started_at < timestamp)
+        result = self.db.execute(stmt)
+        self.db.commit()
+        log.info(f"Deleted {result.rowcount} job runs older than {timestamp}.")
+        return result.rowcount
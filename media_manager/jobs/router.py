@@ -0,0 +1,50 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+
+from media_manager.auth.users import current_superuser
+from media_manager.jobs.dependencies import job_service_dep
+from media_manager.jobs.schemas import Job, JobRun
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    dependencies=[Depends(current_superuser)],
+    response_model=list[Job],
+)
+def get_jobs(job_service: job_service_dep):
+    """
+    Get all scheduled jobs with their next and their last run.
+    """
+    return job_service.get_jobs()
+
+
+@router.get(
+    "/{job_id}/runs",
+    dependencies=[Depends(current_superuser)],
+    response_model=list[JobRun],
+)
+def get_job_runs(
+    job_service: job_service_dep,
+    job_id: str,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+):
+    """
+    Get the runs of a job, newest first.
+    """
+    return job_service.get_job_runs(job_id=job_id, limit=limit)
+
+
+@router.post(
+    "/{job_id}/run",
+    dependencies=[Depends(current_superuser)],
+    response_model=Job,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def trigger_job(job_service: job_service_dep, job_id: str):
+    """
+    Run a job now. It runs in the background, its run shows up in the job's runs.
+    """
+    return job_service.trigger_job(job_id=job_id)
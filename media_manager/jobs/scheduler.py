@@ -0,0 +1,14 @@
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from media_manager.database import engine
+
+jobstores = {"default": SQLAlchemyJobStore(engine=engine)}
+
+# runs that were missed while a job was still running are coalesced into one and a job never runs twice at the same
+# time in this process, run_job's advisory lock does the same across replicas.
+# A job triggered through the API of another process is only noticed by the leader when it wakes up, which can be
+# long after the triggered run time, so late runs are never dropped as misfired.
+job_defaults = {"coalesce": True, "max_instances": 1, "misfire_grace_time": None}
+
+scheduler = BackgroundScheduler(jobstores=jobstores, job_defaults=job_defaults)
@@ -0,0 +1,37 @@
+import typing
+import uuid
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+JobRunId = typing.NewType("JobRunId", UUID)
+
+
+class JobRunOutcome(Enum):
+    running = "running"
+    success = "success"
+    failed = "failed"
+    skipped = "skipped"  # another instance of the job was running, possibly on another replica
+
+
+class JobRun(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: JobRunId = Field(default_factory=uuid.uuid4)
+    job_id: str
+    started_at: datetime = Field(default_factory=datetime.now)
+    finished_at: datetime | None = None
+    duration: float | None = Field(None, description="Duration of the run in seconds")
+    outcome: JobRunOutcome = JobRunOutcome.running
+    error: str | None = None
+
+
+class Job(BaseModel):
+    id: str
+    trigger: str = Field(description="When the job runs, e.g. cron[minute='*/15']")
+    next_run_time: datetime | None = Field(
+        None, description="Null if the job is paused"
+    )
+    last_run: JobRun | None = None
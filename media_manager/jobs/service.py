@@ -0,0 +1,141 @@
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Iterator
+
+from apscheduler.schedulers.base import BaseScheduler
+from sqlalchemy import text
+
+from media_manager.config import AllEncompassingConfig
+from media_manager.database import engine, get_session
+from media_manager.database.broadcast import broadcast
+from media_manager.exceptions import NotFoundError
+from media_manager.jobs import log
+from media_manager.jobs.repository import JobRepository
+from media_manager.jobs.schemas import Job, JobRun, JobRunOutcome
+
+
+class JobService:
+    def __init__(self, job_repository: JobRepository, scheduler: BaseScheduler):
+        self.job_repository = job_repository
+        self.scheduler = scheduler
+
+    def get_jobs(self) -> list[Job]:
+        last_runs = self.job_repository.get_last_job_runs()
+        return [
+            Job(
+                id=job.id,
+                trigger=str(job.trigger),
+                next_run_time=job.next_run_time,
+                last_run=last_runs.get(job.id),
+            )
+            for job in self.scheduler.get_jobs()
+        ]
+
+    def get_job(self, job_id: str) -> Job:
+        for job in self.get_jobs():
+            if job.id == job_id:
+                return job
+        raise NotFoundError(f"Job {job_id} does not exist.")
+
+    def get_job_runs(self, job_id: str, limit: int) -> list[JobRun]:
+        self.get_job(job_id=job_id)
+        return self.job_repository.get_job_runs(job_id=job_id, limit=limit)
+
+    def trigger_job(self, job_id: str) -> Job:
+        """
+        Schedules the job to run now, its regular schedule is not affected.
+        If the job is running already, this run is skipped.
+        """
+        if self.scheduler.get_job(job_id) is None:
+            raise NotFoundError(f"Job {job_id} does not exist.")
+        self.scheduler.modify_job(
+            job_id, next_run_time=datetime.now(self.scheduler.timezone)
+        )
+        # the scheduler of this process may be paused, wake up the leader so it runs the job right away
+        broadcast.send("jobs", job_id)
+        log.info(f"Triggered job {job_id}")
+        return self.get_job(job_id=job_id)
+
+
+def get_lock_key(job_id: str) -> int:
+    # advisory locks are identified by a bigint, crc32 is stable across processes unlike hash()
+    return zlib.crc32(f"media_manager.jobs:{job_id}".encode())
+
+
+@contextmanager
+def job_lock(job_id: str) -> Iterator[bool]:
+    """
+    Takes a Postgres advisory lock for the job, yields whether it was acquired.
+    The lock is bound to a transaction on a dedicated connection, so it works behind pgbouncer in transaction mode
+    too, and it is released when the connection is returned to the pool.
+    """
+    with engine.connect() as connection:
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"),
+            {"key": get_lock_key(job_id)},
+        ).scalar_one()
+        yield acquired
+
+
+def save_job_run(job_run: JobRun) -> None:
+    with next(get_session()) as db:
+        JobRepository(db=db).save_job_run(job_run=job_run)
+
+
+def run_job(job_id: str, function: Callable[[], None]) -> None:
+    """
+    Runs the function of a scheduled job and records the run, unless the job is running already on any replica.
+    This is a standalone function as it creates its own DB session.
+    """
+    with job_lock(job_id) as acquired:
+        job_run = JobRun(job_id=job_id)
+        if not acquired:
+            log.info(f"Skipping job {job_id}, it is running already")
+            job_run.outcome = JobRunOutcome.skipped
+            job_run.finished_at = job_run.started_at
+            job_run.duration = 0
+            save_job_run(job_run)
+            return
+
+        save_job_run(job_run)
+        start = time.perf_counter()
+        try:
+            function()
+            job_run.outcome = JobRunOutcome.success
+        except Exception as e:
+            job_run.outcome = JobRunOutcome.failed
+            job_run.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            job_run.duration = time.perf_counter() - start
+            job_run.finished_at = datetime.now()
+            save_job_run(job_run)
+
+
+def schedule_job(
+    scheduler: BaseScheduler, job_id: str, function: Callable[[], None], trigger
+) -> None:
+    """
+    Adds a job that runs the function through run_job, replacing a stored job with the same ID.
+    The function must be importable by its module and name, because the job store persists the reference to it.
+    """
+    scheduler.add_job(
+        run_job,
+        trigger,
+        id=job_id,
+        kwargs={"job_id": job_id, "function": function},
+        replace_existing=True,
+    )
+
+
+def delete_old_job_runs() -> None:
+    """
+    Deletes all job runs older than jobs.retention_days.
+    This is a standalone function as it creates its own DB session.
+    """
+    retention_days = AllEncompassingConfig().jobs.retention_days
+    cutoff = datetime.now() - timedelta(days=retention_days)
+    with next(get_session()) as db:
+        JobRepository(db=db).delete_job_runs_older_than(cutoff)
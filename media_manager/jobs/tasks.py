@@ -0,0 +1,93 @@
+from apscheduler.schedulers.base import BaseScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from media_manager.config import AllEncompassingConfig
+from media_manager.database import get_session
+from media_manager.jobs import log
+from media_manager.jobs.service import delete_old_job_runs, schedule_job
+from media_manager.movies.service import (
+    auto_download_all_approved_movie_requests,
+    import_all_movie_torrents,
+    update_all_movies_metadata,
+)
+from media_manager.notification.service import delete_old_notifications
+from media_manager.torrent.repository import TorrentRepository
+from media_manager.torrent.service import (
+    TorrentService,
+    refresh_all_torrent_statuses,
+)
+from media_manager.tv.service import (
+    auto_download_all_approved_season_requests,
+    import_all_show_torrents,
+    update_all_non_ended_shows_metadata,
+)
+
+
+def import_all_torrents() -> None:
+    """
+    Imports all finished torrents of shows and movies, the status of the torrents is fetched from the download
+    clients once for both.
+    This is a standalone function as it creates its own DB session.
+    """
+    with next(get_session()) as db:
+        torrents = TorrentService(
+            torrent_repository=TorrentRepository(db=db)
+        ).get_all_torrents()
+    log.info(f"Fetched the status of {len(torrents)} torrents for the import")
+    import_all_show_torrents(torrents=torrents)
+    import_all_movie_torrents(torrents=torrents)
+
+
+def add_jobs(scheduler: BaseScheduler) -> None:
+    """
+    Adds all scheduled jobs to the scheduler, replacing the stored ones.
+    """
+    config = AllEncompassingConfig()
+    every_15_minutes_trigger = CronTrigger(minute="*/15", hour="*")
+    daily_trigger = CronTrigger(hour=0, minute=0, jitter=60 * 60 * 24 * 2)
+    weekly_trigger = CronTrigger(
+        day_of_week="mon", hour=0, minute=0, jitter=60 * 60 * 24 * 2
+    )
+
+    schedule_job(
+        scheduler, "import_all_torrents", import_all_torrents, every_15_minutes_trigger
+    )
+    schedule_job(
+        scheduler,
+        "auto_download_all_approved_season_requests",
+        auto_download_all_approved_season_requests,
+        daily_trigger,
+    )
+    schedule_job(
+        scheduler,
+        "auto_download_all_approved_movie_requests",
+        auto_download_all_approved_movie_requests,
+        daily_trigger,
+    )
+    schedule_job(
+        scheduler,
+        "refresh_all_torrent_statuses",
+        refresh_all_torrent_statuses,
+        IntervalTrigger(seconds=config.torrents.status_refresh_interval),
+    )
+    schedule_job(
+        scheduler, "delete_old_notifications", delete_old_notifications, daily_trigger
+    )
+    schedule_job(scheduler, "delete_old_job_runs", delete_old_job_runs, daily_trigger)
+    schedule_job(
+        scheduler,
+        "update_all_movies_metadata",
+        update_all_movies_metadata,
+        weekly_trigger,
+    )
+    schedule_job(
+        scheduler,
+        "update_all_non_ended_shows_metadata",
+        update_all_non_ended_shows_metadata,
+        weekly_trigger,
+    )
+    # the movie and show imports were merged into import_all_torrents, remove them from the job store
+    for job_id in ("import_all_movie_torrents", "import_all_show_torrents"):
+        if scheduler.get_job(job_id) is not None:
+            scheduler.remove_job(job_id)
@@ -0,0 +1,65 @@
+"""
+Logging setup of MediaManager.
+
+Log records are only put into a queue by the thread that logs them. A QueueListener thread formats them and writes
+them to the console and the rotating JSON log file, so requests and jobs don't wait for formatting and file I/O.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from pythonjsonlogger.json import JsonFormatter
+
+from media_manager.config import AllEncompassingConfig
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(funcName)s(): %(message)s"
+LOG_FILE = "./log.txt"
+
+# these loggers are configured with their own handlers by uvicorn, their records are sent through the queue as well
+THIRD_PARTY_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access", "fastapi")
+
+_listener: QueueListener | None = None
+
+
+def setup_logging() -> None:
+    """
+    Routes all log records through a queue to the console and the log file, the level is set by misc.log_level.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    file_handler = RotatingFileHandler(LOG_FILE, maxBytes=10485760, backupCount=5)
+    file_handler.setFormatter(JsonFormatter())
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, console_handler, file_handler)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(AllEncompassingConfig().misc.log_level)
+
+    for name in THIRD_PARTY_LOGGERS:
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.setLevel(logging.NOTSET)
+        logger.propagate = True
+
+
+def shutdown_logging() -> None:
+    """
+    Writes all queued log records and stops the listener thread.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,69 +1,49 @@
 import logging
 import os
-import sys
-from logging.config import dictConfig
 from pathlib import Path
 
 from psycopg.errors import UniqueViolation
-from pythonjsonlogger.json import JsonFormatter
 from sqlalchemy.exc import IntegrityError
 
-LOGGING_CONFIG = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "default": {
-            "format": "%(asctime)s - %(levelname)s - %(name)s - %(funcName)s(): %(message)s"
-        },
-        "json": {
-            "()": JsonFormatter,
-        },
-    },
-    "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "default",
-            "stream": sys.stdout,
-        },
-        "file": {
-            "class": "logging.handlers.RotatingFileHandler",
-            "formatter": "json",
-            "filename": "./log.txt",
-            "maxBytes": 10485760,
-            "backupCount": 5,
-        },
-    },
-    "loggers": {
-        "uvicorn": {"handlers": ["console", "file"], "level": "DEBUG"},
-        "uvicorn.access": {"handlers": ["console", "file"], "level": "DEBUG"},
-        "fastapi": {"handlers": ["console", "file"], "level": "DEBUG"},
-    },
-}
-dictConfig(LOGGING_CONFIG)
-
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(name)s - %(funcName)s(): %(message)s",
-    stream=sys.stdout,
-)
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.logging_config import setup_logging
+
+setup_logging()
 log = logging.getLogger(__name__)
 
 from media_manager.database import init_db  # noqa: E402
+from media_manager.concurrency import configure_default_thread_limiter  # noqa: E402
 from media_manager.config import AllEncompassingConfig  # noqa: E402
 import media_manager.torrent.router as torrent_router  # noqa: E402
 import media_manager.movies.router as movies_router  # noqa: E402
 import media_manager.tv.router as tv_router  # noqa: E402
+from media_manager.jobs.router import router as jobs_router  # noqa: E402
+from media_manager.jobs.scheduler import scheduler  # noqa: E402
+from media_manager.jobs.leader import SchedulerLeader  # noqa: E402
+from media_manager.jobs.tasks import add_jobs, import_all_torrents  # noqa: E402
+from media_manager.database.broadcast import broadcast  # noqa: E402
 from media_manager.tv.service import (  # noqa: E402
     auto_download_all_approved_season_requests,
-    import_all_show_torrents,
     update_all_non_ended_shows_metadata,
 )
 from media_manager.movies.service import (  # noqa: E402
-    import_all_movie_torrents,
     update_all_movies_metadata,
-    auto_download_all_approved_movie_requests,
 )
 from media_manager.notification.router import router as notification_router  # noqa: E402
+from media_manager.events.router import router as events_router  # noqa: E402
+from media_manager.metrics.collectors import register_collectors  # noqa: E402
+from media_manager.metrics.metrics import (  # noqa: E402
+    PrometheusMiddleware,
+    instrument_scheduler,
+)
+from media_manager.metrics.profiling import (  # noqa: E402
+    ProfilingMiddleware,
+    instrument_engine,
+)
+from media_manager.metrics.router import router as metrics_router  # noqa: E402
+from media_manager.images.router import router as images_router  # noqa: E402
+from media_manager.notification.manager import notification_manager  # noqa: E402
+from media_manager.images.transcoder import image_transcoder  # noqa: E402
 import uvicorn  # noqa: E402
 from fastapi.staticfiles import StaticFiles  # noqa: E402
 from media_manager.auth.users import openid_client  # noqa: E402
@@ -90,10 +70,8 @@ from media_manager.exceptions import (  # noqa: E402
     sqlalchemy_integrity_error_handler,
 )
 
-from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore  # noqa: E402
 from starlette.responses import FileResponse, RedirectResponse  # noqa: E402
 
-import media_manager.database  # noqa: E402
 import shutil  # noqa: E402
 from fastapi import FastAPI, APIRouter  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
@@ -101,8 +79,6 @@ from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware  # noqa: E40
 from starlette.responses import Response  # noqa: E402
 from datetime import datetime  # noqa: E402
 from contextlib import asynccontextmanager  # noqa: E402
-from apscheduler.schedulers.background import BackgroundScheduler  # noqa: E402
-from apscheduler.triggers.cron import CronTrigger  # noqa: E402
 
 init_db()
 log.info("Database initialized")
@@ -117,8 +93,7 @@ else:
 def hourly_tasks():
     log.info(f"Hourly tasks are running at {datetime.now()}")
     auto_download_all_approved_season_requests()
-    import_all_show_torrents()
-    import_all_movie_torrents()
+    import_all_torrents()
 
 
 def weekly_tasks():
@@ -127,61 +102,34 @@ def weekly_tasks():
     update_all_movies_metadata()
 
 
-jobstores = {"default": SQLAlchemyJobStore(engine=media_manager.database.engine)}
-
-scheduler = BackgroundScheduler(jobstores=jobstores)
-every_15_minutes_trigger = CronTrigger(minute="*/15", hour="*")
-daily_trigger = CronTrigger(hour=0, minute=0, jitter=60 * 60 * 24 * 2)
-weekly_trigger = CronTrigger(
-    day_of_week="mon", hour=0, minute=0, jitter=60 * 60 * 24 * 2
+instrument_scheduler(scheduler)
+# the scheduler only runs jobs while this process is the leader, paused it still serves the jobs API
+scheduler.start(paused=True)
+scheduler_leader = (
+    SchedulerLeader(scheduler=scheduler, add_jobs=add_jobs)
+    if config.jobs.run_in_api
+    else None
 )
-
-scheduler.add_job(
-    import_all_movie_torrents,
-    every_15_minutes_trigger,
-    id="import_all_movie_torrents",
-    replace_existing=True,
-)
-scheduler.add_job(
-    import_all_show_torrents,
-    every_15_minutes_trigger,
-    id="import_all_show_torrents",
-    replace_existing=True,
-)
-scheduler.add_job(
-    auto_download_all_approved_season_requests,
-    daily_trigger,
-    id="auto_download_all_approved_season_requests",
-    replace_existing=True,
-)
-scheduler.add_job(
-    auto_download_all_approved_movie_requests,
-    daily_trigger,
-    id="auto_download_all_approved_movie_requests",
-    replace_existing=True,
-)
-scheduler.add_job(
-    update_all_movies_metadata,
-    weekly_trigger,
-    id="update_all_movies_metadata",
-    replace_existing=True,
-)
-scheduler.add_job(
-    update_all_non_ended_shows_metadata,
-    weekly_trigger,
-    id="update_all_non_ended_shows_metadata",
-    replace_existing=True,
-)
-scheduler.start()
+if scheduler_leader is None:
+    log.info("Scheduled jobs are not run in the API process")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Create default admin user if needed
+    configure_default_thread_limiter()
     await create_default_admin_user()
+    broadcast.start()
+    if scheduler_leader is not None:
+        scheduler_leader.start()
     yield
     # Shutdown
+    if scheduler_leader is not None:
+        scheduler_leader.stop()
     scheduler.shutdown()
+    broadcast.stop()
+    image_transcoder.shutdown()
+    notification_manager.shutdown()
 
 
 BASE_PATH = os.getenv("BASE_PATH", "")
@@ -190,6 +138,21 @@ FRONTEND_FILES_DIR = os.getenv("FRONTEND_FILES_DIR")
 
 app = FastAPI(lifespan=lifespan, root_path=BASE_PATH)
 app.add_middleware(ProxyHeadersMiddleware, trusted_hosts="*")
+if config.metrics.enabled:
+    # the event stream stays open as long as the client is connected
+    app.add_middleware(PrometheusMiddleware, excluded_routes=["/api/v1/events"])
+if config.metrics.profiling:
+    log.warning("Request profiling activated!")
+    instrument_engine(media_manager.database.engine)
+    instrument_engine(media_manager.database.async_engine.sync_engine)
+    app.add_middleware(
+        ProfilingMiddleware,
+        slow_request_threshold=config.metrics.slow_request_threshold,
+        repeated_query_threshold=config.metrics.repeated_query_threshold,
+        sample_rate=config.metrics.profiler_sample_rate,
+        sample_interval=config.metrics.profiler_interval,
+        profile_directory=config.metrics.profile_directory,
+    )
 
 origins = config.misc.cors_urls
 log.info("CORS URLs activated for following origins:")
@@ -286,14 +249,15 @@ api_app.include_router(movies_router.router, prefix="/movies", tags=["movie"])
 api_app.include_router(
     notification_router, prefix="/notification", tags=["notification"]
 )
+api_app.include_router(images_router, prefix="/static/image", tags=["images"])
+api_app.include_router(events_router, prefix="/events", tags=["events"])
+api_app.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
 
-app.mount(
-    "/api/v1/static/image",
-    StaticFiles(directory=config.misc.image_directory),
-    name="static-images",
-)
 
 app.include_router(api_app)
+if config.metrics.enabled:
+    register_collectors()
+    app.include_router(metrics_router, prefix="/metrics")
 app.mount("/web", StaticFiles(directory=FRONTEND_FILES_DIR, html=True), name="frontend")
 
 # ----------------------------
@@ -404,7 +368,7 @@ if __name__ == "__main__":
         app,
         host="127.0.0.1",
         port=5049,
-        log_config=LOGGING_CONFIG,
+        log_config=None,
         proxy_headers=True,
         forwarded_allow_ips="*",
     )
@@ -0,0 +1,191 @@
+"""
+Cache for responses of the metadata relay, so searches, trending lists and show/movie details
+don't hit the relay on every request.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Literal
+
+from cachetools import LRUCache
+
+from media_manager.config import AllEncompassingConfig
+
+log = logging.getLogger(__name__)
+
+CacheKind = Literal["search", "trending", "details"]
+
+revalidating: ContextVar[bool] = ContextVar("revalidating", default=False)
+
+
+class SqliteCacheTier:
+    """
+    Persists cached responses to a SQLite file, so they survive restarts.
+    """
+
+    def __init__(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            self._connection.commit()
+
+    def get(self, key: str) -> tuple[Any, float] | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, fetched_at FROM metadata_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any, fetched_at: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO metadata_cache (key, value, fetched_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), fetched_at),
+            )
+            self._connection.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM metadata_cache")
+            self._connection.commit()
+
+
+class MetadataCache:
+    """
+    Two tiered cache (in-memory LRU, optionally SQLite) with per-kind TTLs and stale-while-revalidate.
+    Fresh entries are returned directly, stale entries are returned and refreshed in the background,
+    expired entries are fetched synchronously.
+    """
+
+    def __init__(self):
+        self.config = AllEncompassingConfig().metadata.cache
+        self._memory: LRUCache = LRUCache(maxsize=self.config.max_entries)
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="metadata-cache-refresh"
+        )
+        self._disk: SqliteCacheTier | None = None
+        if self.config.enabled and self.config.sqlite_path is not None:
+            try:
+                self._disk = SqliteCacheTier(self.config.sqlite_path)
+                log.info(f"Persisting metadata cache to {self.config.sqlite_path}")
+            except sqlite3.Error as e:
+                log.error(
+                    f"Could not open metadata cache file {self.config.sqlite_path}, only caching in memory: {e}"
+                )
+
+    @staticmethod
+    def make_key(provider: str, endpoint: str, params: dict | None = None) -> str:
+        return f"{provider}:{endpoint}:{json.dumps(params or {}, sort_keys=True)}"
+
+    def _get_ttl(self, kind: CacheKind) -> int:
+        if kind == "search":
+            return self.config.search_ttl
+        elif kind == "trending":
+            return self.config.trending_ttl
+        return self.config.details_ttl
+
+    def _lookup(self, key: str) -> tuple[Any, float] | None:
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is None and self._disk is not None:
+            entry = self._disk.get(key)
+            if entry is not None:
+                with self._lock:
+                    self._memory[key] = entry
+        return entry
+
+    def _store(self, key: str, value: Any) -> None:
+        fetched_at = time.time()
+        with self._lock:
+            self._memory[key] = (value, fetched_at)
+        if self._disk is not None:
+            try:
+                self._disk.set(key, value, fetched_at)
+            except sqlite3.Error as e:
+                log.error(f"Could not persist metadata cache entry {key}: {e}")
+
+    def _refresh(self, key: str, fetch: Callable[[], Any]) -> None:
+        try:
+            self._store(key, fetch())
+            log.debug(f"Refreshed stale metadata cache entry {key}")
+        except Exception as e:
+            log.warning(f"Failed to refresh stale metadata cache entry {key}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get_or_fetch(
+        self,
+        provider: str,
+        endpoint: str,
+        fetch: Callable[[], Any],
+        kind: CacheKind,
+        params: dict | None = None,
+    ) -> Any:
+        """
+        Returns the cached response for the given provider, endpoint and params, calling fetch if necessary.
+
+        :param provider: The name of the metadata provider.
+        :param endpoint: The relay endpoint, e.g. "tv/search".
+        :param fetch: Fetches the response from the relay, exceptions are not cached.
+        :param kind: Determines the TTL of the response.
+        :param params: The parameters of the request.
+        :return: The (possibly cached) response.
+        """
+        if not self.config.enabled:
+            return fetch()
+
+        key = self.make_key(provider=provider, endpoint=endpoint, params=params)
+        entry = None if revalidating.get() else self._lookup(key)
+        if entry is not None:
+            value, fetched_at = entry
+            age = time.time() - fetched_at
+            ttl = self._get_ttl(kind)
+            if age < ttl:
+                return value
+            if age < ttl + self.config.stale_while_revalidate:
+                with self._lock:
+                    refresh = key not in self._refreshing
+                    self._refreshing.add(key)
+                if refresh:
+                    self._refresh_executor.submit(self._refresh, key, fetch)
+                return value
+
+        value = fetch()
+        self._store(key, value)
+        return value
+
+    @contextmanager
+    def revalidate(self) -> Iterator[None]:
+        """
+        Responses are fetched from the relay within this context, even if they are cached, and the cache is updated.
+        Use it to refresh the metadata of the library, which must not be up to details_ttl + stale_while_revalidate old.
+        """
+        token = revalidating.set(True)
+        try:
+            yield
+        finally:
+            revalidating.reset(token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+
+metadata_cache = MetadataCache()
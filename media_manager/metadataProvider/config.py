@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from pydantic_settings import BaseSettings
 
 
@@ -9,6 +11,24 @@ class TvdbConfig(BaseSettings):
     tvdb_relay_url: str = "https://metadata-relay.maxid.me/tvdb"
 
 
+class MetadataCacheConfig(BaseSettings):
+    enabled: bool = True
+    max_entries: int = 4096  # size of the in-memory tier, least recently used entries are evicted first
+
+    # seconds until a cached response is considered stale
+    search_ttl: int = 60 * 10
+    trending_ttl: int = 60 * 60
+    details_ttl: int = 60 * 60 * 24
+
+    # seconds a stale response may still be served while it is refreshed in the background
+    stale_while_revalidate: int = 60 * 60 * 24
+
+    sqlite_path: Path | None = (
+        None  # if set, responses are also persisted to this SQLite file
+    )
+
+
 class MetadataProviderConfig(BaseSettings):
     tvdb: TvdbConfig = TvdbConfig()
     tmdb: TmdbConfig = TmdbConfig()
+    cache: MetadataCacheConfig = MetadataCacheConfig()
@@ -4,6 +4,8 @@ import requests
 
 import media_manager.metadataProvider.utils
 from media_manager.config import AllEncompassingConfig
+from media_manager.http.client import http_client
+from media_manager.metadataProvider.cache import metadata_cache
 from media_manager.metadataProvider.abstractMetaDataProvider import (
     AbstractMetadataProvider,
 )
@@ -25,11 +27,21 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
         config = AllEncompassingConfig().metadata.tmdb
         self.url = config.tmdb_relay_url
 
+    @staticmethod
+    def __get(url: str, params: dict | None = None) -> dict:
+        response = http_client.get(url=url, params=params)
+        response.raise_for_status()
+        return response.json()
+
     def __get_show_metadata(self, id: int) -> dict:
         try:
-            response = requests.get(url=f"{self.url}/tv/shows/{id}")
-            response.raise_for_status()
-            return response.json()
+            return metadata_cache.get_or_fetch(
+                provider=self.name,
+                endpoint="tv/shows",
+                params={"id": id},
+                kind="details",
+                fetch=lambda: self.__get(url=f"{self.url}/tv/shows/{id}"),
+            )
         except requests.RequestException as e:
             log.error(f"TMDB API error getting show metadata for ID {id}: {e}")
             if notification_manager.is_configured():
@@ -41,11 +53,15 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
 
     def __get_season_metadata(self, show_id: int, season_number: int) -> dict:
         try:
-            response = requests.get(
-                url=f"{self.url}/tv/shows/{show_id}/{season_number}"
+            return metadata_cache.get_or_fetch(
+                provider=self.name,
+                endpoint="tv/seasons",
+                params={"show_id": show_id, "season_number": season_number},
+                kind="details",
+                fetch=lambda: self.__get(
+                    url=f"{self.url}/tv/shows/{show_id}/{season_number}"
+                ),
             )
-            response.raise_for_status()
-            return response.json()
         except requests.RequestException as e:
             log.error(
                 f"TMDB API error getting season {season_number} metadata for show ID {show_id}: {e}"
@@ -59,11 +75,14 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
 
     def __search_tv(self, query: str, page: int) -> dict:
         try:
-            response = requests.get(
-                url=f"{self.url}/tv/search", params={"query": query, "page": page}
+            params = {"query": query, "page": page}
+            return metadata_cache.get_or_fetch(
+                provider=self.name,
+                endpoint="tv/search",
+                params=params,
+                kind="search",
+                fetch=lambda: self.__get(url=f"{self.url}/tv/search", params=params),
             )
-            response.raise_for_status()
-            return response.json()
         except requests.RequestException as e:
             log.error(f"TMDB API error searching TV shows with query '{query}': {e}")
             if notification_manager.is_configured():
@@ -75,9 +94,12 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
 
     def __get_trending_tv(self) -> dict:
         try:
-            response = requests.get(url=f"{self.url}/tv/trending")
-            response.raise_for_status()
-            return response.json()
+            return metadata_cache.get_or_fetch(
+                provider=self.name,
+                endpoint="tv/trending",
+                kind="trending",
+                fetch=lambda: self.__get(url=f"{self.url}/tv/trending"),
+            )
         except requests.RequestException as e:
             log.error(f"TMDB API error getting trending TV: {e}")
             if notification_manager.is_configured():
@@ -89,9 +111,13 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
 
     def __get_movie_metadata(self, id: int) -> dict:
         try:
-            response = requests.get(url=f"{self.url}/movies/{id}")
-            response.raise_for_status()
-            return response.json()
+            return metadata_cache.get_or_fetch(
+                provider=self.name,
+                endpoint="movies",
+                params={"id": id},
+                kind="details",
+                fetch=lambda: self.__get(url=f"{self.url}/movies/{id}"),
+            )
         except requests.RequestException as e:
             log.error(f"TMDB API error getting movie metadata for ID {id}: {e}")
             if notification_manager.is_configured():
@@ -103,11 +129,16 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
 
     def __search_movie(self, query: str, page: int) -> dict:
         try:
-            response = requests.get(
-                url=f"{self.url}/movies/search", params={"query": query, "page": page}
+            params = {"query": query, "page": page}
+            return metadata_cache.get_or_fetch(
+                provider=self.name,
+                endpoint="movies/search",
+                params=params,
+                kind="search",
+                fetch=lambda: self.__get(
+                    url=f"{self.url}/movies/search", params=params
+                ),
             )
-            response.raise_for_status()
-            return response.json()
         except requests.RequestException as e:
             log.error(f"TMDB API error searching movies with query '{query}': {e}")
             if notification_manager.is_configured():
@@ -119,9 +150,12 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
 
     def __get_trending_movies(self) -> dict:
         try:
-            response = requests.get(url=f"{self.url}/movies/trending")
-            response.raise_for_status()
-            return response.json()
+            return metadata_cache.get_or_fetch(
+                provider=self.name,
+                endpoint="movies/trending",
+                kind="trending",
+                fetch=lambda: self.__get(url=f"{self.url}/movies/trending"),
+            )
         except requests.RequestException as e:
             log.error(f"TMDB API error getting trending movies: {e}")
             if notification_manager.is_configured():
@@ -160,12 +194,15 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
         :rtype: ShowMetadata
         """
         show_metadata = self.__get_show_metadata(id)
+        seasons_metadata = media_manager.metadataProvider.utils.fetch_concurrently(
+            lambda season: self.__get_season_metadata(
+                show_id=show_metadata["id"], season_number=season["season_number"]
+            ),
+            show_metadata["seasons"],
+        )
         season_list = []
         # inserting all the metadata into the objects
-        for season in show_metadata["seasons"]:
-            season_metadata = self.__get_season_metadata(
-                show_id=show_metadata["id"], season_number=season["season_number"]
-            )
+        for season_metadata in seasons_metadata:
             episode_list = []
 
             for episode in season_metadata["episodes"]:
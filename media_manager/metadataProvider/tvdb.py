@@ -1,9 +1,10 @@
-import requests
 import logging
 
 
 import media_manager.metadataProvider.utils
 from media_manager.config import AllEncompassingConfig
+from media_manager.http.client import http_client
+from media_manager.metadataProvider.cache import metadata_cache
 from media_manager.metadataProvider.abstractMetaDataProvider import (
     AbstractMetadataProvider,
 )
@@ -22,26 +23,74 @@ class TvdbMetadataProvider(AbstractMetadataProvider):
         config = AllEncompassingConfig().metadata.tvdb
         self.url = config.tvdb_relay_url
 
+    @staticmethod
+    def __get(url: str, params: dict | None = None) -> dict:
+        response = http_client.get(url, params=params)
+        response.raise_for_status()
+        return response.json()
+
     def __get_show(self, id: int) -> dict:
-        return requests.get(f"{self.url}/tv/shows/{id}").json()
+        return metadata_cache.get_or_fetch(
+            provider=self.name,
+            endpoint="tv/shows",
+            params={"id": id},
+            kind="details",
+            fetch=lambda: self.__get(f"{self.url}/tv/shows/{id}"),
+        )
 
     def __get_season(self, id: int) -> dict:
-        return requests.get(f"{self.url}/tv/seasons/{id}").json()
+        return metadata_cache.get_or_fetch(
+            provider=self.name,
+            endpoint="tv/seasons",
+            params={"id": id},
+            kind="details",
+            fetch=lambda: self.__get(f"{self.url}/tv/seasons/{id}"),
+        )
 
     def __search_tv(self, query: str) -> dict:
-        return requests.get(f"{self.url}/tv/search", params={"query": query}).json()
+        return metadata_cache.get_or_fetch(
+            provider=self.name,
+            endpoint="tv/search",
+            params={"query": query},
+            kind="search",
+            fetch=lambda: self.__get(f"{self.url}/tv/search", params={"query": query}),
+        )
 
     def __get_trending_tv(self) -> dict:
-        return requests.get(f"{self.url}/tv/trending").json()
+        return metadata_cache.get_or_fetch(
+            provider=self.name,
+            endpoint="tv/trending",
+            kind="trending",
+            fetch=lambda: self.__get(f"{self.url}/tv/trending"),
+        )
 
     def __get_movie(self, id: int) -> dict:
-        return requests.get(f"{self.url}/movies/{id}").json()
+        return metadata_cache.get_or_fetch(
+            provider=self.name,
+            endpoint="movies",
+            params={"id": id},
+            kind="details",
+            fetch=lambda: self.__get(f"{self.url}/movies/{id}"),
+        )
 
     def __search_movie(self, query: str) -> dict:
-        return requests.get(f"{self.url}/movies/search", params={"query": query}).json()
+        return metadata_cache.get_or_fetch(
+            provider=self.name,
+            endpoint="movies/search",
+            params={"query": query},
+            kind="search",
+            fetch=lambda: self.__get(
+                f"{self.url}/movies/search", params={"query": query}
+            ),
+        )
 
     def __get_trending_movies(self) -> dict:
-        return requests.get(f"{self.url}/movies/trending").json()
+        return metadata_cache.get_or_fetch(
+            provider=self.name,
+            endpoint="movies/trending",
+            kind="trending",
+            fetch=lambda: self.__get(f"{self.url}/movies/trending"),
+        )
 
     def download_show_poster_image(self, show: Show) -> bool:
         show_metadata = self.__get_show(id=show.external_id)
@@ -69,9 +118,11 @@ class TvdbMetadataProvider(AbstractMetadataProvider):
         series = self.__get_show(id=id)
         seasons = []
         seasons_ids = [season["id"] for season in series["seasons"]]
+        seasons_metadata = media_manager.metadataProvider.utils.fetch_concurrently(
+            lambda season_id: self.__get_season(id=season_id), seasons_ids
+        )
 
-        for season in seasons_ids:
-            s = self.__get_season(id=season)
+        for s in seasons_metadata:
             # the seasons need to be filtered to a certain type,
             # otherwise the same season will be imported in aired and dvd order,
             # which causes duplicate season number + show ids which in turn violates a unique constraint of the season table
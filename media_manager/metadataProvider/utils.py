@@ -1,10 +1,24 @@
+import hashlib
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from pathlib import Path
+from typing import Callable, Iterable, TypeVar
 from uuid import UUID
 
-from PIL import Image
-import requests
-import pillow_avif
+from media_manager.http.client import http_client
 
-pillow_avif
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# upper bound for the number of concurrent requests a single provider sends to the metadata relay
+MAX_CONCURRENT_REQUESTS = 8
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 def get_year_from_date(first_air_date: str | None) -> int | None:
@@ -14,16 +28,68 @@ def get_year_from_date(first_air_date: str | None) -> int | None:
         return None
 
 
+def fetch_concurrently(
+    fetch: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+) -> list[R]:
+    """
+    Calls fetch for every item concurrently and returns the results in the order of the items.
+    If any call raises, the pending calls are cancelled and the exception is re-raised,
+    so the caller either gets all results or none.
+
+    :param fetch: The function to call for every item.
+    :param items: The items to pass to fetch.
+    :param max_workers: The maximum number of concurrent calls.
+    :return: The results of fetch, in the same order as items.
+    """
+    items = list(items)
+    if not items:
+        return []
+    # the calls see the caller's context variables, e.g. whether the metadata cache is revalidating
+    context = copy_context()
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
+    try:
+        return list(executor.map(lambda item: context.copy().run(fetch, item), items))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def get_file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def download_poster_image(storage_path=None, poster_url=None, id: UUID = None) -> bool:
-    res = requests.get(poster_url, stream=True)
-    if res.status_code == 200:
-        image_file_path = storage_path.joinpath(str(id))
-        with open(str(image_file_path) + ".jpg", "wb") as f:
-            f.write(res.content)
-
-        original_image = Image.open(str(image_file_path) + ".jpg")
-        original_image.save(str(image_file_path) + ".avif", quality=50)
-        original_image.save(str(image_file_path) + ".webp", quality=50)
-        return True
-    else:
-        return False
+    """
+    Streams a poster to <storage_path>/<id>.jpg.
+    If the file already exists with the same content it is left untouched, so its AVIF and WebP variants,
+    which are encoded lazily by media_manager.images, stay valid.
+
+    :return: True if the poster is available on disk, False if the download failed.
+    """
+    image_file_path = Path(storage_path) / f"{id}.jpg"
+    with http_client.get(poster_url, stream=True) as res:
+        if res.status_code != 200:
+            return False
+        fd, temporary_path = tempfile.mkstemp(dir=storage_path, suffix=".part")
+        try:
+            digest = hashlib.sha256()
+            with os.fdopen(fd, "wb") as f:
+                for chunk in res.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+            if (
+                image_file_path.exists()
+                and get_file_hash(image_file_path) == digest.hexdigest()
+            ):
+                log.debug(f"Poster {image_file_path.name} is unchanged")
+                return True
+            os.replace(temporary_path, image_file_path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+    return True
@@ -0,0 +1,108 @@
+from typing import Iterator
+
+from prometheus_client.core import (
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    Metric,
+)
+from prometheus_client.registry import REGISTRY, Collector
+
+from media_manager.database import get_database_pool_metrics
+from media_manager.http.client import http_client
+from media_manager.notification.manager import notification_manager
+
+
+class DatabasePoolCollector(Collector):
+    def collect(self) -> Iterator[Metric]:
+        labels = ["pool"]
+        size = GaugeMetricFamily(
+            "mediamanager_db_pool_size", "Connections kept in the pool", labels=labels
+        )
+        checked_out = GaugeMetricFamily(
+            "mediamanager_db_pool_checked_out_connections",
+            "Connections currently in use",
+            labels=labels,
+        )
+        overflow = GaugeMetricFamily(
+            "mediamanager_db_pool_overflow_connections",
+            "Connections opened beyond the pool size",
+            labels=labels,
+        )
+        checkouts = CounterMetricFamily(
+            "mediamanager_db_pool_checkouts",
+            "Connections taken from the pool",
+            labels=labels,
+        )
+        timeouts = CounterMetricFamily(
+            "mediamanager_db_pool_timeouts",
+            "Checkouts that timed out waiting for a connection",
+            labels=labels,
+        )
+        wait = CounterMetricFamily(
+            "mediamanager_db_pool_wait_seconds",
+            "Time spent waiting for a connection",
+            labels=labels,
+        )
+        for pool in get_database_pool_metrics():
+            size.add_metric([pool.pool], pool.size)
+            checked_out.add_metric([pool.pool], pool.checked_out)
+            overflow.add_metric([pool.pool], pool.overflow)
+            checkouts.add_metric([pool.pool], pool.checkouts)
+            timeouts.add_metric([pool.pool], pool.timeouts)
+            wait.add_metric([pool.pool], pool.total_wait)
+        yield from (size, checked_out, overflow, checkouts, timeouts, wait)
+
+
+class OutboundHttpCollector(Collector):
+    def collect(self) -> Iterator[Metric]:
+        labels = ["host"]
+        requests = CounterMetricFamily(
+            "mediamanager_outbound_http_requests",
+            "Requests sent to metadata providers, indexers and notification services",
+            labels=labels,
+        )
+        errors = CounterMetricFamily(
+            "mediamanager_outbound_http_errors",
+            "Outbound requests that failed or got a 5xx response",
+            labels=labels,
+        )
+        latency = CounterMetricFamily(
+            "mediamanager_outbound_http_latency_seconds",
+            "Total time spent on outbound requests",
+            labels=labels,
+        )
+        max_latency = GaugeMetricFamily(
+            "mediamanager_outbound_http_max_latency_seconds",
+            "Slowest outbound request",
+            labels=labels,
+        )
+        circuit_open = GaugeMetricFamily(
+            "mediamanager_outbound_http_circuit_open",
+            "Whether the circuit breaker of the host is open",
+            labels=labels,
+        )
+        for host in http_client.get_host_metrics():
+            requests.add_metric([host.host], host.requests)
+            errors.add_metric([host.host], host.errors)
+            latency.add_metric([host.host], host.total_latency)
+            max_latency.add_metric([host.host], host.max_latency)
+            circuit_open.add_metric([host.host], int(host.circuit_open))
+        yield from (requests, errors, latency, max_latency, circuit_open)
+
+
+class NotificationQueueCollector(Collector):
+    def collect(self) -> Iterator[Metric]:
+        yield GaugeMetricFamily(
+            "mediamanager_notification_queue_depth",
+            "Notifications waiting to be sent",
+            value=notification_manager.get_queue_depth(),
+        )
+
+
+def register_collectors() -> None:
+    for collector in (
+        DatabasePoolCollector(),
+        OutboundHttpCollector(),
+        NotificationQueueCollector(),
+    ):
+        REGISTRY.register(collector)
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from pydantic_settings import BaseSettings
+
+
+class MetricsConfig(BaseSettings):
+    enabled: bool = (
+        True  # serves Prometheus metrics at /metrics, without authentication
+    )
+
+    profiling: bool = (
+        False  # profiles every request, see media_manager.metrics.profiling
+    )
+    slow_request_threshold: float = (
+        1.0  # seconds after which a request is logged as slow
+    )
+    repeated_query_threshold: int = 10  # a statement executed more often than this during one request is logged as N+1 query
+    profiler_sample_rate: float = (
+        0.0  # fraction of requests whose call stacks are sampled
+    )
+    profiler_interval: float = 0.005  # seconds between two samples
+    profile_directory: Path = Path(__file__).parent.parent.parent / "data" / "profiles"
@@ -0,0 +1,162 @@
+"""
+Prometheus metrics of MediaManager's hot paths.
+
+The metrics are defined here and recorded by the code they measure, e.g. the indexer service observes
+INDEXER_SEARCH_DURATION. Values that are already tracked elsewhere (database pools, outbound HTTP, the
+notification queue) are read when the metrics are scraped, see media_manager.metrics.collectors.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Collection, Iterator
+
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_SUBMITTED,
+    JobExecutionEvent,
+    JobSubmissionEvent,
+)
+from apscheduler.schedulers.base import BaseScheduler
+from prometheus_client import Counter, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# for calls to indexers, download clients and scheduled jobs, which take much longer than API requests
+SLOW_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600, 1800, 3600)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "mediamanager_http_request_duration_seconds",
+    "Duration of API requests",
+    ["method", "route", "status"],
+)
+INDEXER_SEARCH_DURATION = Histogram(
+    "mediamanager_indexer_search_duration_seconds",
+    "Duration of indexer searches",
+    ["indexer"],
+    buckets=SLOW_BUCKETS,
+)
+INDEXER_SEARCH_RESULTS = Histogram(
+    "mediamanager_indexer_search_results",
+    "Number of results of indexer searches",
+    ["indexer"],
+    buckets=(0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+)
+INDEXER_SEARCH_ERRORS = Counter(
+    "mediamanager_indexer_search_errors_total",
+    "Failed indexer searches",
+    ["indexer"],
+)
+DOWNLOAD_CLIENT_REQUEST_DURATION = Histogram(
+    "mediamanager_download_client_request_duration_seconds",
+    "Duration of calls to download clients",
+    ["client", "operation"],
+    buckets=SLOW_BUCKETS,
+)
+DOWNLOAD_CLIENT_ERRORS = Counter(
+    "mediamanager_download_client_errors_total",
+    "Failed calls to download clients",
+    ["client", "operation"],
+)
+JOB_DURATION = Histogram(
+    "mediamanager_job_duration_seconds",
+    "Duration of scheduled jobs",
+    ["job", "status"],
+    buckets=SLOW_BUCKETS,
+)
+IMPORT_DURATION = Histogram(
+    "mediamanager_import_duration_seconds",
+    "Duration of torrent imports",
+    ["media_type"],
+    buckets=SLOW_BUCKETS,
+)
+IMPORT_BYTES = Counter(
+    "mediamanager_import_bytes_total",
+    "Size of the files imported into the library",
+    ["method"],
+)
+
+
+@contextmanager
+def observe_download_client_call(client: str, operation: str) -> Iterator[None]:
+    """
+    Records the duration of the enclosed download client call, and counts it as error if it raises.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        DOWNLOAD_CLIENT_ERRORS.labels(client=client, operation=operation).inc()
+        raise
+    finally:
+        DOWNLOAD_CLIENT_REQUEST_DURATION.labels(
+            client=client, operation=operation
+        ).observe(time.perf_counter() - start)
+
+
+class PrometheusMiddleware:
+    """
+    Records the duration of every HTTP request, labelled with the path template of the route that handled it,
+    e.g. /api/v1/tv/shows/{show_id}, so the number of label values stays bounded.
+    Long-lived requests like server-sent event streams would skew the histogram, their routes can be excluded.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_routes: Collection[str] = ()):
+        self.app = app
+        self.excluded_routes = frozenset(excluded_routes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            if route not in self.excluded_routes:
+                HTTP_REQUEST_DURATION.labels(
+                    method=scope["method"],
+                    route=route,
+                    status=str(status_code),
+                ).observe(time.perf_counter() - start)
+
+
+def instrument_scheduler(scheduler: BaseScheduler) -> None:
+    """
+    Records the duration of every job the scheduler runs, from its submission to the executor until it finished.
+    """
+    started_at: dict[str, float] = {}
+    # the scheduler dispatches the submission event after submitting the job, a short job can finish before that
+    finished_early: dict[str, str] = {}
+    lock = threading.Lock()
+
+    def listener(event: JobSubmissionEvent | JobExecutionEvent) -> None:
+        status = "error" if event.code == EVENT_JOB_ERROR else "success"
+        with lock:
+            if event.code == EVENT_JOB_SUBMITTED:
+                status = finished_early.pop(event.job_id, None)
+                if status is None:
+                    started_at[event.job_id] = time.perf_counter()
+                    return
+                duration = 0.0
+            else:
+                start = started_at.pop(event.job_id, None)
+                if start is None:
+                    finished_early[event.job_id] = status
+                    return
+                duration = time.perf_counter() - start
+        JOB_DURATION.labels(job=event.job_id, status=status).observe(duration)
+
+    scheduler.add_listener(
+        listener, EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR
+    )
@@ -0,0 +1,272 @@
+"""
+Opt-in per-request profiling.
+
+While a request is handled its RequestProfile is the value of current_profile. The database engines and the shared
+HTTP client add the time they spend to it, the contextvar is copied into the threads that run sync routes and
+dependencies, so this also works for them. When the request is done ProfilingMiddleware adds a Server-Timing header,
+warns about statements that were executed suspiciously often (usually an N+1 query) and logs slow requests.
+A fraction of the requests can additionally be sampled by a SamplingProfiler, see metrics.profiler_sample_rate.
+"""
+
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from types import FrameType
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import ExceptionContext
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+log = logging.getLogger(__name__)
+
+current_profile: ContextVar["RequestProfile | None"] = ContextVar(
+    "current_profile", default=None
+)
+
+
+class RequestProfile:
+    """
+    Time spent in the database and in outbound HTTP requests while handling one request.
+    """
+
+    def __init__(self, sampler: "SamplingProfiler | None" = None):
+        self.db_time = 0.0
+        self.http_time = 0.0
+        self.http_requests = 0
+        self.statements: Counter[str] = Counter()
+        self.sampler = sampler
+        self._lock = threading.Lock()
+
+    @property
+    def query_count(self) -> int:
+        return self.statements.total()
+
+    def record_query(self, statement: str, duration: float) -> None:
+        with self._lock:
+            self.db_time += duration
+            self.statements[statement] += 1
+        if self.sampler is not None:
+            self.sampler.add_thread(threading.get_ident())
+
+    def record_http_request(self, duration: float) -> None:
+        with self._lock:
+            self.http_time += duration
+            self.http_requests += 1
+        if self.sampler is not None:
+            self.sampler.add_thread(threading.get_ident())
+
+    def get_repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Returns the statements that were executed more than threshold times, most frequent first.
+        """
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+def record_http_request(duration: float) -> None:
+    """
+    Adds an outbound HTTP request to the profile of the current request, if it is being profiled.
+    """
+    profile = current_profile.get()
+    if profile is not None:
+        profile.record_http_request(duration)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_profile.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = current_profile.get()
+    if profile is not None and conn.info.get("query_start_time"):
+        start = conn.info["query_start_time"].pop()
+        # statements are parameterized, so the same statement shape always has the same text
+        profile.record_query(
+            statement=" ".join(statement.split()),
+            duration=time.perf_counter() - start,
+        )
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    # after_cursor_execute isn't called for a statement that raised, its start time must not be paired with the next one
+    conn = context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Makes the engine record the statements it executes into the profile of the current request.
+    For an AsyncEngine pass its sync_engine.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class SamplingProfiler:
+    """
+    Periodically records the call stacks of the threads working on one request, like pyinstrument does.
+    The event loop thread is sampled from the start, threads running sync code are added when they
+    execute a query or an outbound HTTP request for the request.
+    Threads can't be attributed to a single request: the event loop thread is shared by all concurrent requests and
+    a threadpool thread keeps being sampled after it returned to the pool. The profile therefore also contains the
+    stacks of whatever else those threads did meanwhile, profiles taken under little concurrency are the most precise.
+    The result is written in the folded stack format, which flamegraph.pl and speedscope can display.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._threads = {threading.get_ident()}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+
+    def add_thread(self, thread_id: int) -> None:
+        self._threads.add(thread_id)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in tuple(self._threads):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self.samples[self._fold(frame)] += 1
+
+    @staticmethod
+    def _fold(frame: FrameType | None) -> str:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_qualname} ({code.co_filename}:{frame.f_lineno})")
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as file:
+            for stack, count in self.samples.items():
+                file.write(f"{stack} {count}\n")
+
+
+class ProfilingMiddleware:
+    """
+    Profiles every HTTP request, see the module docstring.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        slow_request_threshold: float,
+        repeated_query_threshold: int,
+        sample_rate: float,
+        sample_interval: float,
+        profile_directory: Path,
+    ):
+        self.app = app
+        self.slow_request_threshold = slow_request_threshold
+        self.repeated_query_threshold = repeated_query_threshold
+        self.sample_rate = sample_rate
+        self.sample_interval = sample_interval
+        self.profile_directory = profile_directory
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sampler = None
+        if random.random() < self.sample_rate:
+            sampler = SamplingProfiler(interval=self.sample_interval)
+            sampler.start()
+        profile = RequestProfile(sampler=sampler)
+        token = current_profile.set(profile)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f"app;dur={(time.perf_counter() - start) * 1000:.1f}, "
+                    f"db;dur={profile.db_time * 1000:.1f}, "
+                    f"http;dur={profile.http_time * 1000:.1f}",
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_profile.reset(token)
+            duration = time.perf_counter() - start
+            if sampler is not None:
+                sampler.stop()
+            self._report(scope, profile, duration, status_code)
+
+    def _report(
+        self, scope: Scope, profile: RequestProfile, duration: float, status_code: int
+    ) -> None:
+        route = getattr(scope.get("route"), "path", scope["path"])
+
+        for statement, count in profile.get_repeated_statements(
+            self.repeated_query_threshold
+        ):
+            log.warning(
+                "%s %s executed the same statement %d times, this is likely an N+1 query: %s",
+                scope["method"],
+                route,
+                count,
+                statement,
+                extra={"route": route, "statement": statement, "count": count},
+            )
+
+        if duration >= self.slow_request_threshold:
+            log.warning(
+                "Slow request %s %s took %.3fs (database %.3fs in %d queries, outbound HTTP %.3fs in %d requests)",
+                scope["method"],
+                route,
+                duration,
+                profile.db_time,
+                profile.query_count,
+                profile.http_time,
+                profile.http_requests,
+                extra={
+                    "method": scope["method"],
+                    "route": route,
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration": duration,
+                    "db_time": profile.db_time,
+                    "query_count": profile.query_count,
+                    "http_time": profile.http_time,
+                    "http_requests": profile.http_requests,
+                },
+            )
+
+        if profile.sampler is not None and profile.sampler.samples:
+            name = re.sub(r"[^\w.-]+", "_", f"{scope['method']}{route}").strip("_")
+            path = self.profile_directory / f"{name}-{time.time_ns()}.folded"
+            profile.sampler.write(path)
+            log.info("Wrote profile of %s %s to %s", scope["method"], route, path)
@@ -1,4 +1,4 @@
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, tuple_
 from sqlalchemy.exc import (
     IntegrityError,
     SQLAlchemyError,
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session, joinedload
 import logging
 
 from media_manager.exceptions import NotFoundError
+from media_manager.response_cache import response_cache
 from media_manager.movies.models import Movie, MovieRequest, MovieFile
 from media_manager.movies.schemas import (
     Movie as MovieSchema,
@@ -93,6 +94,30 @@ class MovieRepository:
             )
             raise
 
+    def get_existing_movie_external_ids(
+        self, external_ids: list[tuple[int, str]]
+    ) -> set[tuple[int, str]]:
+        """
+        Check which of the given (external ID, metadata provider) pairs belong to a movie in the database.
+
+        :param external_ids: The (external ID, metadata provider) pairs to check.
+        :return: The subset of the given pairs that exist in the database.
+        :raises SQLAlchemyError: If a database error occurs.
+        """
+        if not external_ids:
+            return set()
+        log.debug(f"Checking existence of {len(external_ids)} movies by external_id.")
+        try:
+            stmt = select(Movie.external_id, Movie.metadata_provider).where(
+                tuple_(Movie.external_id, Movie.metadata_provider).in_(external_ids)
+            )
+            results = self.db.execute(stmt).all()
+            log.info(f"Found {len(results)} of {len(external_ids)} movies.")
+            return {(external_id, provider) for external_id, provider in results}
+        except SQLAlchemyError as e:
+            log.error(f"Database error while checking existence of movies: {e}")
+            raise
+
     def get_movies(self) -> list[MovieSchema]:
         """
         Retrieve all movies from the database.
@@ -136,6 +161,7 @@ class MovieRepository:
 
         try:
             self.db.commit()
+            response_cache.bump("movies")
             self.db.refresh(db_movie)
             log.info(f"Successfully saved movie: {db_movie.name} (ID: {db_movie.id})")
             return MovieSchema.model_validate(db_movie)
@@ -166,6 +192,7 @@ class MovieRepository:
                 raise NotFoundError(f"Movie with id {movie_id} not found.")
             self.db.delete(movie)
             self.db.commit()
+            response_cache.bump("movies")
             log.info(f"Successfully deleted movie with id: {movie_id}")
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -229,6 +256,7 @@ class MovieRepository:
                 raise NotFoundError(f"movie with id {movie_id} not found.")
             movie.library = library
             self.db.commit()
+            response_cache.bump("movies")
             log.info(f"Successfully set library for movie_id {movie_id} to {library}")
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -295,6 +323,7 @@ class MovieRepository:
         try:
             self.db.add(db_model)
             self.db.commit()
+            response_cache.bump("movies")
             self.db.refresh(db_model)
             log.info(
                 f"Successfully added movie file. Torrent ID: {db_model.torrent_id}, Path: {db_model.file_path_suffix}"
@@ -322,6 +351,7 @@ class MovieRepository:
             stmt = delete(MovieFile).where(MovieFile.torrent_id == torrent_id)
             result = self.db.execute(stmt)
             self.db.commit()
+            response_cache.bump("movies")
             deleted_count = result.rowcount
             log.info(
                 f"Successfully removed {deleted_count} movie files for torrent_id: {torrent_id}"
@@ -508,6 +538,7 @@ class MovieRepository:
 
         if updated:
             self.db.commit()
+            response_cache.bump("movies")
             self.db.refresh(db_movie)
             log.info(f"Successfully updated attributes for movie ID: {movie_id}")
         else:
@@ -1,13 +1,16 @@
 from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
 from fastapi.responses import JSONResponse
 
 from media_manager.auth.schemas import UserRead
 from media_manager.auth.users import current_active_user, current_superuser
+from media_manager.concurrency import blocking_io
 from media_manager.config import LibraryItem, AllEncompassingConfig
 from media_manager.indexer.schemas import PublicIndexerQueryResult, IndexerQueryResultId
 from media_manager.metadataProvider.schemas import MetaDataProviderSearchResult
+from media_manager.response_cache import response_cache
+from media_manager.responses import ModelResponse
 from media_manager.torrent.schemas import Torrent
 from media_manager.movies import log
 from media_manager.exceptions import MediaAlreadyExists
@@ -48,6 +51,7 @@ router = APIRouter()
         status.HTTP_409_CONFLICT: {"model": str, "description": "Movie already exists"},
     },
 )
+@blocking_io
 def add_a_movie(
     movie_service: movie_service_dep,
     metadata_provider: metadata_provider_dep,
@@ -75,8 +79,13 @@ def add_a_movie(
     dependencies=[Depends(current_active_user)],
     response_model=list[PublicMovie],
 )
-def get_all_movies(movie_service: movie_service_dep):
-    return movie_service.get_all_movies()
+def get_all_movies(request: Request, movie_service: movie_service_dep):
+    return response_cache.get_response(
+        request=request,
+        namespace="movies",
+        response_model=list[PublicMovie],
+        build=movie_service.get_all_movies,
+    )
 
 
 @router.get(
@@ -93,6 +102,7 @@ def get_available_libraries():
     dependencies=[Depends(current_active_user)],
     response_model=list[MetaDataProviderSearchResult],
 )
+@blocking_io
 def search_for_movie(
     query: str,
     movie_service: movie_service_dep,
@@ -108,6 +118,7 @@ def search_for_movie(
     dependencies=[Depends(current_active_user)],
     response_model=list[MetaDataProviderSearchResult],
 )
+@blocking_io
 def get_popular_movies(
     movie_service: movie_service_dep,
     metadata_provider: metadata_provider_dep,
@@ -120,8 +131,12 @@ def get_popular_movies(
     dependencies=[Depends(current_active_user)],
     response_model=list[RichMovieTorrent],
 )
+@blocking_io
 def get_all_movies_with_torrents(movie_service: movie_service_dep):
-    return movie_service.get_all_movies_with_torrents()
+    return ModelResponse(
+        movie_service.get_all_movies_with_torrents(),
+        response_model=list[RichMovieTorrent],
+    )
 
 
 # --------------------------------
@@ -223,8 +238,15 @@ def delete_movie_request(
     dependencies=[Depends(current_active_user)],
     response_model=PublicMovie,
 )
-def get_movie_by_id(movie_service: movie_service_dep, movie_id: MovieId):
-    return movie_service.get_public_movie_by_id(movie_id=movie_id)
+def get_movie_by_id(
+    request: Request, movie_service: movie_service_dep, movie_id: MovieId
+):
+    return response_cache.get_response(
+        request=request,
+        namespace="movies",
+        response_model=PublicMovie,
+        build=lambda: movie_service.get_public_movie_by_id(movie_id=movie_id),
+    )
 
 
 @router.get(
@@ -232,13 +254,17 @@ def get_movie_by_id(movie_service: movie_service_dep, movie_id: MovieId):
     dependencies=[Depends(current_active_user)],
     response_model=list[PublicIndexerQueryResult],
 )
+@blocking_io
 def get_all_available_torrents_for_a_movie(
     movie_service: movie_service_dep,
     movie_id: MovieId,
     search_query_override: str | None = None,
 ):
-    return movie_service.get_all_available_torrents_for_a_movie(
-        movie_id=movie_id, search_query_override=search_query_override
+    return ModelResponse(
+        movie_service.get_all_available_torrents_for_a_movie(
+            movie_id=movie_id, search_query_override=search_query_override
+        ),
+        response_model=list[PublicIndexerQueryResult],
     )
 
 
@@ -248,6 +274,7 @@ def get_all_available_torrents_for_a_movie(
     dependencies=[Depends(current_active_user)],
     response_model=Torrent,
 )
+@blocking_io
 def download_torrent_for_movie(
     movie_service: movie_service_dep,
     movie_id: MovieId,
@@ -1,3 +1,4 @@
+import logging
 import re
 from pathlib import Path
 
@@ -11,10 +12,12 @@ from media_manager.database import SessionLocal, get_session
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.indexer.schemas import IndexerQueryResultId
 from media_manager.indexer.utils import evaluate_indexer_query_results
+from media_manager.metadataProvider.cache import metadata_cache
 from media_manager.metadataProvider.schemas import MetaDataProviderSearchResult
 from media_manager.notification.service import NotificationService
 from media_manager.torrent.schemas import Torrent, TorrentStatus
 from media_manager.torrent.service import TorrentService
+from media_manager.metrics.metrics import IMPORT_DURATION
 from media_manager.movies import log
 from media_manager.movies.schemas import (
     Movie,
@@ -29,6 +32,8 @@ from media_manager.movies.schemas import (
 )
 from media_manager.torrent.schemas import QualityStrings
 from media_manager.movies.repository import MovieRepository
+from media_manager.events.bus import event_bus
+from media_manager.events.schemas import EventType
 from media_manager.exceptions import NotFoundError
 import pprint
 from media_manager.torrent.repository import TorrentRepository
@@ -166,6 +171,24 @@ class MovieService:
                 "External ID and metadata provider or Movie ID must be provided"
             )
 
+    def get_existing_search_results(
+        self,
+        results: list[MetaDataProviderSearchResult],
+        metadata_provider: AbstractMetadataProvider,
+    ) -> set[tuple[int, str]]:
+        """
+        Check which metadata provider search results are already in the database, using a single query.
+
+        :param results: The search results to check.
+        :param metadata_provider: The metadata provider the results came from.
+        :return: The (external ID, metadata provider) pairs of the results that already exist.
+        """
+        return self.movie_repository.get_existing_movie_external_ids(
+            external_ids=[
+                (result.external_id, metadata_provider.name) for result in results
+            ]
+        )
+
     def get_all_available_torrents_for_a_movie(
         self, movie_id: MovieId, search_query_override: str = None
     ) -> list[IndexerQueryResult]:
@@ -224,10 +247,11 @@ class MovieService:
         :return: A list of metadata provider movie search results.
         """
         results = metadata_provider.search_movie(query)
+        existing_movies = self.get_existing_search_results(
+            results=results, metadata_provider=metadata_provider
+        )
         for result in results:
-            if self.check_if_movie_exists(
-                external_id=result.external_id, metadata_provider=metadata_provider.name
-            ):
+            if (result.external_id, metadata_provider.name) in existing_movies:
                 result.added = True
         return results
 
@@ -241,12 +265,13 @@ class MovieService:
         :return: A list of metadata provider movie search results.
         """
         results: list[MetaDataProviderSearchResult] = metadata_provider.search_movie()
+        existing_movies = self.get_existing_search_results(
+            results=results, metadata_provider=metadata_provider
+        )
 
         filtered_results = []
         for result in results:
-            if not self.check_if_movie_exists(
-                external_id=result.external_id, metadata_provider=metadata_provider.name
-            ):
+            if (result.external_id, metadata_provider.name) not in existing_movies:
                 filtered_results.append(result)
 
         return filtered_results
@@ -447,6 +472,7 @@ class MovieService:
         self.delete_movie_request(movie_request.id)
         return True
 
+    @IMPORT_DURATION.labels(media_type="movie").time()
     def import_torrent_files(self, torrent: Torrent, movie: Movie) -> None:
         """
         Organizes files from a torrent into the movie directory structure.
@@ -468,11 +494,16 @@ class MovieService:
                 "Found multiple video files in movie torrent, only the first will be imported. Manual intervention is recommended.."
             )
         log.info(
-            f"Importing these {len(video_files) + len(subtitle_files)} files:\n"
-            + pprint.pformat(video_files)
-            + "\n"
-            + pprint.pformat(subtitle_files)
+            "Importing %d files of torrent %s",
+            len(video_files) + len(subtitle_files),
+            torrent.title,
         )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Video files:\n%s\nSubtitle files:\n%s",
+                pprint.pformat(video_files),
+                pprint.pformat(subtitle_files),
+            )
         misc_config = AllEncompassingConfig().misc
 
         movie_file_path = (
@@ -540,6 +571,13 @@ class MovieService:
         if success:
             torrent.imported = True
             self.torrent_service.torrent_repository.save_torrent(torrent=torrent)
+            event_bus.publish(
+                type=EventType.torrent_imported,
+                data={
+                    "torrent": torrent.model_dump(mode="json"),
+                    "movie_id": str(movie.id),
+                },
+            )
 
             # Send successful import notification
             if self.notification_service:
@@ -562,7 +600,11 @@ class MovieService:
         """
         log.debug(f"Found movie: {db_movie.name} for metadata update.")
 
-        fresh_movie_data = metadata_provider.get_movie_metadata(id=db_movie.external_id)
+        # the cached metadata can be days old
+        with metadata_cache.revalidate():
+            fresh_movie_data = metadata_provider.get_movie_metadata(
+                id=db_movie.external_id
+            )
         if not fresh_movie_data:
             log.warning(
                 f"Could not fetch fresh metadata for movie {db_movie.name} (External ID: {db_movie.external_id}) from {db_movie.metadata_provider}."
@@ -623,7 +665,13 @@ def auto_download_all_approved_movie_requests() -> None:
     db.close()
 
 
-def import_all_movie_torrents() -> None:
+def import_all_movie_torrents(torrents: list[Torrent] | None = None) -> None:
+    """
+    Imports all finished movie torrents that were not imported yet.
+    This is a standalone function as it creates its own DB session.
+
+    :param torrents: The torrents with their current status, they are fetched from the download clients if omitted.
+    """
     with next(get_session()) as db:
         movie_repository = MovieRepository(db=db)
         torrent_service = TorrentService(torrent_repository=TorrentRepository(db=db))
@@ -634,7 +682,8 @@ def import_all_movie_torrents() -> None:
             indexer_service=indexer_service,
         )
         log.info("Importing all torrents")
-        torrents = torrent_service.get_all_torrents()
+        if torrents is None:
+            torrents = torrent_service.get_all_torrents()
         log.info("Found %d torrents to import", len(torrents))
         for t in torrents:
             try:
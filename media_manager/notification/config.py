@@ -37,6 +37,13 @@ class PushoverConfig(BaseSettings):
 
 
 class NotificationConfig(BaseSettings):
+    batch_window: float = (
+        5.0  # seconds to collect notifications before they are sent together
+    )
+    retries: int = 3  # how often sending a notification via a provider is retried
+    backoff_factor: float = 2.0  # the n-th retry waits backoff_factor * 2^(n-1) seconds
+    retention_days: int = 90  # notifications older than this are deleted
+
     smtp_config: EmailConfig = EmailConfig()
     email_notifications: EmailNotificationsConfig = EmailNotificationsConfig()
     gotify: GotifyConfig = GotifyConfig()
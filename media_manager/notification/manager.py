@@ -3,6 +3,9 @@ Notification Manager - Orchestrates sending notifications through all configured
 """
 
 import logging
+import queue
+import threading
+import time
 from typing import List
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstractNotificationServiceProvider import (
@@ -25,14 +28,38 @@ from media_manager.config import AllEncompassingConfig
 logger = logging.getLogger(__name__)
 
 
+def coalesce_notifications(
+    notifications: List[MessageNotification],
+) -> List[MessageNotification]:
+    """
+    Merges notifications with the same title into one digest and drops duplicate messages.
+    The order of first appearance is kept.
+    """
+    messages_by_title: dict[str, list[str]] = {}
+    for notification in notifications:
+        messages = messages_by_title.setdefault(notification.title, [])
+        if notification.message not in messages:
+            messages.append(notification.message)
+    return [
+        MessageNotification(title=title, message="\n".join(messages))
+        for title, messages in messages_by_title.items()
+    ]
+
+
 class NotificationManager:
     """
     Manages and orchestrates notifications across all configured service providers.
+
+    Notifications are queued and sent by a background thread in batches. Notifications that arrive within
+    the batch window are coalesced, and sending via a provider is retried with exponential backoff.
     """
 
     def __init__(self):
         self.config = AllEncompassingConfig().notifications
         self.providers: List[AbstractNotificationServiceProvider] = []
+        self._queue: queue.Queue[MessageNotification | None] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
         self._initialize_providers()
 
     def _initialize_providers(self) -> None:
@@ -71,22 +98,90 @@ class NotificationManager:
         logger.info(f"Initialized {len(self.providers)} notification providers")
 
     def send_notification(self, title: str, message: str) -> None:
+        """
+        Queues a notification for all providers and returns immediately.
+        Notifications are sent by a background thread, see _dispatch_batch.
+        """
         if not self.providers:
             logger.warning("No notification providers configured")
+            return
+
+        self._queue.put(MessageNotification(title=title, message=message))
+        self._ensure_worker_started()
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """
+        Sends the notifications that are still queued and stops the background thread.
+        """
+        with self._worker_lock:
+            worker = self._worker
+            self._worker = None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join(timeout=timeout)
+
+    def get_queue_depth(self) -> int:
+        """
+        Returns the number of notifications that are waiting to be sent.
+        """
+        return self._queue.qsize()
+
+    def _ensure_worker_started(self) -> None:
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="notification-dispatcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            # collect everything that arrives within the batch window, so duplicates can be coalesced
+            deadline = time.monotonic() + self.config.batch_window
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    notification = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if notification is None:
+                    stopping = True
+                    break
+                batch.append(notification)
+            try:
+                self._dispatch_batch(coalesce_notifications(batch))
+            except Exception as e:
+                logger.error(f"Error dispatching notifications: {e}")
 
-        notification = MessageNotification(title=title, message=message)
-
+    def _dispatch_batch(self, notifications: List[MessageNotification]) -> None:
         for provider in self.providers:
             provider_name = provider.__class__.__name__
-            try:
-                success = provider.send_notification(notification)
-                if success:
-                    logger.info(f"Notification sent successfully via {provider_name}")
-                else:
-                    logger.warning(f"Failed to send notification via {provider_name}")
-
-            except Exception as e:
-                logger.error(f"Error sending notification via {provider_name}: {e}")
+            pending = notifications
+            for attempt in range(self.config.retries + 1):
+                if attempt > 0:
+                    time.sleep(self.config.backoff_factor * 2 ** (attempt - 1))
+                try:
+                    pending = provider.send_notifications(pending)
+                except Exception as e:
+                    logger.error(
+                        f"Error sending notifications via {provider_name}: {e}"
+                    )
+                if not pending:
+                    logger.info(
+                        f"{len(notifications)} notifications sent successfully via {provider_name}"
+                    )
+                    break
+                logger.warning(
+                    f"Failed to send {len(pending)} notifications via {provider_name} (attempt {attempt + 1})"
+                )
+            else:
+                logger.error(
+                    f"Giving up on {len(pending)} notifications via {provider_name}"
+                )
 
     def get_configured_providers(self) -> List[str]:
         return [provider.__class__.__name__ for provider in self.providers]
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from media_manager.database import Base
@@ -8,6 +8,15 @@ from media_manager.database import Base
 
 class Notification(Base):
     __tablename__ = "notification"
+    __table_args__ = (
+        Index("ix_notification_timestamp_id", "timestamp", "id"),
+        Index(
+            "ix_notification_unread_timestamp_id",
+            "timestamp",
+            "id",
+            postgresql_where=text("NOT read"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True)
     message: Mapped[str]
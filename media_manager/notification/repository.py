@@ -1,4 +1,6 @@
-from sqlalchemy import select, delete, update
+from datetime import datetime
+
+from sqlalchemy import select, delete, update, func, tuple_
 from sqlalchemy.exc import (
     IntegrityError,
     SQLAlchemyError,
@@ -28,39 +30,53 @@ class NotificationRepository:
 
         return NotificationSchema.model_validate(result)
 
-    def get_unread_notifications(self) -> list[NotificationSchema]:
+    def get_notifications(
+        self,
+        limit: int,
+        before: tuple[datetime, NotificationId] | None = None,
+        unread_only: bool = False,
+    ) -> list[NotificationSchema]:
+        """
+        Retrieve notifications, newest first, using keyset pagination on (timestamp, id).
+
+        :param limit: The maximum number of notifications to return.
+        :param before: Only return notifications that come after this (timestamp, id) in the ordering.
+        :param unread_only: Only return unread notifications.
+        :return: A list of notifications.
+        :raises SQLAlchemyError: If a database error occurs.
+        """
         try:
-            stmt = (
-                select(Notification)
-                .where(Notification.read == False)  # noqa: E712
-                .order_by(Notification.timestamp.desc())
-            )
+            stmt = select(Notification)
+            if unread_only:
+                stmt = stmt.where(Notification.read == False)  # noqa: E712
+            if before is not None:
+                stmt = stmt.where(
+                    tuple_(Notification.timestamp, Notification.id) < tuple_(*before)
+                )
+            stmt = stmt.order_by(
+                Notification.timestamp.desc(), Notification.id.desc()
+            ).limit(limit)
             results = self.db.execute(stmt).scalars().all()
-            log.info(f"Successfully retrieved {len(results)} unread notifications.")
+            log.info(f"Successfully retrieved {len(results)} notifications.")
             return [
                 NotificationSchema.model_validate(notification)
                 for notification in results
             ]
         except SQLAlchemyError as e:
-            log.error(f"Database error while retrieving unread notifications: {e}")
+            log.error(f"Database error while retrieving notifications: {e}")
             raise
 
-    def get_all_notifications(self) -> list[NotificationSchema]:
+    def get_unread_notification_count(self) -> int:
         try:
-            stmt = select(Notification).order_by(Notification.timestamp.desc())
-            results = self.db.execute(stmt).scalars().all()
-            log.info(f"Successfully retrieved {len(results)} notifications.")
-            return [
-                NotificationSchema.model_validate(notification)
-                for notification in results
-            ]
+            stmt = select(func.count()).where(Notification.read == False)  # noqa: E712
+            return self.db.execute(stmt).scalar_one()
         except SQLAlchemyError as e:
-            log.error(f"Database error while retrieving notifications: {e}")
+            log.error(f"Database error while counting unread notifications: {e}")
             raise
 
     def save_notification(self, notification: NotificationSchema):
         try:
-            self.db.add(notification)
+            self.db.add(Notification(**notification.model_dump()))
             self.db.commit()
         except IntegrityError as e:
             log.error(f"Could not save notification, Error: {e}")
@@ -79,6 +95,50 @@ class NotificationRepository:
         self.db.execute(stmt)
         return
 
+    def mark_notifications_as_read(self, ids: list[NotificationId] | None) -> int:
+        """
+        Mark several notifications as read.
+
+        :param ids: The IDs of the notifications, None marks all notifications as read.
+        :return: The number of notifications that were marked as read.
+        """
+        stmt = (
+            update(Notification)
+            .where(Notification.read == False)  # noqa: E712
+            .values(read=True)
+        )
+        if ids is not None:
+            stmt = stmt.where(Notification.id.in_(ids))
+        result = self.db.execute(stmt)
+        log.info(f"Marked {result.rowcount} notifications as read.")
+        return result.rowcount
+
+    def delete_notifications(self, ids: list[NotificationId]) -> int:
+        """
+        Delete several notifications. IDs that do not exist are ignored.
+
+        :param ids: The IDs of the notifications to delete.
+        :return: The number of deleted notifications.
+        """
+        stmt = delete(Notification).where(Notification.id.in_(ids))
+        result = self.db.execute(stmt)
+        self.db.commit()
+        log.info(f"Deleted {result.rowcount} notifications.")
+        return result.rowcount
+
+    def delete_notifications_older_than(self, timestamp: datetime) -> int:
+        """
+        Delete all notifications created before the given timestamp.
+
+        :param timestamp: The cutoff timestamp.
+        :return: The number of deleted notifications.
+        """
+        stmt = delete(Notification).where(Notification.timestamp < timestamp)
+        result = self.db.execute(stmt)
+        self.db.commit()
+        log.info(f"Deleted {result.rowcount} notifications older than {timestamp}.")
+        return result.rowcount
+
     def delete_notification(self, id: NotificationId) -> None:
         stmt = delete(Notification).where(Notification.id == id)
         result = self.db.execute(stmt)
@@ -1,7 +1,15 @@
-from fastapi import APIRouter, Depends, status
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from media_manager.auth.users import current_active_user
-from media_manager.notification.schemas import Notification, NotificationId
+from media_manager.notification.schemas import (
+    Notification,
+    NotificationId,
+    NotificationIds,
+    NotificationPage,
+    UnreadNotificationCount,
+)
 from media_manager.notification.dependencies import notification_service_dep
 
 router = APIRouter()
@@ -15,25 +23,78 @@ router = APIRouter()
 @router.get(
     "",
     dependencies=[Depends(current_active_user)],
-    response_model=list[Notification],
+    response_model=NotificationPage,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"description": "Invalid cursor"},
+    },
 )
-def get_all_notifications(notification_service: notification_service_dep):
+def get_all_notifications(
+    notification_service: notification_service_dep,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: str | None = None,
+):
     """
-    Get all notifications.
+    Get a page of notifications, newest first.
+    Pass the next_cursor of a page as cursor to get the next page.
     """
-    return notification_service.get_all_notifications()
+    return get_notification_page(
+        notification_service=notification_service, limit=limit, cursor=cursor
+    )
 
 
 @router.get(
     "/unread",
     dependencies=[Depends(current_active_user)],
-    response_model=list[Notification],
+    response_model=NotificationPage,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"description": "Invalid cursor"},
+    },
 )
-def get_unread_notifications(notification_service: notification_service_dep):
+def get_unread_notifications(
+    notification_service: notification_service_dep,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: str | None = None,
+):
     """
-    Get all unread notifications.
+    Get a page of unread notifications, newest first.
+    Pass the next_cursor of a page as cursor to get the next page.
     """
-    return notification_service.get_unread_notifications()
+    return get_notification_page(
+        notification_service=notification_service,
+        limit=limit,
+        cursor=cursor,
+        unread_only=True,
+    )
+
+
+@router.get(
+    "/unread/count",
+    dependencies=[Depends(current_active_user)],
+    response_model=UnreadNotificationCount,
+)
+def get_unread_notification_count(notification_service: notification_service_dep):
+    """
+    Get the number of unread notifications.
+    """
+    return UnreadNotificationCount(
+        count=notification_service.get_unread_notification_count()
+    )
+
+
+def get_notification_page(
+    notification_service: notification_service_dep,
+    limit: int,
+    cursor: str | None,
+    unread_only: bool = False,
+) -> NotificationPage:
+    try:
+        return notification_service.get_notifications(
+            limit=limit, cursor=cursor, unread_only=unread_only
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
 
 
 @router.get(
@@ -58,6 +119,37 @@ def get_notification(
 # --------------------------------
 
 
+@router.patch(
+    "/read",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(current_active_user)],
+)
+def mark_notifications_as_read(
+    notification_service: notification_service_dep,
+    notification_ids: NotificationIds | None = None,
+):
+    """
+    Mark several notifications as read. If no IDs are given, all notifications are marked as read.
+    """
+    notification_service.mark_notifications_as_read(
+        ids=notification_ids.ids if notification_ids else None
+    )
+
+
+@router.delete(
+    "",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(current_active_user)],
+)
+def delete_notifications(
+    notification_ids: NotificationIds, notification_service: notification_service_dep
+):
+    """
+    Delete several notifications. IDs that do not exist are ignored.
+    """
+    notification_service.delete_notifications(ids=notification_ids.ids)
+
+
 @router.patch(
     "/{notification_id}/read",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -25,6 +25,22 @@ class Notification(BaseModel):
     )
 
 
+class NotificationPage(BaseModel):
+    items: list[Notification]
+    next_cursor: str | None = Field(
+        None,
+        description="Pass this as cursor to get the next page, null if this is the last page",
+    )
+
+
+class UnreadNotificationCount(BaseModel):
+    count: int
+
+
+class NotificationIds(BaseModel):
+    ids: list[NotificationId]
+
+
 class MessageNotification(BaseModel):
     """
     Notification type for messages.
@@ -32,3 +48,7 @@ class MessageNotification(BaseModel):
 
     message: str
     title: str
+    addressees: list[str] | None = Field(
+        None,
+        description="Only send to these addressees of the provider, e.g. the ones sending to failed before",
+    )
@@ -1,8 +1,33 @@
+import base64
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from media_manager.config import AllEncompassingConfig
+from media_manager.database import get_session
+from media_manager.events.bus import event_bus
+from media_manager.events.schemas import EventType
 from media_manager.notification.repository import NotificationRepository
-from media_manager.notification.schemas import NotificationId, Notification
+from media_manager.notification.schemas import (
+    NotificationId,
+    Notification,
+    NotificationPage,
+)
 from media_manager.notification.manager import notification_manager
 
 
+def encode_notification_cursor(notification: Notification) -> str:
+    value = f"{notification.timestamp.isoformat()}|{notification.id}"
+    return base64.urlsafe_b64encode(value.encode()).decode()
+
+
+def decode_notification_cursor(cursor: str) -> tuple[datetime, NotificationId]:
+    """
+    :raises ValueError: If the cursor is malformed.
+    """
+    timestamp, _, id = base64.urlsafe_b64decode(cursor).decode().partition("|")
+    return datetime.fromisoformat(timestamp), NotificationId(UUID(id))
+
+
 class NotificationService:
     def __init__(
         self,
@@ -14,11 +39,32 @@ class NotificationService:
     def get_notification(self, id: NotificationId) -> Notification:
         return self.notification_repository.get_notification(id=id)
 
-    def get_unread_notifications(self) -> list[Notification]:
-        return self.notification_repository.get_unread_notifications()
+    def get_notifications(
+        self, limit: int, cursor: str | None = None, unread_only: bool = False
+    ) -> NotificationPage:
+        """
+        Get a page of notifications, newest first.
+
+        :param limit: The maximum number of notifications to return.
+        :param cursor: The next_cursor of the previous page, None for the first page.
+        :param unread_only: Only return unread notifications.
+        :raises ValueError: If the cursor is malformed.
+        """
+        before = decode_notification_cursor(cursor) if cursor else None
+        # fetch one more than requested to know whether there is a next page
+        notifications = self.notification_repository.get_notifications(
+            limit=limit + 1, before=before, unread_only=unread_only
+        )
+        if len(notifications) <= limit:
+            return NotificationPage(items=notifications)
+        notifications = notifications[:limit]
+        return NotificationPage(
+            items=notifications,
+            next_cursor=encode_notification_cursor(notifications[-1]),
+        )
 
-    def get_all_notifications(self) -> list[Notification]:
-        return self.notification_repository.get_all_notifications()
+    def get_unread_notification_count(self) -> int:
+        return self.notification_repository.get_unread_notification_count()
 
     def save_notification(self, notification: Notification) -> None:
         return self.notification_repository.save_notification(notification)
@@ -29,12 +75,39 @@ class NotificationService:
     def mark_notification_as_unread(self, id: NotificationId) -> None:
         return self.notification_repository.mark_notification_as_unread(id=id)
 
+    def mark_notifications_as_read(self, ids: list[NotificationId] | None) -> int:
+        return self.notification_repository.mark_notifications_as_read(ids=ids)
+
     def delete_notification(self, id: NotificationId) -> None:
         return self.notification_repository.delete_notification(id=id)
 
+    def delete_notifications(self, ids: list[NotificationId]) -> int:
+        return self.notification_repository.delete_notifications(ids=ids)
+
+    def delete_old_notifications(self, retention_days: int) -> int:
+        cutoff = datetime.now() - timedelta(days=retention_days)
+        return self.notification_repository.delete_notifications_older_than(cutoff)
+
     def send_notification_to_all_providers(self, title: str, message: str) -> None:
         self.notification_manager.send_notification(title, message)
 
         internal_notification = Notification(message=f"{title}: {message}", read=False)
         self.save_notification(internal_notification)
+        event_bus.publish(
+            type=EventType.notification,
+            data=internal_notification.model_dump(mode="json"),
+        )
         return
+
+
+def delete_old_notifications() -> None:
+    """
+    Deletes all notifications older than notifications.retention_days.
+    This is a standalone function as it creates its own DB session.
+    """
+    retention_days = AllEncompassingConfig().notifications.retention_days
+    with next(get_session()) as db:
+        notification_service = NotificationService(
+            notification_repository=NotificationRepository(db=db)
+        )
+        notification_service.delete_old_notifications(retention_days=retention_days)
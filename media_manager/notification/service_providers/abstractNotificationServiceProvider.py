@@ -1,6 +1,10 @@
 import abc
+import logging
+
 from media_manager.notification.schemas import MessageNotification
 
+log = logging.getLogger(__name__)
+
 
 class AbstractNotificationServiceProvider(abc.ABC):
     @abc.abstractmethod
@@ -12,3 +16,24 @@ class AbstractNotificationServiceProvider(abc.ABC):
         :return: True if the notification was sent successfully, False otherwise.
         """
         pass
+
+    def send_notifications(
+        self, messages: list[MessageNotification]
+    ) -> list[MessageNotification]:
+        """
+        Sends several notifications. Providers that can reuse a connection for a batch should override this.
+
+        :param messages: The messages to send.
+        :return: The messages that could not be sent.
+        """
+        failed_messages = []
+        for message in messages:
+            try:
+                if not self.send_notification(message):
+                    failed_messages.append(message)
+            except Exception as e:
+                log.error(
+                    f"Error sending notification via {self.__class__.__name__}: {e}"
+                )
+                failed_messages.append(message)
+        return failed_messages
@@ -1,3 +1,5 @@
+import logging
+
 import media_manager.notification.utils
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstractNotificationServiceProvider import (
@@ -5,28 +7,56 @@ from media_manager.notification.service_providers.abstractNotificationServicePro
 )
 from media_manager.config import AllEncompassingConfig
 
+log = logging.getLogger(__name__)
+
 
 class EmailNotificationServiceProvider(AbstractNotificationServiceProvider):
     def __init__(self):
         self.config = AllEncompassingConfig().notifications.email_notifications
 
     def send_notification(self, message: MessageNotification) -> bool:
-        subject = "MediaManager - " + message.title
-        html = f"""\
+        return not self.send_notifications([message])
+
+    def send_notifications(
+        self, messages: list[MessageNotification]
+    ) -> list[MessageNotification]:
+        """
+        Sends all messages to all addressees over a single SMTP connection.
+        A message that could not be sent to some addressees is returned with only those as its addressees, so
+        retrying it does not send it to the others again.
+        """
+        failed_messages = []
+        with media_manager.notification.utils.open_smtp_connection() as server:
+            for message in messages:
+                failed_addressees = []
+                for email in message.addressees or self.config.emails:
+                    try:
+                        media_manager.notification.utils.send_email(
+                            subject="MediaManager - " + message.title,
+                            html=self.__render(message),
+                            addressee=email,
+                            server=server,
+                        )
+                    except Exception as e:
+                        log.error(f"Error sending email notification to {email}: {e}")
+                        failed_addressees.append(email)
+                if failed_addressees:
+                    failed_messages.append(
+                        message.model_copy(update={"addressees": failed_addressees})
+                    )
+        return failed_messages
+
+    @staticmethod
+    def __render(message: MessageNotification) -> str:
+        body = message.message.replace("\n", "<br>")
+        return f"""\
                 <html>
                   <body>
                     <br>
-                    {message.message}
+                    {body}
                     <br>
                     <br>
                     This is an automated message from MediaManager.</p>
                   </body>
                 </html>
                 """
-
-        for email in self.config.emails:
-            media_manager.notification.utils.send_email(
-                subject=subject, html=html, addressee=email
-            )
-
-        return True
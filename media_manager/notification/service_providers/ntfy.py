@@ -1,6 +1,5 @@
-import requests
-
 from media_manager.config import AllEncompassingConfig
+from media_manager.http.client import http_client
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstractNotificationServiceProvider import (
     AbstractNotificationServiceProvider,
@@ -16,7 +15,7 @@ class NtfyNotificationServiceProvider(AbstractNotificationServiceProvider):
         self.config = AllEncompassingConfig().notifications.ntfy
 
     def send_notification(self, message: MessageNotification) -> bool:
-        response = requests.post(
+        response = http_client.post(
             url=self.config.url,
             data=message.message.encode(encoding="utf-8"),
             headers={
@@ -1,6 +1,5 @@
-import requests
-
 from media_manager.config import AllEncompassingConfig
+from media_manager.http.client import http_client
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstractNotificationServiceProvider import (
     AbstractNotificationServiceProvider,
@@ -12,7 +11,7 @@ class PushoverNotificationServiceProvider(AbstractNotificationServiceProvider):
         self.config = AllEncompassingConfig().notifications.pushover
 
     def send_notification(self, message: MessageNotification) -> bool:
-        response = requests.post(
+        response = http_client.post(
             url="https://api.pushover.net/1/messages.json",
             params={
                 "token": self.config.api_key,
@@ -1,25 +1,45 @@
 import logging
 import smtplib
+from contextlib import contextmanager
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import Iterator
 
 from media_manager.config import AllEncompassingConfig
 
 log = logging.getLogger(__name__)
 
 
-def send_email(subject: str, html: str, addressee: str) -> None:
+@contextmanager
+def open_smtp_connection() -> Iterator[smtplib.SMTP]:
+    """
+    Opens an authenticated connection to the configured SMTP server, which can be used to send several emails.
+    """
+    email_conf = AllEncompassingConfig().notifications.smtp_config
+    with smtplib.SMTP(email_conf.smtp_host, email_conf.smtp_port) as server:
+        if email_conf.use_tls:
+            server.starttls()
+        server.login(email_conf.smtp_user, email_conf.smtp_password)
+        yield server
+
+
+def send_email(
+    subject: str, html: str, addressee: str, server: smtplib.SMTP | None = None
+) -> None:
+    """
+    Sends an email. If no server is given, a new SMTP connection is opened just for this email.
+    """
+    if server is None:
+        with open_smtp_connection() as server:
+            send_email(subject=subject, html=html, addressee=addressee, server=server)
+        return
+
     email_conf = AllEncompassingConfig().notifications.smtp_config
     message = MIMEMultipart()
     message["From"] = email_conf.from_email
     message["To"] = addressee
     message["Subject"] = str(subject)
     message.attach(MIMEText(html, "html"))
-
-    with smtplib.SMTP(email_conf.smtp_host, email_conf.smtp_port) as server:
-        if email_conf.use_tls:
-            server.starttls()
-        server.login(email_conf.smtp_user, email_conf.smtp_password)
-        server.sendmail(email_conf.from_email, addressee, message.as_string())
+    server.sendmail(email_conf.from_email, addressee, message.as_string())
 
     log.info(f"Successfully sent email to {addressee} with subject: {subject}")
@@ -0,0 +1,99 @@
+"""
+Cache for the JSON responses of read-mostly library endpoints.
+
+Every cached response belongs to a namespace (e.g. "tv" or "movies") with a version counter, which the repositories
+bump after they committed a change. The serialized bodies of unchanged responses are served from memory instead of
+being rebuilt from the database. Bumps are broadcast to the other processes, so a change made by the worker or
+another API replica invalidates their responses too.
+ETags are the hash of the body, so every replica issues the same ETag for the same content and clients can
+revalidate with If-None-Match on any of them, even across restarts, and get a 304 as long as nothing changed.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable
+
+from cachetools import LRUCache
+from fastapi import Request, Response, status
+
+from media_manager.config import AllEncompassingConfig
+from media_manager.database.broadcast import broadcast
+from media_manager.responses import dump_json, etag_matches
+
+log = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int):
+        self._versions: defaultdict[str, int] = defaultdict(int)
+        self._bodies: LRUCache = LRUCache(maxsize=max_entries)
+        self._lock = threading.Lock()
+
+    def get_version(self, namespace: str) -> int:
+        with self._lock:
+            return self._versions[namespace]
+
+    def bump(self, namespace: str) -> None:
+        """
+        Invalidates all cached responses of a namespace, call it after changes to it were committed.
+        """
+        self.receive_broadcast(namespace)
+        broadcast.send("response_cache", namespace)
+
+    def receive_broadcast(self, namespace: str) -> None:
+        with self._lock:
+            self._versions[namespace] += 1
+        log.debug(f"Bumped response cache version of {namespace}")
+
+    def bump_all(self) -> None:
+        with self._lock:
+            for namespace in self._versions:
+                self._versions[namespace] += 1
+            self._bodies.clear()
+        log.debug("Bumped response cache version of all namespaces")
+
+    def get_response(
+        self,
+        request: Request,
+        namespace: str,
+        response_model: Any,
+        build: Callable[[], Any],
+    ) -> Response:
+        """
+        Returns the cached response for the request, builds and caches it with the build function if needed,
+        or returns a 304 response if the client's ETag is still current.
+
+        :param request: The request to respond to, its path and query string identify the response.
+        :param namespace: The namespace whose version the response depends on.
+        :param response_model: The type the result of the build function is serialized as.
+        :param build: Returns the content of the response.
+        """
+        version = self.get_version(namespace)
+        key = f"{namespace}:{version}:{request.url.path}?{request.url.query}"
+
+        with self._lock:
+            cached = self._bodies.get(key)
+        if cached is None:
+            body = dump_json(response_model, build())
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            with self._lock:
+                self._bodies[key] = (body, etag)
+        else:
+            body, etag = cached
+
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+response_cache = ResponseCache(
+    max_entries=AllEncompassingConfig().misc.response_cache_size
+)
+broadcast.subscribe(
+    "response_cache",
+    response_cache.receive_broadcast,
+    on_connect=response_cache.bump_all,
+)
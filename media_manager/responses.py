@@ -0,0 +1,55 @@
+"""
+Fast serialization of large JSON responses.
+
+FastAPI validates whatever a route returns against its response_model again, even though the repositories
+already validated every row into a schema. Routes with large list responses return a ModelResponse instead,
+which serializes the content to JSON bytes with pydantic in one step. Model instances of the response model are
+not validated again, so every object is only validated once. The route should still declare its response_model,
+so the OpenAPI schema stays the same.
+"""
+
+import functools
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@functools.lru_cache
+def _get_type_adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def dump_json(response_model: Any, content: Any) -> bytes:
+    """
+    Serializes the content as the response model to JSON bytes.
+
+    :param response_model: The type the content is serialized as, e.g. list[Show].
+    :param content: The content, it is only validated if it isn't an instance of the response model already.
+    """
+    adapter = _get_type_adapter(response_model)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Whether the If-None-Match header matches the ETag, using the weak comparison RFC 9110 prescribes for it.
+
+    :param if_none_match: The value of the If-None-Match header, a comma-separated list of entity tags or "*".
+    :param etag: The current entity tag of the resource, including its quotes.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+class ModelResponse(Response):
+    media_type = "application/json"
+
+    def __init__(self, content: Any, response_model: Any, **kwargs):
+        super().__init__(content=dump_json(response_model, content), **kwargs)
@@ -37,3 +37,5 @@ class TorrentConfig(BaseSettings):
     qbittorrent: QbittorrentConfig = QbittorrentConfig()
     transmission: TransmissionConfig = TransmissionConfig()
     sabnzbd: SabnzbdConfig = SabnzbdConfig()
+
+    status_refresh_interval: int = 60  # seconds between fetching the status of the running torrents from the download clients
@@ -3,6 +3,7 @@ from enum import Enum
 
 from media_manager.config import AllEncompassingConfig
 from media_manager.indexer.schemas import IndexerQueryResult
+from media_manager.metrics.metrics import observe_download_client_call
 from media_manager.torrent.download_clients.abstractDownloadClient import (
     AbstractDownloadClient,
 )
@@ -113,7 +114,8 @@ class DownloadManager:
         log.info(f"Processing download request for: {indexer_result.title}")
 
         client = self._get_appropriate_client(indexer_result)
-        return client.download_torrent(indexer_result)
+        with observe_download_client_call(client=client.name, operation="download"):
+            return client.download_torrent(indexer_result)
 
     def remove_torrent(self, torrent: Torrent, delete_data: bool = False) -> None:
         """
@@ -125,7 +127,8 @@ class DownloadManager:
         log.info(f"Removing torrent: {torrent.title}")
 
         client = self._get_appropriate_client(torrent)
-        client.remove_torrent(torrent, delete_data)
+        with observe_download_client_call(client=client.name, operation="remove"):
+            client.remove_torrent(torrent, delete_data)
 
     def get_torrent_status(self, torrent: Torrent) -> TorrentStatus:
         """
@@ -135,7 +138,8 @@ class DownloadManager:
         :return: The current status of the torrent
         """
         client = self._get_appropriate_client(torrent)
-        return client.get_torrent_status(torrent)
+        with observe_download_client_call(client=client.name, operation="status"):
+            return client.get_torrent_status(torrent)
 
     def pause_torrent(self, torrent: Torrent) -> None:
         """
@@ -146,7 +150,8 @@ class DownloadManager:
         log.info(f"Pausing torrent: {torrent.title}")
 
         client = self._get_appropriate_client(torrent)
-        client.pause_torrent(torrent)
+        with observe_download_client_call(client=client.name, operation="pause"):
+            client.pause_torrent(torrent)
 
     def resume_torrent(self, torrent: Torrent) -> None:
         """
@@ -157,4 +162,5 @@ class DownloadManager:
         log.info(f"Resuming torrent: {torrent.title}")
 
         client = self._get_appropriate_client(torrent)
-        client.resume_torrent(torrent)
+        with observe_download_client_call(client=client.name, operation="resume"):
+            client.resume_torrent(torrent)
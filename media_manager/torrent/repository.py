@@ -2,7 +2,11 @@ from sqlalchemy import select
 
 from media_manager.database import DbSessionDependency
 from media_manager.torrent.models import Torrent
-from media_manager.torrent.schemas import TorrentId, Torrent as TorrentSchema
+from media_manager.torrent.schemas import (
+    TorrentId,
+    Torrent as TorrentSchema,
+    TorrentStatus,
+)
 from media_manager.tv.models import SeasonFile, Show, Season
 from media_manager.tv.schemas import SeasonFile as SeasonFileSchema, Show as ShowSchema
 from media_manager.exceptions import NotFoundError
@@ -11,6 +15,7 @@ from media_manager.movies.schemas import (
     Movie as MovieSchema,
     MovieFile as MovieFileSchema,
 )
+from media_manager.response_cache import response_cache
 
 
 class TorrentRepository:
@@ -37,8 +42,17 @@ class TorrentRepository:
         return ShowSchema.model_validate(result)
 
     def save_torrent(self, torrent: TorrentSchema) -> TorrentSchema:
+        stored = self.db.get(Torrent, torrent.id)
+        # only the status and the imported flag are part of the cached responses
+        changed = (
+            stored is None
+            or stored.status != torrent.status
+            or stored.imported != torrent.imported
+        )
         self.db.merge(Torrent(**torrent.model_dump()))
         self.db.commit()
+        if changed:
+            self.bump_response_cache()
         return TorrentSchema.model_validate(torrent)
 
     def get_all_torrents(self) -> list[TorrentSchema]:
@@ -49,6 +63,13 @@ class TorrentRepository:
             TorrentSchema.model_validate(torrent_schema) for torrent_schema in result
         ]
 
+    def get_active_torrents(self) -> list[TorrentSchema]:
+        stmt = select(Torrent).where(
+            Torrent.imported.is_(False), Torrent.status != TorrentStatus.finished
+        )
+        result = self.db.execute(stmt).scalars().all()
+        return [TorrentSchema.model_validate(torrent) for torrent in result]
+
     def get_torrent_by_id(self, torrent_id: TorrentId) -> TorrentSchema:
         result = self.db.get(Torrent, torrent_id)
         if result is None:
@@ -57,6 +78,14 @@ class TorrentRepository:
 
     def delete_torrent(self, torrent_id: TorrentId):
         self.db.delete(self.db.get(Torrent, torrent_id))
+        self.db.commit()
+        self.bump_response_cache()
+
+    @staticmethod
+    def bump_response_cache() -> None:
+        # the status and the imported flag of torrents are part of the show and movie responses
+        response_cache.bump("tv")
+        response_cache.bump("movies")
 
     def get_movie_of_torrent(self, torrent_id: TorrentId):
         stmt = (
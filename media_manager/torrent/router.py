@@ -3,6 +3,8 @@ from fastapi import status
 from fastapi.params import Depends
 
 from media_manager.auth.users import current_active_user
+from media_manager.concurrency import blocking_io
+from media_manager.responses import ModelResponse
 from media_manager.torrent.dependencies import torrent_service_dep, torrent_dep
 from media_manager.torrent.schemas import Torrent
 
@@ -10,6 +12,7 @@ router = APIRouter()
 
 
 @router.get("/{torrent_id}", status_code=status.HTTP_200_OK, response_model=Torrent)
+@blocking_io
 def get_torrent(service: torrent_service_dep, torrent: torrent_dep):
     return service.get_torrent_by_id(torrent_id=torrent.id)
 
@@ -20,5 +23,6 @@ def get_torrent(service: torrent_service_dep, torrent: torrent_dep):
     dependencies=[Depends(current_active_user)],
     response_model=list[Torrent],
 )
+@blocking_io
 def get_all_torrents(service: torrent_service_dep):
-    return service.get_all_torrents()
+    return ModelResponse(service.get_all_torrents(), response_model=list[Torrent])
@@ -1,5 +1,8 @@
 import logging
 
+from media_manager.database import get_session
+from media_manager.events.bus import event_bus
+from media_manager.events.schemas import EventType
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.torrent.manager import DownloadManager
 from media_manager.torrent.repository import TorrentRepository
@@ -55,9 +58,16 @@ class TorrentService:
     def get_torrent_status(self, torrent: Torrent) -> Torrent:
         log.info(f"Fetching status for torrent: {torrent.title}")
 
+        previous_status = torrent.status
         torrent.status = self.download_manager.get_torrent_status(torrent)
+        if torrent.status == previous_status:
+            return torrent
 
         self.torrent_repository.save_torrent(torrent=torrent)
+        event_bus.publish(
+            type=EventType.torrent_status,
+            data=torrent.model_dump(mode="json"),
+        )
         return torrent
 
     def cancel_download(self, torrent: Torrent, delete_files: bool = False) -> Torrent:
@@ -100,6 +110,17 @@ class TorrentService:
                 log.error(f"Error fetching status for torrent {x.title}: {e}")
         return torrents
 
+    def refresh_active_torrents(self) -> None:
+        """
+        Fetches the status of the torrents that are still downloading, i.e. neither finished nor imported.
+        Torrents in the error state are included, they may recover once the issue was fixed in the download client.
+        """
+        for torrent in self.torrent_repository.get_active_torrents():
+            try:
+                self.get_torrent_status(torrent)
+            except RuntimeError as e:
+                log.error(f"Error fetching status for torrent {torrent.title}: {e}")
+
     def get_torrent_by_id(self, torrent_id: TorrentId) -> Torrent:
         return self.get_torrent_status(
             self.torrent_repository.get_torrent_by_id(torrent_id=torrent_id)
@@ -115,3 +136,15 @@ class TorrentService:
 
     def get_movie_files_of_torrent(self, torrent: Torrent):
         return self.torrent_repository.get_movie_files_of_torrent(torrent_id=torrent.id)
+
+
+def refresh_all_torrent_statuses() -> None:
+    """
+    Fetches the status of the active torrents from the download clients, status changes are published as events.
+    Finished torrents are refreshed by the importers, which fetch the status of all torrents.
+    This is a standalone function as it creates its own DB session.
+    """
+    with next(get_session()) as db:
+        TorrentService(
+            torrent_repository=TorrentRepository(db=db)
+        ).refresh_active_torrents()
@@ -7,10 +7,11 @@ import shutil
 
 import bencoder
 import patoolib
-import requests
 import libtorrent
 from media_manager.config import AllEncompassingConfig
+from media_manager.http.client import http_client
 from media_manager.indexer.schemas import IndexerQueryResult
+from media_manager.metrics.metrics import IMPORT_BYTES
 from media_manager.torrent.schemas import Torrent
 
 log = logging.getLogger(__name__)
@@ -67,6 +68,7 @@ def import_file(target_file: Path, source_file: Path):
         target_file.unlink()
     try:
         target_file.hardlink_to(source_file)
+        IMPORT_BYTES.labels(method="hardlink").inc(source_file.stat().st_size)
     except FileExistsError:
         log.error(f"File already exists at {target_file}. ")
     except OSError as e:
@@ -75,6 +77,7 @@ def import_file(target_file: Path, source_file: Path):
             "Falling back to copying the file."
         )
         shutil.copy(src=source_file, dst=target_file)
+        IMPORT_BYTES.labels(method="copy").inc(source_file.stat().st_size)
 
 
 def import_torrent(torrent: Torrent) -> (list[Path], list[Path], list[Path]):
@@ -84,7 +87,7 @@ def import_torrent(torrent: Torrent) -> (list[Path], list[Path], list[Path]):
     """
     log.info(f"Importing torrent {torrent}")
     all_files = list_files_recursively(path=get_torrent_filepath(torrent=torrent))
-    log.debug(f"Found {len(all_files)} files downloaded by the torrent")
+    log.debug("Found %s files downloaded by the torrent", len(all_files))
     extract_archives(all_files)
     all_files = list_files_recursively(path=get_torrent_filepath(torrent=torrent))
 
@@ -95,13 +98,14 @@ def import_torrent(torrent: Torrent) -> (list[Path], list[Path], list[Path]):
         if file_type is not None:
             if file_type.startswith("video"):
                 video_files.append(file)
-                log.debug(f"File is a video, it will be imported: {file}")
+                log.debug("File is a video, it will be imported: %s", file)
             elif file_type.startswith("text") and Path(file).suffix == ".srt":
                 subtitle_files.append(file)
-                log.debug(f"File is a subtitle, it will be imported: {file}")
+                log.debug("File is a subtitle, it will be imported: %s", file)
             else:
                 log.debug(
-                    f"File is neither a video nor a subtitle, will not be imported: {file}"
+                    "File is neither a video nor a subtitle, will not be imported: %s",
+                    file,
                 )
 
     log.info(
@@ -131,7 +135,7 @@ def get_torrent_hash(torrent: IndexerQueryResult) -> str:
         # downloading the torrent file
         log.info(f"Downloading .torrent file of torrent: {torrent.title}")
         try:
-            response = requests.get(str(torrent.download_url), timeout=30)
+            response = http_client.get(str(torrent.download_url), timeout=30)
             response.raise_for_status()
             torrent_content = response.content
         except Exception as e:
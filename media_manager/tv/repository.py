@@ -1,19 +1,21 @@
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func, tuple_
 from sqlalchemy.exc import (
     IntegrityError,
     SQLAlchemyError,
 )  # Keep SQLAlchemyError for broader exception handling
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from media_manager.torrent.models import Torrent
 from media_manager.torrent.schemas import TorrentId, Torrent as TorrentSchema
 from media_manager.tv import log
 from media_manager.tv.models import Season, Show, Episode, SeasonRequest, SeasonFile
 from media_manager.exceptions import NotFoundError
+from media_manager.response_cache import response_cache
 from media_manager.tv.schemas import (
     Season as SeasonSchema,
     SeasonId,
     Show as ShowSchema,
+    ShowSummary as ShowSummarySchema,
     ShowId,
     Episode as EpisodeSchema,  # Added EpisodeSchema import
     SeasonRequest as SeasonRequestSchema,
@@ -48,9 +50,9 @@ class TvRepository:
             stmt = (
                 select(Show)
                 .where(Show.id == show_id)
-                .options(joinedload(Show.seasons).joinedload(Season.episodes))
+                .options(selectinload(Show.seasons).selectinload(Season.episodes))
             )
-            result = self.db.execute(stmt).unique().scalar_one_or_none()
+            result = self.db.execute(stmt).scalar_one_or_none()
             if not result:
                 log.warning(f"Show with id {show_id} not found.")
                 raise NotFoundError(f"Show with id {show_id} not found.")
@@ -80,9 +82,9 @@ class TvRepository:
                 select(Show)
                 .where(Show.external_id == external_id)
                 .where(Show.metadata_provider == metadata_provider)
-                .options(joinedload(Show.seasons).joinedload(Season.episodes))
+                .options(selectinload(Show.seasons).selectinload(Season.episodes))
             )
-            result = self.db.execute(stmt).unique().scalar_one_or_none()
+            result = self.db.execute(stmt).scalar_one_or_none()
             if not result:
                 log.warning(
                     f"Show with external_id {external_id} and provider {metadata_provider} not found."
@@ -100,6 +102,30 @@ class TvRepository:
             )
             raise
 
+    def get_existing_show_external_ids(
+        self, external_ids: list[tuple[int, str]]
+    ) -> set[tuple[int, str]]:
+        """
+        Check which of the given (external ID, metadata provider) pairs belong to a show in the database.
+
+        :param external_ids: The (external ID, metadata provider) pairs to check.
+        :return: The subset of the given pairs that exist in the database.
+        :raises SQLAlchemyError: If a database error occurs.
+        """
+        if not external_ids:
+            return set()
+        log.debug(f"Checking existence of {len(external_ids)} shows by external_id.")
+        try:
+            stmt = select(Show.external_id, Show.metadata_provider).where(
+                tuple_(Show.external_id, Show.metadata_provider).in_(external_ids)
+            )
+            results = self.db.execute(stmt).all()
+            log.info(f"Found {len(results)} of {len(external_ids)} shows.")
+            return {(external_id, provider) for external_id, provider in results}
+        except SQLAlchemyError as e:
+            log.error(f"Database error while checking existence of shows: {e}")
+            raise
+
     def get_shows(self) -> list[ShowSchema]:
         """
         Retrieve all shows from the database.
@@ -110,15 +136,78 @@ class TvRepository:
         log.debug("Attempting to retrieve all shows.")
         try:
             stmt = select(Show).options(
-                joinedload(Show.seasons).joinedload(Season.episodes)
+                selectinload(Show.seasons).selectinload(Season.episodes)
             )  # Eager load seasons and episodes
-            results = self.db.execute(stmt).scalars().unique().all()
+            results = self.db.execute(stmt).scalars().all()
             log.info(f"Successfully retrieved {len(results)} shows.")
             return [ShowSchema.model_validate(show) for show in results]
         except SQLAlchemyError as e:
             log.error(f"Database error while retrieving all shows: {e}")
             raise
 
+    def get_show_summaries(self, limit: int, offset: int) -> list[ShowSummarySchema]:
+        """
+        Retrieve a page of shows, ordered alphabetically by name, without loading their seasons and episodes.
+
+        :param limit: The maximum number of shows to return.
+        :param offset: The number of shows to skip.
+        :return: A list of ShowSummary objects, including season and episode counts.
+        :raises SQLAlchemyError: If a database error occurs.
+        """
+        log.debug(
+            f"Attempting to retrieve show summaries (limit={limit}, offset={offset})."
+        )
+        try:
+            season_count = (
+                select(func.count(Season.id))
+                .where(Season.show_id == Show.id)
+                .scalar_subquery()
+            )
+            episode_count = (
+                select(func.count(Episode.id))
+                .join(Season, Episode.season_id == Season.id)
+                .where(Season.show_id == Show.id)
+                .scalar_subquery()
+            )
+            stmt = (
+                select(
+                    Show.id,
+                    Show.name,
+                    Show.overview,
+                    Show.year,
+                    Show.ended,
+                    Show.external_id,
+                    Show.metadata_provider,
+                    Show.continuous_download,
+                    Show.library,
+                    season_count.label("season_count"),
+                    episode_count.label("episode_count"),
+                )
+                .order_by(Show.name, Show.id)
+                .limit(limit)
+                .offset(offset)
+            )
+            results = self.db.execute(stmt).all()
+            log.info(f"Successfully retrieved {len(results)} show summaries.")
+            return [ShowSummarySchema.model_validate(row) for row in results]
+        except SQLAlchemyError as e:
+            log.error(f"Database error while retrieving show summaries: {e}")
+            raise
+
+    def get_show_count(self) -> int:
+        """
+        Count all shows in the database.
+
+        :return: The number of shows.
+        :raises SQLAlchemyError: If a database error occurs.
+        """
+        log.debug("Attempting to count all shows.")
+        try:
+            return self.db.execute(select(func.count(Show.id))).scalar_one()
+        except SQLAlchemyError as e:
+            log.error(f"Database error while counting shows: {e}")
+            raise
+
     def save_show(self, show: ShowSchema) -> ShowSchema:
         """
         Save a new show or update an existing one in the database.
@@ -174,6 +263,7 @@ class TvRepository:
 
         try:
             self.db.commit()
+            response_cache.bump("tv")
             self.db.refresh(db_show)
             log.info(f"Successfully saved show: {db_show.name} (ID: {db_show.id})")
             return ShowSchema.model_validate(db_show)
@@ -204,6 +294,7 @@ class TvRepository:
                 raise NotFoundError(f"Show with id {show_id} not found.")
             self.db.delete(show)
             self.db.commit()
+            response_cache.bump("tv")
             log.info(f"Successfully deleted show with id: {show_id}")
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -384,6 +475,7 @@ class TvRepository:
         try:
             self.db.add(db_model)
             self.db.commit()
+            response_cache.bump("tv")
             self.db.refresh(db_model)
             # Assuming SeasonFile model has an 'id' attribute after refresh for logging.
             # If not, this line or the model needs adjustment.
@@ -413,6 +505,7 @@ class TvRepository:
             stmt = delete(SeasonFile).where(SeasonFile.torrent_id == torrent_id)
             result = self.db.execute(stmt)
             self.db.commit()
+            response_cache.bump("tv")
             deleted_count = result.rowcount  # rowcount is an int, not a callable
             log.info(
                 f"Successfully removed {deleted_count} season files for torrent_id: {torrent_id}"
@@ -442,6 +535,7 @@ class TvRepository:
                 raise NotFoundError(f"Show with id {show_id} not found.")
             show.library = library
             self.db.commit()
+            response_cache.bump("tv")
             log.info(f"Successfully set library for show_id {show_id} to {library}")
         except SQLAlchemyError as e:
             self.db.rollback()
@@ -513,10 +607,10 @@ class TvRepository:
                 .join(Season, Show.id == Season.show_id)
                 .join(SeasonFile, Season.id == SeasonFile.season_id)
                 .join(Torrent, SeasonFile.torrent_id == Torrent.id)
-                .options(joinedload(Show.seasons).joinedload(Season.episodes))
+                .options(selectinload(Show.seasons).selectinload(Season.episodes))
                 .order_by(Show.name)
             )
-            results = self.db.execute(stmt).scalars().unique().all()
+            results = self.db.execute(stmt).scalars().all()
             log.info(f"Successfully retrieved {len(results)} shows with torrents.")
             return [ShowSchema.model_validate(show) for show in results]
         except SQLAlchemyError as e:
@@ -594,9 +688,9 @@ class TvRepository:
                 select(Show)
                 .join(Season, Show.id == Season.show_id)
                 .where(Season.id == season_id)
-                .options(joinedload(Show.seasons).joinedload(Season.episodes))
+                .options(selectinload(Show.seasons).selectinload(Season.episodes))
             )
-            result = self.db.execute(stmt).unique().scalar_one_or_none()
+            result = self.db.execute(stmt).scalar_one_or_none()
             if not result:
                 log.warning(f"Show for season_id {season_id} not found.")
                 raise NotFoundError(f"Show for season_id {season_id} not found.")
@@ -658,6 +752,7 @@ class TvRepository:
 
         self.db.add(db_season)
         self.db.commit()
+        response_cache.bump("tv")
         self.db.refresh(db_season)
         log.info(
             f"Successfully added season {db_season.number} (ID: {db_season.id}) to show {show_id}."
@@ -709,6 +804,7 @@ class TvRepository:
 
         self.db.add(db_episode)
         self.db.commit()
+        response_cache.bump("tv")
         self.db.refresh(db_episode)
         log.info(
             f"Successfully added episode {db_episode.number} (ID: {db_episode.id}) to season {season_id}."
@@ -762,6 +858,7 @@ class TvRepository:
 
         if updated:
             self.db.commit()
+            response_cache.bump("tv")
             self.db.refresh(db_show)
             log.info(f"Successfully updated attributes for show ID: {show_id}")
         else:
@@ -798,6 +895,7 @@ class TvRepository:
 
         if updated:
             self.db.commit()
+            response_cache.bump("tv")
             self.db.refresh(db_season)
             log.info(f"Successfully updated attributes for season ID: {season_id}")
         else:
@@ -830,6 +928,7 @@ class TvRepository:
 
         if updated:
             self.db.commit()
+            response_cache.bump("tv")
             self.db.refresh(db_episode)
             log.info(f"Successfully updated attributes for episode ID: {episode_id}")
         else:
@@ -1,14 +1,17 @@
 from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 
 from media_manager.auth.db import User
 from media_manager.auth.schemas import UserRead
 from media_manager.auth.users import current_active_user, current_superuser
+from media_manager.concurrency import blocking_io
 from media_manager.config import AllEncompassingConfig, LibraryItem
 from media_manager.indexer.schemas import PublicIndexerQueryResult, IndexerQueryResultId
 from media_manager.metadataProvider.schemas import MetaDataProviderSearchResult
+from media_manager.response_cache import response_cache
+from media_manager.responses import ModelResponse
 from media_manager.torrent.schemas import Torrent
 from media_manager.tv import log
 from media_manager.exceptions import MediaAlreadyExists
@@ -24,6 +27,7 @@ from media_manager.tv.schemas import (
     UpdateSeasonRequest,
     RichSeasonRequest,
     Season,
+    ShowSummaryPage,
 )
 from media_manager.tv.dependencies import (
     season_dep,
@@ -53,6 +57,7 @@ router = APIRouter()
         status.HTTP_409_CONFLICT: {"model": str, "description": "Show already exists"},
     },
 )
+@blocking_io
 def add_a_show(
     tv_service: tv_service_dep, metadata_provider: metadata_provider_dep, show_id: int
 ):
@@ -83,10 +88,26 @@ def delete_a_show(tv_repository: tv_repository_dep, show: show_dep):
 
 
 @router.get(
-    "/shows", dependencies=[Depends(current_active_user)], response_model=list[Show]
+    "/shows",
+    dependencies=[Depends(current_active_user)],
+    response_model=ShowSummaryPage,
 )
-def get_all_shows(tv_service: tv_service_dep):
-    return tv_service.get_all_shows()
+def get_all_shows(
+    request: Request,
+    tv_service: tv_service_dep,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    offset: Annotated[int, Query(ge=0)] = 0,
+):
+    """
+    get a page of shows, ordered by name, with their season and episode counts
+    :return: A page of show summaries and the total number of shows
+    """
+    return response_cache.get_response(
+        request=request,
+        namespace="tv",
+        response_model=ShowSummaryPage,
+        build=lambda: tv_service.get_show_summaries(limit=limit, offset=offset),
+    )
 
 
 @router.get(
@@ -94,13 +115,15 @@ def get_all_shows(tv_service: tv_service_dep):
     dependencies=[Depends(current_active_user)],
     response_model=list[RichShowTorrent],
 )
+@blocking_io
 def get_shows_with_torrents(tv_service: tv_service_dep):
     """
     get all shows that are associated with torrents
     :return: A list of shows with all their torrents
     """
-    result = tv_service.get_all_shows_with_torrents()
-    return result
+    return ModelResponse(
+        tv_service.get_all_shows_with_torrents(), response_model=list[RichShowTorrent]
+    )
 
 
 @router.get(
@@ -117,8 +140,13 @@ def get_available_libraries():
     dependencies=[Depends(current_active_user)],
     response_model=PublicShow,
 )
-def get_a_show(show: show_dep, tv_service: tv_service_dep) -> PublicShow:
-    return tv_service.get_public_show_by_id(show_id=show.id)
+def get_a_show(request: Request, show_id: ShowId, tv_service: tv_service_dep):
+    return response_cache.get_response(
+        request=request,
+        namespace="tv",
+        response_model=PublicShow,
+        build=lambda: tv_service.get_public_show_by_id(show_id=show_id),
+    )
 
 
 @router.post(
@@ -126,6 +154,7 @@ def get_a_show(show: show_dep, tv_service: tv_service_dep) -> PublicShow:
     dependencies=[Depends(current_active_user)],
     response_model=PublicShow,
 )
+@blocking_io
 def update_shows_metadata(
     show: show_dep, tv_service: tv_service_dep, metadata_provider: metadata_provider_dep
 ) -> PublicShow:
@@ -158,6 +187,7 @@ def set_continuous_download(
     dependencies=[Depends(current_active_user)],
     response_model=RichShowTorrent,
 )
+@blocking_io
 def get_a_shows_torrents(show: show_dep, tv_service: tv_service_dep):
     return tv_service.get_torrents_for_show(show=show)
 
@@ -318,16 +348,20 @@ def get_season_files(
     dependencies=[Depends(current_superuser)],
     response_model=list[PublicIndexerQueryResult],
 )
+@blocking_io
 def get_torrents_for_a_season(
     tv_service: tv_service_dep,
     show_id: ShowId,
     season_number: int = 1,
     search_query_override: str = None,
 ):
-    return tv_service.get_all_available_torrents_for_a_season(
-        season_number=season_number,
-        show_id=show_id,
-        search_query_override=search_query_override,
+    return ModelResponse(
+        tv_service.get_all_available_torrents_for_a_season(
+            season_number=season_number,
+            show_id=show_id,
+            search_query_override=search_query_override,
+        ),
+        response_model=list[PublicIndexerQueryResult],
     )
 
 
@@ -338,6 +372,7 @@ def get_torrents_for_a_season(
     response_model=Torrent,
     dependencies=[Depends(current_superuser)],
 )
+@blocking_io
 def download_a_torrent(
     tv_service: tv_service_dep,
     public_indexer_result_id: IndexerQueryResultId,
@@ -361,6 +396,7 @@ def download_a_torrent(
     dependencies=[Depends(current_active_user)],
     response_model=list[MetaDataProviderSearchResult],
 )
+@blocking_io
 def search_metadata_providers_for_a_show(
     tv_service: tv_service_dep, query: str, metadata_provider: metadata_provider_dep
 ):
@@ -372,6 +408,7 @@ def search_metadata_providers_for_a_show(
     dependencies=[Depends(current_active_user)],
     response_model=list[MetaDataProviderSearchResult],
 )
+@blocking_io
 def get_recommended_shows(
     tv_service: tv_service_dep, metadata_provider: metadata_provider_dep
 ):
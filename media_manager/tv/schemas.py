@@ -59,6 +59,33 @@ class Show(BaseModel):
     seasons: list[Season]
 
 
+class ShowSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: ShowId
+
+    name: str
+    overview: str
+    year: int | None
+
+    ended: bool = False
+    external_id: int
+    metadata_provider: str
+
+    continuous_download: bool = False
+    library: str = "Default"
+
+    season_count: int
+    episode_count: int
+
+
+class ShowSummaryPage(BaseModel):
+    items: list[ShowSummary]
+    total: int
+    limit: int
+    offset: int
+
+
 class SeasonRequestBase(BaseModel):
     min_quality: Quality
     wanted_quality: Quality
@@ -1,3 +1,4 @@
+import logging
 import re
 
 from sqlalchemy.exc import IntegrityError
@@ -9,10 +10,12 @@ from media_manager.indexer.repository import IndexerRepository
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.indexer.schemas import IndexerQueryResultId
 from media_manager.indexer.utils import evaluate_indexer_query_results
+from media_manager.metadataProvider.cache import metadata_cache
 from media_manager.metadataProvider.schemas import MetaDataProviderSearchResult
 from media_manager.notification.service import NotificationService
 from media_manager.torrent.schemas import Torrent, TorrentStatus, Quality
 from media_manager.torrent.service import TorrentService
+from media_manager.metrics.metrics import IMPORT_DURATION
 from media_manager.tv import log
 from media_manager.tv.schemas import (
     Show,
@@ -30,9 +33,12 @@ from media_manager.tv.schemas import (
     RichSeasonRequest,
     EpisodeId,
     Episode as EpisodeSchema,
+    ShowSummaryPage,
 )
 from media_manager.torrent.schemas import QualityStrings
 from media_manager.tv.repository import TvRepository
+from media_manager.events.bus import event_bus
+from media_manager.events.schemas import EventType
 from media_manager.exceptions import NotFoundError
 import pprint
 from pathlib import Path
@@ -174,6 +180,24 @@ class TvService:
                 "External ID and metadata provider or Show ID must be provided"
             )
 
+    def get_existing_search_results(
+        self,
+        results: list[MetaDataProviderSearchResult],
+        metadata_provider: AbstractMetadataProvider,
+    ) -> set[tuple[int, str]]:
+        """
+        Check which metadata provider search results are already in the database, using a single query.
+
+        :param results: The search results to check.
+        :param metadata_provider: The metadata provider the results came from.
+        :return: The (external ID, metadata provider) pairs of the results that already exist.
+        """
+        return self.tv_repository.get_existing_show_external_ids(
+            external_ids=[
+                (result.external_id, metadata_provider.name) for result in results
+            ]
+        )
+
     def get_all_available_torrents_for_a_season(
         self, season_number: int, show_id: ShowId, search_query_override: str = None
     ) -> list[IndexerQueryResult]:
@@ -222,6 +246,21 @@ class TvService:
         """
         return self.tv_repository.get_shows()
 
+    def get_show_summaries(self, limit: int, offset: int) -> ShowSummaryPage:
+        """
+        Get a page of show summaries, without their seasons and episodes.
+
+        :param limit: The maximum number of shows to return.
+        :param offset: The number of shows to skip.
+        :return: A page of show summaries and the total number of shows.
+        """
+        return ShowSummaryPage(
+            items=self.tv_repository.get_show_summaries(limit=limit, offset=offset),
+            total=self.tv_repository.get_show_count(),
+            limit=limit,
+            offset=offset,
+        )
+
     def search_for_show(
         self, query: str, metadata_provider: AbstractMetadataProvider
     ) -> list[MetaDataProviderSearchResult]:
@@ -233,10 +272,11 @@ class TvService:
         :return: A list of metadata provider show search results.
         """
         results = metadata_provider.search_show(query)
+        existing_shows = self.get_existing_search_results(
+            results=results, metadata_provider=metadata_provider
+        )
         for result in results:
-            if self.check_if_show_exists(
-                external_id=result.external_id, metadata_provider=metadata_provider.name
-            ):
+            if (result.external_id, metadata_provider.name) in existing_shows:
                 result.added = True
         return results
 
@@ -250,12 +290,13 @@ class TvService:
         :return: A list of metadata provider show search results.
         """
         results: list[MetaDataProviderSearchResult] = metadata_provider.search_show()
+        existing_shows = self.get_existing_search_results(
+            results=results, metadata_provider=metadata_provider
+        )
 
         filtered_results = []
         for result in results:
-            if not self.check_if_show_exists(
-                external_id=result.external_id, metadata_provider=metadata_provider.name
-            ):
+            if (result.external_id, metadata_provider.name) not in existing_shows:
                 filtered_results.append(result)
 
         return filtered_results
@@ -499,6 +540,7 @@ class TvService:
         self.delete_season_request(season_request.id)
         return True
 
+    @IMPORT_DURATION.labels(media_type="tv").time()
     def import_torrent_files(self, torrent: Torrent, show: Show) -> None:
         """
         Organizes files from a torrent into the TV directory structure, mapping them to seasons and episodes.
@@ -511,13 +553,17 @@ class TvService:
         success: bool = True  # determines if the import was successful, if true, the Imported flag will be set to True after the import
 
         log.info(
-            f"Importing these {len(video_files)} files:\n" + pprint.pformat(video_files)
+            "Importing %d video files of torrent %s", len(video_files), torrent.title
         )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Video files:\n%s", pprint.pformat(video_files))
         misc_config = AllEncompassingConfig().misc
         show_directory_name = f"{remove_special_characters(show.name)} ({show.year})  [{show.metadata_provider}id-{show.external_id}]"
         show_file_path = None
         log.debug(
-            f"Show {show.name} without special characters: {remove_special_characters(show.name)}"
+            "Show %s without special characters: %s",
+            show.name,
+            remove_special_characters(show.name),
         )
 
         if show.library != "Default":
@@ -541,6 +587,7 @@ class TvService:
             f"Found {len(season_files)} season files associated with torrent {torrent.title}"
         )
 
+        missing_episodes: list[str] = []
         for season_file in season_files:
             season = self.get_season(season_id=season_file.season_id)
             season_path = show_file_path / Path(f"Season {season.number}")
@@ -565,7 +612,9 @@ class TvService:
                 # import subtitles
                 for subtitle_file in subtitle_files:
                     log.debug(
-                        f"Searching for pattern {subtitle_pattern} in subtitle file: {subtitle_file.name}"
+                        "Searching for pattern %s in subtitle file: %s",
+                        subtitle_pattern,
+                        subtitle_file.name,
                     )
                     regex_result = re.search(
                         subtitle_pattern, subtitle_file.name, re.IGNORECASE
@@ -573,8 +622,10 @@ class TvService:
                     if regex_result:
                         language_code = regex_result.group(1)
                         log.debug(
-                            f"Found matching pattern: {subtitle_pattern} in subtitle file: {subtitle_file.name},"
-                            + f" extracted language code: {language_code}"
+                            "Found matching pattern: %s in subtitle file: %s, extracted language code: %s",
+                            subtitle_pattern,
+                            subtitle_file.name,
+                            language_code,
                         )
                         target_subtitle_file = target_file_name.with_suffix(
                             f".{language_code}.srt"
@@ -584,35 +635,47 @@ class TvService:
                         )
                     else:
                         log.debug(
-                            f"Didn't find any pattern {subtitle_pattern} in subtitle file: {subtitle_file.name}"
+                            "Didn't find any pattern %s in subtitle file: %s",
+                            subtitle_pattern,
+                            subtitle_file.name,
                         )
 
                 # import episode videos
                 for file in video_files:
                     log.debug(
-                        f"Searching for pattern {pattern} in video file: {file.name}"
+                        "Searching for pattern %s in video file: %s", pattern, file.name
                     )
                     if re.search(pattern, file.name, re.IGNORECASE):
                         log.debug(
-                            f"Found matching pattern: {pattern} in file {file.name}"
+                            "Found matching pattern: %s in file %s", pattern, file.name
                         )
                         target_video_file = target_file_name.with_suffix(file.suffix)
                         import_file(target_file=target_video_file, source_file=file)
                         break
                 else:
-                    # Send notification about missing episode file
-                    if self.notification_service:
-                        self.notification_service.send_notification_to_all_providers(
-                            title="Missing Episode File",
-                            message=f"No video file found for S{season.number:02d}E{episode.number:02d} in torrent '{torrent.title}' for show {show.name}. Manual intervention may be required.",
-                        )
+                    missing_episodes.append(
+                        f"S{season.number:02d}E{episode.number:02d}"
+                    )
                     success = False
                     log.warning(
                         f"S{season.number}E{episode.number} in Torrent {torrent.title}'s files not found."
                     )
+        # Send one notification about all missing episode files of the torrent
+        if missing_episodes and self.notification_service:
+            self.notification_service.send_notification_to_all_providers(
+                title="Missing Episode File",
+                message=f"No video file found for {', '.join(missing_episodes)} in torrent '{torrent.title}' for show {show.name}. Manual intervention may be required.",
+            )
         if success:
             torrent.imported = True
             self.torrent_service.torrent_repository.save_torrent(torrent=torrent)
+            event_bus.publish(
+                type=EventType.torrent_imported,
+                data={
+                    "torrent": torrent.model_dump(mode="json"),
+                    "show_id": str(show.id),
+                },
+            )
 
             # Send successful season download notification
             if self.notification_service:
@@ -642,7 +705,11 @@ class TvService:
         log.debug(f"Found show: {db_show.name} for metadata update.")
         # old_poster_url = db_show.poster_url # poster_url removed from db_show
 
-        fresh_show_data = metadata_provider.get_show_metadata(id=db_show.external_id)
+        # the cached metadata can be days old, new episodes would be missed
+        with metadata_cache.revalidate():
+            fresh_show_data = metadata_provider.get_show_metadata(
+                id=db_show.external_id
+            )
         if not fresh_show_data:
             log.warning(
                 f"Could not fetch fresh metadata for show {db_show.name} (External ID: {db_show.external_id}) from {db_show.metadata_provider}."
@@ -800,7 +867,13 @@ def auto_download_all_approved_season_requests() -> None:
         db.commit()
 
 
-def import_all_show_torrents() -> None:
+def import_all_show_torrents(torrents: list[Torrent] | None = None) -> None:
+    """
+    Imports all finished tv torrents that were not imported yet.
+    This is a standalone function as it creates its own DB session.
+
+    :param torrents: The torrents with their current status, they are fetched from the download clients if omitted.
+    """
     with next(get_session()) as db:
         tv_repository = TvRepository(db=db)
         torrent_service = TorrentService(torrent_repository=TorrentRepository(db=db))
@@ -811,7 +884,8 @@ def import_all_show_torrents() -> None:
             indexer_service=indexer_service,
         )
         log.info("Importing all torrents")
-        torrents = torrent_service.get_all_torrents()
+        if torrents is None:
+            torrents = torrent_service.get_all_torrents()
         log.info("Found %d torrents to import", len(torrents))
         for t in torrents:
             try:
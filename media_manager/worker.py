@@ -0,0 +1,66 @@
+"""
+Runs the scheduled jobs in a process of its own, so the API can be scaled out without running them more than once.
+
+Start any number of workers with `python -m media_manager.worker`, only one of them runs the jobs at a time and
+another one takes over if it goes away. Set jobs.run_in_api to false, so the API processes don't run them too.
+"""
+
+import argparse
+import logging
+import signal
+import threading
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.logging_config import setup_logging
+
+setup_logging()
+log = logging.getLogger(__name__)
+
+from prometheus_client import start_http_server  # noqa: E402
+
+from media_manager.config import AllEncompassingConfig  # noqa: E402
+from media_manager.database import init_db  # noqa: E402
+from media_manager.database.broadcast import broadcast  # noqa: E402
+from media_manager.jobs.leader import SchedulerLeader  # noqa: E402
+from media_manager.jobs.scheduler import scheduler  # noqa: E402
+from media_manager.jobs.tasks import add_jobs  # noqa: E402
+from media_manager.metrics.collectors import register_collectors  # noqa: E402
+from media_manager.metrics.metrics import instrument_scheduler  # noqa: E402
+from media_manager.notification.manager import notification_manager  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=8001,
+        help="serve the worker's Prometheus metrics on this port if metrics are enabled",
+    )
+    args = parser.parse_args()
+
+    init_db()
+    if AllEncompassingConfig().metrics.enabled:
+        register_collectors()
+        start_http_server(args.metrics_port)
+    stop = threading.Event()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signal_number, lambda *args: stop.set())
+
+    instrument_scheduler(scheduler)
+    scheduler.start(paused=True)
+    broadcast.start()
+    scheduler_leader = SchedulerLeader(scheduler=scheduler, add_jobs=add_jobs)
+    scheduler_leader.start()
+    log.info("Worker started")
+
+    stop.wait()
+    log.info("Stopping worker")
+    scheduler_leader.stop()
+    scheduler.shutdown()
+    broadcast.stop()
+    notification_manager.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -139,6 +139,12 @@ echo "Running DB migrations..."
 
 uv run alembic upgrade head
 
+# pass "worker" to run the scheduled jobs instead of the API, see the docs about running workers
+if [ "$1" = "worker" ]; then
+    echo "Starting MediaManager worker..."
+    exec uv run python -m media_manager.worker
+fi
+
 echo "Starting MediaManager backend service..."
 echo ""
 echo "   LOGIN INFORMATION:"
@@ -0,0 +1,125 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+from sqlalchemy.exc import OperationalError
+
+from media_manager.database import broadcast as broadcast_module
+from media_manager.database.broadcast import Broadcast
+
+
+def make_payload(origin: str, topic: str, data) -> str:
+    return json.dumps({"origin": origin, "topic": topic, "data": data})
+
+
+def test_dispatch_calls_handler_of_topic():
+    broadcast = Broadcast()
+    handler = MagicMock()
+    other_handler = MagicMock()
+    broadcast.subscribe("response_cache", handler)
+    broadcast.subscribe("event", other_handler)
+
+    broadcast._dispatch(make_payload("other-process", "response_cache", "tv"))
+
+    handler.assert_called_once_with("tv")
+    other_handler.assert_not_called()
+
+
+def test_dispatch_ignores_own_messages():
+    broadcast = Broadcast()
+    handler = MagicMock()
+    broadcast.subscribe("response_cache", handler)
+
+    broadcast._dispatch(make_payload(broadcast._origin, "response_cache", "tv"))
+
+    handler.assert_not_called()
+
+
+def test_dispatch_survives_failing_handler():
+    broadcast = Broadcast()
+    broadcast.subscribe("event", MagicMock(side_effect=ValueError("invalid event")))
+
+    broadcast._dispatch(make_payload("other-process", "event", {}))
+
+
+def test_send_does_nothing_until_started(monkeypatch):
+    engine = MagicMock()
+    monkeypatch.setattr(broadcast_module, "engine", engine)
+
+    Broadcast().send("response_cache", "tv")
+
+    engine.begin.assert_not_called()
+
+
+def test_send_is_done_by_sender_thread(monkeypatch):
+    engine = MagicMock()
+    sent = []
+    connection = engine.begin.return_value.__enter__.return_value
+    connection.execute.side_effect = lambda statement, parameters: sent.append(
+        (threading.current_thread().name, json.loads(parameters["payload"])["data"])
+    )
+    monkeypatch.setattr(broadcast_module, "engine", engine)
+    broadcast = Broadcast()
+    broadcast._listen = lambda: None
+    broadcast.start()
+
+    broadcast.send("response_cache", "tv")
+    broadcast.send("response_cache", "movies")
+    broadcast.stop()
+
+    assert sent == [("broadcast-sender", "tv"), ("broadcast-sender", "movies")]
+
+
+def test_sender_survives_database_errors(monkeypatch):
+    engine = MagicMock()
+    engine.begin.side_effect = [
+        OperationalError("SELECT 1", {}, Exception()),
+        MagicMock(),
+    ]
+    monkeypatch.setattr(broadcast_module, "engine", engine)
+    broadcast = Broadcast()
+    broadcast._listen = lambda: None
+    broadcast.start()
+
+    broadcast.send("response_cache", "tv")
+    # wait until the first message was handled, so the second one is sent separately
+    while engine.begin.call_count < 1:
+        time.sleep(0.01)
+    broadcast.send("response_cache", "movies")
+    broadcast.stop()
+
+    assert engine.begin.call_count == 2
+
+
+def test_dispatch_survives_malformed_payloads():
+    broadcast = Broadcast()
+    handler = MagicMock()
+    broadcast.subscribe("response_cache", handler)
+
+    broadcast._dispatch("not json")
+    broadcast._dispatch(json.dumps({"topic": "response_cache"}))
+    broadcast._dispatch(json.dumps(["response_cache"]))
+
+    handler.assert_not_called()
+
+
+def test_listener_reconnects_after_failing_on_connect_handler(monkeypatch):
+    connection = MagicMock()
+    connection.__enter__.return_value = connection
+    connect = MagicMock(return_value=connection)
+    monkeypatch.setattr(broadcast_module.psycopg, "connect", connect)
+    monkeypatch.setattr(
+        broadcast_module, "get_connect_args", lambda: {"prepare_threshold": None}
+    )
+    broadcast = Broadcast(reconnect_interval=0)
+    on_connect = MagicMock(side_effect=[RuntimeError("cache unavailable"), None])
+    broadcast.subscribe("response_cache", MagicMock(), on_connect=on_connect)
+    # stop once the listener waits for notifications on the second connection
+    connection.notifies.side_effect = lambda timeout: broadcast._stop.set() or []
+
+    broadcast._listen()
+
+    assert on_connect.call_count == 2
+    assert connect.call_count == 2
+    assert connect.call_args.kwargs == {"autocommit": True, "prepare_threshold": None}
@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.http.client import CircuitOpenError, HttpClient
+
+
+@pytest.fixture
+def http_client(monkeypatch):
+    monkeypatch.setenv("HTTP__CIRCUIT_BREAKER_FAILURE_THRESHOLD", "1")
+    monkeypatch.setenv("HTTP__CIRCUIT_BREAKER_RESET_TIMEOUT", "0")
+    return HttpClient()
+
+
+def test_failed_trial_request_with_unexpected_error_reopens_circuit(http_client):
+    with patch.object(
+        requests.Session, "request", side_effect=requests.ConnectionError("refused")
+    ):
+        with pytest.raises(requests.ConnectionError):
+            http_client.get("http://indexer.local/api")
+    breaker = http_client._get_breaker("indexer.local")
+    assert breaker.is_open
+
+    # the trial request fails with an error that is not one of requests' exceptions
+    with patch.object(requests.Session, "request", side_effect=ValueError("bad url")):
+        with pytest.raises(ValueError):
+            http_client.get("http://indexer.local/api")
+
+    # the trial is over, so the next request after the reset timeout is let through again
+    assert breaker.allow_request()
+
+
+def test_open_circuit_refuses_requests(http_client):
+    breaker = http_client._get_breaker("indexer.local")
+    breaker.reset_timeout = 60
+    breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        http_client.get("http://indexer.local/api")
@@ -0,0 +1,46 @@
+import io
+
+from media_manager.indexer.indexers.torznab import parse_torznab
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" xmlns:torznab="http://torznab.com/schemas/2015/feed">
+  <channel>
+    <title>Jackett</title>
+    <item>
+      <title>Show S01 1080p</title>
+      <size>1000</size>
+      <enclosure url="https://example.com/1.torrent" length="1000" type="application/x-bittorrent" />
+      <torznab:attr name="seeders" value="12" />
+      <torznab:attr name="downloadvolumefactor" value="0" />
+      <torznab:attr name="uploadvolumefactor" value="2" />
+    </item>
+    <item>
+      <title>Show S02 720p</title>
+      <size>2000</size>
+      <enclosure url="https://example.com/2.torrent" length="2000" type="application/x-bittorrent" />
+    </item>
+    <item>
+      <title>Item without enclosure</title>
+      <size>3000</size>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+def test_parse_torznab():
+    results = list(parse_torznab(io.BytesIO(FEED)))
+
+    assert [result.title for result in results] == ["Show S01 1080p", "Show S02 720p"]
+    assert results[0].download_url == "https://example.com/1.torrent"
+    assert results[0].size == 1000
+    assert results[0].seeders == 12
+    assert results[0].flags == ["freeleech", "doubleupload"]
+    assert results[0].usenet is False
+
+
+def test_parse_torznab_attributes_do_not_leak_between_items():
+    results = list(parse_torznab(io.BytesIO(FEED)))
+
+    assert results[1].seeders == 0
+    assert results[1].flags == []
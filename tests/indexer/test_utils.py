@@ -0,0 +1,23 @@
+import json
+
+import pytest
+
+from media_manager.indexer.utils import iter_json_array
+
+
+def test_iter_json_array_across_chunk_boundaries():
+    data = [{"title": f"Show S0{i} 1080p", "seeders": i} for i in range(10)] + [1, "ü"]
+    document = json.dumps(data).encode()
+
+    for chunk_size in (1, 7, len(document)):
+        chunks = [
+            document[i : i + chunk_size] for i in range(0, len(document), chunk_size)
+        ]
+        assert list(iter_json_array(chunks)) == data
+
+
+def test_iter_json_array_rejects_invalid_documents():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"title": "Show"}']))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"title": "Show"}, {"title": ']))
@@ -0,0 +1,60 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from media_manager.jobs import leader as leader_module
+from media_manager.jobs.leader import SchedulerLeader
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    connection = MagicMock()
+    engine = MagicMock()
+    engine.connect.return_value = connection
+    monkeypatch.setattr(leader_module, "engine", engine)
+    return connection
+
+
+def test_takes_the_lead_when_lock_is_free(connection):
+    connection.execute.return_value.scalar_one.return_value = True
+    scheduler = MagicMock()
+    add_jobs = MagicMock()
+    leader = SchedulerLeader(scheduler=scheduler, add_jobs=add_jobs)
+
+    leader._try_to_lead()
+
+    assert leader.is_leader
+    add_jobs.assert_called_once_with(scheduler)
+    scheduler.resume.assert_called_once()
+    connection.close.assert_not_called()
+
+
+def test_stays_paused_when_lock_is_taken(connection):
+    connection.execute.return_value.scalar_one.return_value = False
+    scheduler = MagicMock()
+    add_jobs = MagicMock()
+    leader = SchedulerLeader(scheduler=scheduler, add_jobs=add_jobs)
+
+    leader._try_to_lead()
+
+    assert not leader.is_leader
+    add_jobs.assert_not_called()
+    scheduler.resume.assert_not_called()
+    connection.close.assert_called_once()
+
+
+def test_steps_down_when_connection_is_lost(connection):
+    connection.execute.return_value.scalar_one.return_value = True
+    scheduler = MagicMock()
+    leader = SchedulerLeader(scheduler=scheduler, add_jobs=MagicMock(), interval=0)
+    leader._try_to_lead()
+    connection.execute.side_effect = OperationalError("SELECT 1", {}, Exception())
+    # stop after the first check
+    leader._stop.wait = lambda timeout: leader._stop.set()
+
+    leader._run()
+
+    assert not leader.is_leader
+    scheduler.pause.assert_called_once()
+    connection.close.assert_called()
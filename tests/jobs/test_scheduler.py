@@ -0,0 +1,85 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.schedulers.background import BackgroundScheduler
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.jobs import service
+from media_manager.jobs.leader import SchedulerLeader
+from media_manager.jobs.scheduler import job_defaults
+from media_manager.jobs.service import JobService
+
+job_ran = threading.Event()
+
+
+def record_run() -> None:
+    job_ran.set()
+
+
+@pytest.fixture
+def schedulers(tmp_path):
+    """
+    The scheduler of the leader and the paused scheduler of another process, sharing a job store.
+    """
+    url = f"sqlite:///{tmp_path / 'jobs.sqlite'}"
+    leader = BackgroundScheduler(
+        jobstores={"default": SQLAlchemyJobStore(url=url)}, job_defaults=job_defaults
+    )
+    other = BackgroundScheduler(
+        jobstores={"default": SQLAlchemyJobStore(url=url)}, job_defaults=job_defaults
+    )
+    leader.start()
+    leader.add_job(record_run, "interval", hours=1, id="test_job")
+    other.start(paused=True)
+    job_ran.clear()
+    yield leader, other
+    other.shutdown()
+    leader.shutdown()
+
+
+def trigger_job(scheduler: BackgroundScheduler) -> None:
+    job_repository = MagicMock()
+    job_repository.get_last_job_runs.return_value = {}
+    JobService(job_repository=job_repository, scheduler=scheduler).trigger_job(
+        "test_job"
+    )
+
+
+def test_job_triggered_by_another_process_runs_when_leader_wakes_up_late(
+    schedulers, monkeypatch
+):
+    leader, other = schedulers
+    monkeypatch.setattr(service, "broadcast", MagicMock())
+
+    trigger_job(other)
+    # the broadcast was missed, the leader only notices the trigger at its next check
+    time.sleep(1.5)
+    leader.wakeup()
+
+    assert job_ran.wait(timeout=5)
+
+
+def test_job_triggered_by_another_process_wakes_up_the_leader(schedulers, monkeypatch):
+    leader, other = schedulers
+    scheduler_leader = SchedulerLeader(scheduler=leader, add_jobs=MagicMock())
+    scheduler_leader._connection = MagicMock()
+    broadcast = MagicMock()
+    broadcast.send.side_effect = lambda topic, job_id: scheduler_leader._wake_up(job_id)
+    monkeypatch.setattr(service, "broadcast", broadcast)
+
+    trigger_job(other)
+
+    broadcast.send.assert_called_once_with("jobs", "test_job")
+    assert job_ran.wait(timeout=1)
+
+
+def test_follower_ignores_triggers():
+    scheduler = MagicMock()
+    scheduler_leader = SchedulerLeader(scheduler=scheduler, add_jobs=MagicMock())
+
+    scheduler_leader._wake_up("test_job")
+
+    scheduler.wakeup.assert_not_called()
@@ -0,0 +1,97 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from media_manager.exceptions import NotFoundError
+from media_manager.jobs import service
+from media_manager.jobs.schemas import JobRunOutcome
+from media_manager.jobs.service import JobService, get_lock_key, run_job
+
+
+@pytest.fixture
+def saved_runs(monkeypatch):
+    """
+    Replaces the database with a list of the states every job run was saved in.
+    """
+    runs = []
+    monkeypatch.setattr(
+        service, "save_job_run", lambda job_run: runs.append(job_run.model_copy())
+    )
+    return runs
+
+
+def fake_job_lock(acquired: bool):
+    @contextmanager
+    def job_lock(job_id: str):
+        yield acquired
+
+    return job_lock
+
+
+def test_run_job_records_success(monkeypatch, saved_runs):
+    monkeypatch.setattr(service, "job_lock", fake_job_lock(True))
+    function = MagicMock()
+
+    run_job("test_job", function)
+
+    function.assert_called_once()
+    assert [run.outcome for run in saved_runs] == [
+        JobRunOutcome.running,
+        JobRunOutcome.success,
+    ]
+    assert saved_runs[0].id == saved_runs[1].id
+    assert saved_runs[1].finished_at is not None
+    assert saved_runs[1].duration >= 0
+
+
+def test_run_job_records_failure_and_reraises(monkeypatch, saved_runs):
+    monkeypatch.setattr(service, "job_lock", fake_job_lock(True))
+
+    with pytest.raises(RuntimeError):
+        run_job("test_job", MagicMock(side_effect=RuntimeError("client offline")))
+
+    assert saved_runs[-1].outcome == JobRunOutcome.failed
+    assert saved_runs[-1].error == "RuntimeError: client offline"
+
+
+def test_run_job_skips_when_locked(monkeypatch, saved_runs):
+    monkeypatch.setattr(service, "job_lock", fake_job_lock(False))
+    function = MagicMock()
+
+    run_job("test_job", function)
+
+    function.assert_not_called()
+    assert [run.outcome for run in saved_runs] == [JobRunOutcome.skipped]
+
+
+def test_get_lock_key_is_stable_and_fits_bigint():
+    assert get_lock_key("import_all_torrents") == get_lock_key("import_all_torrents")
+    assert get_lock_key("import_all_torrents") != get_lock_key("delete_old_job_runs")
+    assert 0 <= get_lock_key("import_all_torrents") < 2**63
+
+
+def test_trigger_job_unknown_job():
+    scheduler = MagicMock()
+    scheduler.get_job.return_value = None
+    job_service = JobService(job_repository=MagicMock(), scheduler=scheduler)
+
+    with pytest.raises(NotFoundError):
+        job_service.trigger_job("unknown")
+    scheduler.modify_job.assert_not_called()
+
+
+def test_get_jobs_includes_last_run():
+    job = MagicMock(id="import_all_torrents", trigger="cron[minute='*/15']")
+    job.next_run_time = None
+    scheduler = MagicMock()
+    scheduler.get_jobs.return_value = [job]
+    job_repository = MagicMock()
+    job_repository.get_last_job_runs.return_value = {}
+    job_service = JobService(job_repository=job_repository, scheduler=scheduler)
+
+    jobs = job_service.get_jobs()
+
+    assert [job.id for job in jobs] == ["import_all_torrents"]
+    assert jobs[0].trigger == "cron[minute='*/15']"
+    assert jobs[0].last_run is None
@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.metadataProvider.cache import MetadataCache
+from media_manager.metadataProvider.utils import fetch_concurrently
+
+
+@pytest.fixture
+def metadata_cache():
+    return MetadataCache()
+
+
+def get_show(metadata_cache: MetadataCache, fetch) -> dict:
+    return metadata_cache.get_or_fetch(
+        provider="tmdb",
+        endpoint="tv/shows",
+        params={"id": 1},
+        kind="details",
+        fetch=fetch,
+    )
+
+
+def test_cached_response_is_returned(metadata_cache):
+    get_show(metadata_cache, lambda: {"seasons": 1})
+    fetch = MagicMock(return_value={"seasons": 2})
+
+    assert get_show(metadata_cache, fetch) == {"seasons": 1}
+    fetch.assert_not_called()
+
+
+def test_revalidate_fetches_and_updates_cached_response(metadata_cache):
+    get_show(metadata_cache, lambda: {"seasons": 1})
+
+    with metadata_cache.revalidate():
+        assert get_show(metadata_cache, lambda: {"seasons": 2}) == {"seasons": 2}
+
+    assert get_show(metadata_cache, MagicMock()) == {"seasons": 2}
+
+
+def test_revalidate_applies_to_concurrent_fetches(metadata_cache):
+    for season in range(3):
+        metadata_cache.get_or_fetch(
+            provider="tmdb",
+            endpoint="tv/seasons",
+            params={"season_number": season},
+            kind="details",
+            fetch=lambda: "cached",
+        )
+
+    def get_season(season: int) -> str:
+        return metadata_cache.get_or_fetch(
+            provider="tmdb",
+            endpoint="tv/seasons",
+            params={"season_number": season},
+            kind="details",
+            fetch=lambda: "fresh",
+        )
+
+    with metadata_cache.revalidate():
+        assert fetch_concurrently(get_season, range(3)) == ["fresh"] * 3
@@ -0,0 +1,125 @@
+from unittest.mock import MagicMock
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.database.schemas import PoolMetrics
+from media_manager.http.schemas import HostMetrics
+from media_manager.metrics import collectors
+from media_manager.metrics.collectors import (
+    DatabasePoolCollector,
+    NotificationQueueCollector,
+    OutboundHttpCollector,
+)
+
+
+@pytest.fixture
+def registry():
+    return CollectorRegistry()
+
+
+def test_database_pool_collector(registry, monkeypatch):
+    monkeypatch.setattr(
+        collectors,
+        "get_database_pool_metrics",
+        lambda: [
+            PoolMetrics(
+                pool="sync", size=5, checked_out=2, checkouts=40, total_wait=1.5
+            ),
+            PoolMetrics(pool="async", size=5, overflow=1, timeouts=3),
+        ],
+    )
+    registry.register(DatabasePoolCollector())
+
+    assert registry.get_sample_value("mediamanager_db_pool_size", {"pool": "sync"}) == 5
+    assert (
+        registry.get_sample_value(
+            "mediamanager_db_pool_checked_out_connections", {"pool": "sync"}
+        )
+        == 2
+    )
+    assert (
+        registry.get_sample_value(
+            "mediamanager_db_pool_overflow_connections", {"pool": "async"}
+        )
+        == 1
+    )
+    assert (
+        registry.get_sample_value(
+            "mediamanager_db_pool_checkouts_total", {"pool": "sync"}
+        )
+        == 40
+    )
+    assert (
+        registry.get_sample_value(
+            "mediamanager_db_pool_timeouts_total", {"pool": "async"}
+        )
+        == 3
+    )
+    assert (
+        registry.get_sample_value(
+            "mediamanager_db_pool_wait_seconds_total", {"pool": "sync"}
+        )
+        == 1.5
+    )
+
+
+def test_outbound_http_collector(registry, monkeypatch):
+    http_client = MagicMock()
+    http_client.get_host_metrics.return_value = [
+        HostMetrics(
+            host="api.themoviedb.org",
+            requests=10,
+            errors=2,
+            total_latency=4.0,
+            max_latency=1.25,
+            circuit_open=True,
+        )
+    ]
+    monkeypatch.setattr(collectors, "http_client", http_client)
+    registry.register(OutboundHttpCollector())
+    labels = {"host": "api.themoviedb.org"}
+
+    assert (
+        registry.get_sample_value("mediamanager_outbound_http_requests_total", labels)
+        == 10
+    )
+    assert (
+        registry.get_sample_value("mediamanager_outbound_http_errors_total", labels)
+        == 2
+    )
+    assert (
+        registry.get_sample_value(
+            "mediamanager_outbound_http_latency_seconds_total", labels
+        )
+        == 4.0
+    )
+    assert (
+        registry.get_sample_value(
+            "mediamanager_outbound_http_max_latency_seconds", labels
+        )
+        == 1.25
+    )
+    assert (
+        registry.get_sample_value("mediamanager_outbound_http_circuit_open", labels)
+        == 1
+    )
+
+
+def test_notification_queue_collector(registry, monkeypatch):
+    notification_manager = MagicMock()
+    notification_manager.get_queue_depth.return_value = 7
+    monkeypatch.setattr(collectors, "notification_manager", notification_manager)
+    registry.register(NotificationQueueCollector())
+
+    assert registry.get_sample_value("mediamanager_notification_queue_depth") == 7
+
+
+def test_collectors_without_data_expose_no_samples(registry, monkeypatch):
+    monkeypatch.setattr(collectors, "get_database_pool_metrics", lambda: [])
+    registry.register(DatabasePoolCollector())
+
+    assert (
+        registry.get_sample_value("mediamanager_db_pool_size", {"pool": "sync"}) is None
+    )
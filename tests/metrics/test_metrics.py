@@ -0,0 +1,140 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_SUBMITTED,
+    JobExecutionEvent,
+    JobSubmissionEvent,
+)
+from apscheduler.schedulers.background import BackgroundScheduler
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from media_manager.metrics.metrics import PrometheusMiddleware, instrument_scheduler
+
+
+def get_request_count(method: str, route: str, status: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "mediamanager_http_request_duration_seconds_count",
+            {"method": method, "route": route, "status": status},
+        )
+        or 0.0
+    )
+
+
+def get_job_count(job: str, status: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "mediamanager_job_duration_seconds_count", {"job": job, "status": status}
+        )
+        or 0.0
+    )
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware, excluded_routes=["/events"])
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        return {"id": item_id}
+
+    @app.post("/fail")
+    def fail():
+        raise RuntimeError("boom")
+
+    @app.get("/events")
+    def get_events():
+        return {}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_request_is_labelled_with_route_template(client):
+    before = get_request_count("GET", "/items/{item_id}", "200")
+
+    client.get("/items/1")
+    client.get("/items/2")
+
+    assert get_request_count("GET", "/items/{item_id}", "200") == before + 2
+    assert get_request_count("GET", "/items/1", "200") == 0
+
+
+def test_request_without_route_is_labelled_unmatched(client):
+    before = get_request_count("GET", "unmatched", "404")
+
+    assert client.get("/does/not/exist").status_code == 404
+
+    assert get_request_count("GET", "unmatched", "404") == before + 1
+
+
+def test_request_that_raises_is_recorded_as_500(client):
+    before = get_request_count("POST", "/fail", "500")
+
+    assert client.post("/fail").status_code == 500
+
+    assert get_request_count("POST", "/fail", "500") == before + 1
+
+
+def test_excluded_route_is_not_recorded(client):
+    assert client.get("/events").status_code == 200
+
+    assert get_request_count("GET", "/events", "200") == 0
+
+
+def run_job(func, job_id: str) -> None:
+    scheduler = BackgroundScheduler()
+    instrument_scheduler(scheduler)
+    done = threading.Event()
+    # listeners are called in the order they were added, so the metric is recorded when this one runs
+    scheduler.add_listener(
+        lambda event: done.set(), EVENT_JOB_EXECUTED | EVENT_JOB_ERROR
+    )
+    scheduler.start()
+    try:
+        scheduler.add_job(func, id=job_id)
+        assert done.wait(timeout=5)
+    finally:
+        scheduler.shutdown()
+
+
+def test_successful_job_duration_is_recorded():
+    run_job(lambda: None, job_id="metrics_test_success")
+
+    assert get_job_count("metrics_test_success", "success") == 1
+    assert get_job_count("metrics_test_success", "error") == 0
+
+
+def test_failed_job_duration_is_recorded_as_error():
+    def fail():
+        raise RuntimeError("boom")
+
+    run_job(fail, job_id="metrics_test_error")
+
+    assert get_job_count("metrics_test_error", "error") == 1
+    assert get_job_count("metrics_test_error", "success") == 0
+
+
+def test_job_finishing_before_its_submission_event_is_recorded():
+    scheduler = MagicMock()
+    instrument_scheduler(scheduler)
+    listener = scheduler.add_listener.call_args.args[0]
+    job_id = "metrics_test_early"
+
+    listener(JobExecutionEvent(EVENT_JOB_EXECUTED, job_id, "default", None))
+    assert get_job_count(job_id, "success") == 0
+    listener(JobSubmissionEvent(EVENT_JOB_SUBMITTED, job_id, "default", []))
+
+    assert get_job_count(job_id, "success") == 1
+
+    # the next run is paired with its own submission again
+    listener(JobSubmissionEvent(EVENT_JOB_SUBMITTED, job_id, "default", []))
+    listener(JobExecutionEvent(EVENT_JOB_ERROR, job_id, "default", None))
+    assert get_job_count(job_id, "error") == 1
+    assert get_job_count(job_id, "success") == 1
@@ -0,0 +1,141 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from media_manager.metrics import profiling
+from media_manager.metrics.profiling import (
+    ProfilingMiddleware,
+    RequestProfile,
+    current_profile,
+    instrument_engine,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def profile():
+    profile = RequestProfile()
+    token = current_profile.set(profile)
+    yield profile
+    current_profile.reset(token)
+
+
+def test_repeated_statements_exceed_threshold():
+    profile = RequestProfile()
+    for _ in range(3):
+        profile.record_query("SELECT 1", 0.001)
+    for _ in range(5):
+        profile.record_query("SELECT 2", 0.001)
+    profile.record_query("SELECT 3", 0.001)
+
+    assert profile.get_repeated_statements(threshold=2) == [
+        ("SELECT 2", 5),
+        ("SELECT 1", 3),
+    ]
+    assert profile.get_repeated_statements(threshold=3) == [("SELECT 2", 5)]
+    assert profile.get_repeated_statements(threshold=5) == []
+    assert profile.query_count == 9
+
+
+def test_queries_are_recorded_into_current_profile(engine, profile):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT   1"))
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 2"))
+
+        assert conn.info["query_start_time"] == []
+
+    assert profile.statements == {"SELECT 1": 2, "SELECT 2": 1}
+    assert profile.db_time > 0
+
+
+def test_queries_are_not_recorded_without_profile(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+        assert "query_start_time" not in conn.info
+
+
+def test_failed_statement_does_not_leave_its_start_time(engine, profile):
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+
+        assert conn.info["query_start_time"] == []
+        conn.execute(text("SELECT 1"))
+
+    assert profile.statements == {"SELECT 1": 1}
+
+
+def make_client(slow_request_threshold: float, repeated_query_threshold: int = 10):
+    app = FastAPI()
+    app.add_middleware(
+        ProfilingMiddleware,
+        slow_request_threshold=slow_request_threshold,
+        repeated_query_threshold=repeated_query_threshold,
+        sample_rate=0.0,
+        sample_interval=0.005,
+        profile_directory=None,
+    )
+
+    @app.get("/shows/{show_id}")
+    def get_show(show_id: int):
+        for _ in range(3):
+            current_profile.get().record_query("SELECT * FROM season", 0.002)
+        profiling.record_http_request(0.004)
+        return {"id": show_id}
+
+    return TestClient(app)
+
+
+def test_server_timing_header():
+    response = make_client(slow_request_threshold=60).get("/shows/1")
+
+    metrics = dict(
+        part.strip().split(";dur=")
+        for part in response.headers["server-timing"].split(",")
+    )
+    assert set(metrics) == {"app", "db", "http"}
+    assert float(metrics["db"]) == pytest.approx(6.0)
+    assert float(metrics["http"]) == pytest.approx(4.0)
+
+
+def test_slow_request_is_logged(caplog):
+    with caplog.at_level(logging.WARNING, logger=profiling.__name__):
+        make_client(slow_request_threshold=0).get("/shows/1")
+
+    (record,) = [r for r in caplog.records if r.getMessage().startswith("Slow")]
+    assert record.route == "/shows/{show_id}"
+    assert record.path == "/shows/1"
+    assert record.status == 200
+    assert record.query_count == 3
+    assert record.http_requests == 1
+
+
+def test_fast_request_is_not_logged(caplog):
+    with caplog.at_level(logging.WARNING, logger=profiling.__name__):
+        make_client(slow_request_threshold=60).get("/shows/1")
+
+    assert caplog.records == []
+
+
+def test_repeated_statement_is_logged(caplog):
+    with caplog.at_level(logging.WARNING, logger=profiling.__name__):
+        make_client(slow_request_threshold=60, repeated_query_threshold=2).get(
+            "/shows/1"
+        )
+
+    (record,) = caplog.records
+    assert record.statement == "SELECT * FROM season"
+    assert record.count == 3
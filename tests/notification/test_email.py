@@ -0,0 +1,72 @@
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.notification.schemas import MessageNotification
+from media_manager.notification.service_providers.email import (
+    EmailNotificationServiceProvider,
+)
+
+
+@pytest.fixture
+def email_provider(monkeypatch):
+    monkeypatch.setenv(
+        "NOTIFICATIONS__EMAIL_NOTIFICATIONS__EMAILS",
+        '["a@example.com", "b@example.com", "c@example.com"]',
+    )
+    return EmailNotificationServiceProvider()
+
+
+@pytest.fixture
+def send_email():
+    with (
+        patch(
+            "media_manager.notification.utils.open_smtp_connection",
+            return_value=nullcontext(MagicMock()),
+        ),
+        patch("media_manager.notification.utils.send_email") as send_email,
+    ):
+        yield send_email
+
+
+def get_addressees(send_email: MagicMock) -> list[str]:
+    return [call.kwargs["addressee"] for call in send_email.call_args_list]
+
+
+def test_failed_message_is_only_retried_for_failed_addressees(
+    email_provider, send_email
+):
+    def fail_for_b(addressee: str, **kwargs) -> None:
+        if addressee == "b@example.com":
+            raise OSError("mailbox full")
+
+    send_email.side_effect = fail_for_b
+    message = MessageNotification(title="Imported", message="Show A")
+
+    failed_messages = email_provider.send_notifications([message])
+
+    assert get_addressees(send_email) == [
+        "a@example.com",
+        "b@example.com",
+        "c@example.com",
+    ]
+    assert failed_messages == [
+        message.model_copy(update={"addressees": ["b@example.com"]})
+    ]
+
+    send_email.reset_mock()
+    send_email.side_effect = None
+    assert email_provider.send_notifications(failed_messages) == []
+    assert get_addressees(send_email) == ["b@example.com"]
+
+
+def test_sent_messages_are_not_returned(email_provider, send_email):
+    messages = [
+        MessageNotification(title="Imported", message="Show A"),
+        MessageNotification(title="Imported", message="Show B"),
+    ]
+
+    assert email_provider.send_notifications(messages) == []
+    assert send_email.call_count == 6
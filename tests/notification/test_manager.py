@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.notification.manager import (
+    NotificationManager,
+    coalesce_notifications,
+)
+from media_manager.notification.schemas import MessageNotification
+
+
+@pytest.fixture
+def provider():
+    provider = MagicMock()
+    provider.send_notifications.return_value = []
+    return provider
+
+
+@pytest.fixture
+def notification_manager(monkeypatch, provider):
+    monkeypatch.setenv("NOTIFICATIONS__BATCH_WINDOW", "0.2")
+    monkeypatch.setenv("NOTIFICATIONS__RETRIES", "2")
+    monkeypatch.setenv("NOTIFICATIONS__BACKOFF_FACTOR", "0")
+    notification_manager = NotificationManager()
+    notification_manager.providers = [provider]
+    yield notification_manager
+    notification_manager.shutdown()
+
+
+def test_coalesce_notifications_merges_titles_and_drops_duplicates():
+    notifications = [
+        MessageNotification(title="Imported", message="Show A"),
+        MessageNotification(title="Failed", message="Show B"),
+        MessageNotification(title="Imported", message="Show C"),
+        MessageNotification(title="Imported", message="Show A"),
+    ]
+
+    assert coalesce_notifications(notifications) == [
+        MessageNotification(title="Imported", message="Show A\nShow C"),
+        MessageNotification(title="Failed", message="Show B"),
+    ]
+
+
+def test_notifications_within_batch_window_are_sent_together(
+    notification_manager, provider
+):
+    notification_manager.send_notification(title="Imported", message="Show A")
+    notification_manager.send_notification(title="Imported", message="Show B")
+    notification_manager.send_notification(title="Imported", message="Show A")
+    notification_manager.shutdown()
+
+    provider.send_notifications.assert_called_once_with(
+        [MessageNotification(title="Imported", message="Show A\nShow B")]
+    )
+
+
+def test_only_failed_notifications_are_retried(notification_manager, provider):
+    failed = MessageNotification(title="Failed", message="Show B")
+    provider.send_notifications.side_effect = [[failed], RuntimeError("offline"), []]
+
+    notification_manager._dispatch_batch(
+        [MessageNotification(title="Imported", message="Show A"), failed]
+    )
+
+    assert provider.send_notifications.call_count == 3
+    assert provider.send_notifications.call_args_list[1].args == ([failed],)
+    assert provider.send_notifications.call_args_list[2].args == ([failed],)
+
+
+def test_gives_up_after_retries(notification_manager, provider):
+    failed = MessageNotification(title="Failed", message="Show B")
+    provider.send_notifications.return_value = [failed]
+
+    notification_manager._dispatch_batch([failed])
+
+    assert provider.send_notifications.call_count == 3
@@ -0,0 +1,21 @@
+import pytest
+from pydantic import ValidationError
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.config import BasicConfig
+
+
+@pytest.mark.parametrize("log_level", ["DEBUG", "warning", "Error"])
+def test_log_level_is_case_insensitive(log_level):
+    assert BasicConfig(log_level=log_level).log_level == log_level.upper()
+
+
+@pytest.mark.parametrize("log_level", ["VERBOSE", "WARN", ""])
+def test_invalid_log_level_is_rejected(log_level):
+    with pytest.raises(ValidationError, match="log_level"):
+        BasicConfig(log_level=log_level)
+
+
+def test_log_level_is_read_from_the_environment(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "debug")
+    assert BasicConfig().log_level == "DEBUG"
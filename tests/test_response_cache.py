@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock
+
+from starlette.requests import Request
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.response_cache import ResponseCache
+
+
+def make_request(if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/movies/1",
+            "query_string": b"",
+            "headers": headers,
+        }
+    )
+
+
+def get_response(cache: ResponseCache, build, if_none_match: str | None = None):
+    return cache.get_response(
+        request=make_request(if_none_match),
+        namespace="movies",
+        response_model=dict[str, bool],
+        build=build,
+    )
+
+
+def test_replicas_issue_the_same_etag_for_the_same_content():
+    build = MagicMock(return_value={"downloaded": True})
+    first = get_response(ResponseCache(max_entries=8), build)
+
+    # another replica, or this one after a restart
+    second = get_response(
+        ResponseCache(max_entries=8), build, if_none_match=first.headers["etag"]
+    )
+
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+
+
+def test_unchanged_body_is_served_from_memory():
+    cache = ResponseCache(max_entries=8)
+    build = MagicMock(return_value={"downloaded": True})
+
+    first = get_response(cache, build)
+    second = get_response(cache, build)
+
+    build.assert_called_once()
+    assert second.body == first.body
+
+
+def test_bump_rebuilds_the_response_and_keeps_etag_of_equal_content():
+    cache = ResponseCache(max_entries=8)
+    build = MagicMock(return_value={"downloaded": False})
+    first = get_response(cache, build)
+
+    cache.receive_broadcast("movies")
+    unchanged = get_response(cache, build, if_none_match=first.headers["etag"])
+    build.return_value = {"downloaded": True}
+    cache.receive_broadcast("movies")
+    changed = get_response(cache, build, if_none_match=first.headers["etag"])
+
+    assert build.call_count == 3
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
+    assert changed.body == b'{"downloaded":true}'
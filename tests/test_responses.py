@@ -0,0 +1,28 @@
+import pytest
+
+from media_manager.responses import etag_matches
+
+ETAG = '"3f2a9c"'
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (None, False),
+        ("", False),
+        ('"3f2a9c"', True),
+        ('W/"3f2a9c"', True),
+        ('"1b7e04", "3f2a9c"', True),
+        ('"1b7e04",W/"3f2a9c"', True),
+        ("*", True),
+        ('"3f2a"', False),
+        ('"3f2a9c0"', False),
+        ('"x3f2a9c"', False),
+    ],
+)
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, ETAG) is expected
+
+
+def test_weak_etag_matches_strong_tag():
+    assert etag_matches('"3f2a9c"', 'W/"3f2a9c"')
@@ -0,0 +1,123 @@
+from unittest.mock import MagicMock
+
+import pytest
+from starlette.requests import Request
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.response_cache import response_cache
+from media_manager.torrent.models import Torrent as TorrentModel
+from media_manager.torrent.repository import TorrentRepository
+from media_manager.torrent.schemas import Quality, Torrent, TorrentStatus
+
+
+def make_request(path: str, if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"",
+            "headers": headers,
+        }
+    )
+
+
+@pytest.fixture
+def torrent():
+    return Torrent(
+        status=TorrentStatus.downloading,
+        title="Show S01",
+        quality=Quality.fullhd,
+        imported=False,
+        hash="abc123",
+    )
+
+
+@pytest.fixture
+def repo(torrent):
+    db = MagicMock()
+    # the row as it is stored before the test changes the torrent
+    db.get.return_value = TorrentModel(**torrent.model_dump())
+    return TorrentRepository(db=db)
+
+
+def get_versions() -> tuple[int, int]:
+    return response_cache.get_version("tv"), response_cache.get_version("movies")
+
+
+def get_show_response(torrent: Torrent, if_none_match: str | None = None):
+    return response_cache.get_response(
+        request=make_request("/api/v1/tv/shows/1", if_none_match),
+        namespace="tv",
+        response_model=dict[str, bool],
+        build=lambda: {"downloaded": torrent.imported},
+    )
+
+
+def test_save_torrent_invalidates_cached_show_response(repo, torrent):
+    first = get_show_response(torrent)
+    assert first.body == b'{"downloaded":false}'
+
+    torrent.imported = True
+    repo.save_torrent(torrent=torrent)
+
+    second = get_show_response(torrent, if_none_match=first.headers["etag"])
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.body == b'{"downloaded":true}'
+
+
+def test_save_torrent_without_changes_keeps_cached_show_response(repo, torrent):
+    first = get_show_response(torrent)
+
+    # a status refresh that found the torrent in the state it was stored in
+    repo.save_torrent(torrent=torrent)
+
+    second = get_show_response(torrent, if_none_match=first.headers["etag"])
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+    assert get_show_response(torrent).body == first.body
+
+
+@pytest.mark.parametrize(
+    "change",
+    [{"status": TorrentStatus.finished}, {"imported": True}],
+)
+def test_save_torrent_bumps_tv_and_movies_on_change(repo, torrent, change):
+    tv_version, movies_version = get_versions()
+
+    repo.save_torrent(torrent=torrent.model_copy(update=change))
+
+    repo.db.commit.assert_called_once()
+    assert get_versions() == (tv_version + 1, movies_version + 1)
+
+
+def test_save_torrent_bumps_tv_and_movies_for_new_torrent(repo, torrent):
+    repo.db.get.return_value = None
+    tv_version, movies_version = get_versions()
+
+    repo.save_torrent(torrent=torrent)
+
+    assert get_versions() == (tv_version + 1, movies_version + 1)
+
+
+def test_save_torrent_without_changes_does_not_bump(repo, torrent):
+    versions = get_versions()
+
+    repo.save_torrent(torrent=torrent.model_copy(update={"title": "Show S01 PROPER"}))
+
+    repo.db.commit.assert_called_once()
+    assert get_versions() == versions
+
+
+def test_delete_torrent_bumps_tv_and_movies(repo, torrent):
+    tv_version, movies_version = get_versions()
+
+    repo.delete_torrent(torrent_id=torrent.id)
+
+    repo.db.delete.assert_called_once_with(repo.db.get.return_value)
+    repo.db.commit.assert_called_once()
+    assert get_versions() == (tv_version + 1, movies_version + 1)
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import media_manager.database  # noqa: F401, imported before media_manager.config to resolve their import cycle
+from media_manager.torrent import service
+from media_manager.torrent.schemas import Quality, Torrent, TorrentStatus
+from media_manager.torrent.service import TorrentService
+
+
+@pytest.fixture
+def torrent():
+    return Torrent(
+        status=TorrentStatus.downloading,
+        title="Show S01",
+        quality=Quality.fullhd,
+        imported=False,
+        hash="abc123",
+    )
+
+
+@pytest.fixture
+def event_bus(monkeypatch):
+    event_bus = MagicMock()
+    monkeypatch.setattr(service, "event_bus", event_bus)
+    return event_bus
+
+
+@pytest.fixture
+def torrent_service():
+    return TorrentService(torrent_repository=MagicMock(), download_manager=MagicMock())
+
+
+def test_unchanged_status_is_not_saved_or_published(
+    torrent_service, torrent, event_bus
+):
+    torrent_service.download_manager.get_torrent_status.return_value = (
+        TorrentStatus.downloading
+    )
+
+    torrent_service.get_torrent_status(torrent)
+
+    torrent_service.torrent_repository.save_torrent.assert_not_called()
+    event_bus.publish.assert_not_called()
+
+
+def test_changed_status_is_saved_and_published(torrent_service, torrent, event_bus):
+    torrent_service.download_manager.get_torrent_status.return_value = (
+        TorrentStatus.finished
+    )
+
+    result = torrent_service.get_torrent_status(torrent)
+
+    assert result.status == TorrentStatus.finished
+    torrent_service.torrent_repository.save_torrent.assert_called_once_with(
+        torrent=torrent
+    )
+    event_bus.publish.assert_called_once()
+
+
+def test_refresh_only_fetches_active_torrents(torrent_service, torrent, event_bus):
+    failing = torrent.model_copy(update={"title": "Movie"})
+    torrent_service.torrent_repository.get_active_torrents.return_value = [
+        failing,
+        torrent,
+    ]
+    torrent_service.download_manager.get_torrent_status.side_effect = [
+        RuntimeError("client offline"),
+        TorrentStatus.finished,
+    ]
+
+    torrent_service.refresh_active_torrents()
+
+    torrent_service.torrent_repository.get_all_torrents.assert_not_called()
+    torrent_service.torrent_repository.save_torrent.assert_called_once_with(
+        torrent=torrent
+    )
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from media_manager.exceptions import NotFoundError
-from media_manager.tv.schemas import Show, ShowId, SeasonId
+from media_manager.tv.schemas import Show, ShowId, SeasonId, ShowSummary
 from media_manager.tv.service import TvService
 from media_manager.indexer.schemas import IndexerQueryResult, IndexerQueryResultId
 from media_manager.metadataProvider.schemas import MetaDataProviderSearchResult
@@ -174,6 +174,27 @@ def test_get_all_shows(tv_service, mock_tv_repository, mock_torrent_service):
     assert result == shows
 
 
+def test_get_show_summaries(tv_service, mock_tv_repository, mock_torrent_service):
+    summary = ShowSummary(
+        id=ShowId(uuid.uuid4()),
+        name="Test Show",
+        overview="Overview",
+        year=2022,
+        external_id=123,
+        metadata_provider="tmdb",
+        season_count=2,
+        episode_count=20,
+    )
+    mock_tv_repository.get_show_summaries.return_value = [summary]
+    mock_tv_repository.get_show_count.return_value = 21
+    result = tv_service.get_show_summaries(limit=1, offset=20)
+    mock_tv_repository.get_show_summaries.assert_called_once_with(limit=1, offset=20)
+    assert result.items == [summary]
+    assert result.total == 21
+    assert result.limit == 1
+    assert result.offset == 20
+
+
 def test_get_show_by_id(tv_service, mock_tv_repository, mock_torrent_service):
     show_id = MagicMock()
     show = MagicMock()
@@ -459,7 +480,9 @@ def test_get_all_available_torrents_for_a_season_no_results(
     assert results == []
 
 
-def test_search_for_show_no_existing(tv_service, mock_torrent_service):
+def test_search_for_show_no_existing(
+    tv_service, mock_tv_repository, mock_torrent_service
+):
     query = "Test Show"
     mock_metadata_provider = MagicMock()
     search_result_item = MetaDataProviderSearchResult(
@@ -473,17 +496,22 @@ def test_search_for_show_no_existing(tv_service, mock_torrent_service):
     )
     mock_metadata_provider.search_show.return_value = [search_result_item]
     mock_metadata_provider.name = "tmdb"
-    tv_service.check_if_show_exists = MagicMock(return_value=False)
+    mock_tv_repository.get_existing_show_external_ids.return_value = set()
     results = tv_service.search_for_show(
         query=query, metadata_provider=mock_metadata_provider
     )
     mock_metadata_provider.search_show.assert_called_once_with(query)
+    mock_tv_repository.get_existing_show_external_ids.assert_called_once_with(
+        external_ids=[(123, "tmdb")]
+    )
     assert len(results) == 1
     assert results[0] == search_result_item
     assert results[0].added is False
 
 
-def test_search_for_show_with_existing(tv_service, mock_torrent_service):
+def test_search_for_show_with_existing(
+    tv_service, mock_tv_repository, mock_torrent_service
+):
     query = "Test Show"
     mock_metadata_provider = MagicMock()
     search_result_item = MetaDataProviderSearchResult(
@@ -497,7 +525,7 @@ def test_search_for_show_with_existing(tv_service, mock_torrent_service):
     )
     mock_metadata_provider.search_show.return_value = [search_result_item]
     mock_metadata_provider.name = "tmdb"
-    tv_service.check_if_show_exists = MagicMock(return_value=True)
+    mock_tv_repository.get_existing_show_external_ids.return_value = {(123, "tmdb")}
     results = tv_service.search_for_show(
         query=query, metadata_provider=mock_metadata_provider
     )
@@ -505,18 +533,22 @@ def test_search_for_show_with_existing(tv_service, mock_torrent_service):
     assert results[0].added is True
 
 
-def test_search_for_show_empty_results(tv_service, mock_torrent_service):
+def test_search_for_show_empty_results(
+    tv_service, mock_tv_repository, mock_torrent_service
+):
     query = "NonExistent Show"
     mock_metadata_provider = MagicMock()
     mock_metadata_provider.search_show.return_value = []
-    tv_service.check_if_show_exists = MagicMock()
+    mock_tv_repository.get_existing_show_external_ids.return_value = set()
     results = tv_service.search_for_show(
         query=query, metadata_provider=mock_metadata_provider
     )
     assert results == []
 
 
-def test_get_popular_shows_none_added(tv_service, mock_torrent_service):
+def test_get_popular_shows_none_added(
+    tv_service, mock_tv_repository, mock_torrent_service
+):
     mock_metadata_provider = MagicMock()
     popular_show1 = MetaDataProviderSearchResult(
         external_id=123,
@@ -538,14 +570,16 @@ def test_get_popular_shows_none_added(tv_service, mock_torrent_service):
     )
     mock_metadata_provider.search_show.return_value = [popular_show1, popular_show2]
     mock_metadata_provider.name = "tmdb"
-    tv_service.check_if_show_exists = MagicMock(return_value=False)
+    mock_tv_repository.get_existing_show_external_ids.return_value = set()
     results = tv_service.get_popular_shows(metadata_provider=mock_metadata_provider)
     assert len(results) == 2
     assert popular_show1 in results
     assert popular_show2 in results
 
 
-def test_get_popular_shows_all_added(tv_service, mock_torrent_service):
+def test_get_popular_shows_all_added(
+    tv_service, mock_tv_repository, mock_torrent_service
+):
     mock_metadata_provider = MagicMock()
     popular_show1 = MetaDataProviderSearchResult(
         external_id=123,
@@ -558,14 +592,42 @@ def test_get_popular_shows_all_added(tv_service, mock_torrent_service):
     )
     mock_metadata_provider.search_show.return_value = [popular_show1]
     mock_metadata_provider.name = "tmdb"
-    tv_service.check_if_show_exists = MagicMock(return_value=True)
+    mock_tv_repository.get_existing_show_external_ids.return_value = {(123, "tmdb")}
     results = tv_service.get_popular_shows(metadata_provider=mock_metadata_provider)
     assert results == []
 
 
-def test_get_popular_shows_empty_from_provider(tv_service, mock_torrent_service):
+def test_get_popular_shows_empty_from_provider(
+    tv_service, mock_tv_repository, mock_torrent_service
+):
     mock_metadata_provider = MagicMock()
     mock_metadata_provider.search_show.return_value = []
-    tv_service.check_if_show_exists = MagicMock()
+    mock_tv_repository.get_existing_show_external_ids.return_value = set()
     results = tv_service.get_popular_shows(metadata_provider=mock_metadata_provider)
     assert results == []
+
+
+def test_get_popular_shows_some_added(
+    tv_service, mock_tv_repository, mock_torrent_service
+):
+    mock_metadata_provider = MagicMock()
+    popular_shows = [
+        MetaDataProviderSearchResult(
+            external_id=external_id,
+            name=f"Popular Show {external_id}",
+            year=2022,
+            overview="Overview",
+            metadata_provider="tmdb",
+            added=False,
+            poster_path=None,
+        )
+        for external_id in (123, 456, 789)
+    ]
+    mock_metadata_provider.search_show.return_value = popular_shows
+    mock_metadata_provider.name = "tmdb"
+    mock_tv_repository.get_existing_show_external_ids.return_value = {(456, "tmdb")}
+    results = tv_service.get_popular_shows(metadata_provider=mock_metadata_provider)
+    mock_tv_repository.get_existing_show_external_ids.assert_called_once_with(
+        external_ids=[(123, "tmdb"), (456, "tmdb"), (789, "tmdb")]
+    )
+    assert [result.external_id for result in results] == [123, 789]
@@ -117,6 +117,27 @@ export interface Show {
 	library: string;
 }
 
+export interface ShowSummary {
+	name: string;
+	overview: string;
+	year: number; // type: integer
+	external_id: number; // type: integer
+	metadata_provider: string;
+	id: string; // type: string, format: uuid
+	continuous_download: boolean;
+	ended: boolean;
+	library: string;
+	season_count: number; // type: integer
+	episode_count: number; // type: integer
+}
+
+export interface ShowSummaryPage {
+	items: ShowSummary[]; // items: { $ref: #/components/schemas/ShowSummary }, type: array
+	total: number; // type: integer
+	limit: number; // type: integer
+	offset: number; // type: integer
+}
+
 export interface PublicShow {
 	name: string;
 	overview: string;